@@ -0,0 +1,251 @@
+"""
+crawling/article_store.py - URL별 기사 본문 저장소
+
+같은 기사 본문을 세 경로가 따로 받았다: 크롤러의 1위 기사(Selenium), crawl_content
+(Chrome을 새로 띄움), 요약(news/agents/crew.py, 풀 없는 requests.get, 타임아웃 없음).
+스토리 묶기(news/stories.py)도 1위 기사 본문을 다시 받았다.
+이제 모두 ArticleStore.get(url)을 쓴다.
+
+- 수집: 공용 세션(crawling/page_fetcher.pooled_session)으로 한 번 받는다.
+  저장된 본문이 ARTICLE_STORE_REVALIDATE_SECONDS보다 오래됐으면 ETag/Last-Modified로
+  조건부 요청해 304면 본문을 다시 받지 않는다.
+  HTML에 본문 영역이 없으면 호출 측이 Selenium으로 받아 put()으로 넣는다.
+- 정리: #dic_area에서 script/style/iframe을 빼고 줄 단위로 공백을 정리한 텍스트와
+  대표 이미지(지연 로딩 data-src)를 한 번만 뽑아 저장한다.
+- 저장: ArticleBody에 zlib 압축 본문과 수집 메타데이터(검증자, 수집 방식, 크기, 시각).
+  DB이므로 분산 크롤링 워커와 웹 프로세스가 함께 쓴다.
+- 제거: 압축 크기 합계가 ARTICLE_STORE_MAX_BYTES를 넘으면 가장 오래 쓰지 않은 본문부터
+  90%까지 지운다 (last_accessed 기준 LRU). 합계는 저장할 때마다 누적해 두고
+  EVICT_RESYNC_SAVES번마다 DB 합계로 다시 맞춘다 (다른 프로세스의 저장 반영).
+- 키: 500자가 넘는 URL은 앞부분 + 전체 URL 해시로 줄여 저장/조회 모두 같은 키를 쓴다.
+"""
+
+import hashlib
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Sum
+from django.utils import timezone
+
+from news.instrumentation import stage
+
+from .page_fetcher import pooled_session
+
+logger = logging.getLogger('crawling')
+
+EVICT_TARGET_RATIO = 0.9    # 한도를 넘으면 이 비율까지 줄임 (매 저장마다 지우지 않도록)
+ACCESS_TOUCH_SECONDS = 60   # 마지막 사용 시각은 이 간격보다 자주 갱신하지 않음
+EVICT_RESYNC_SAVES = 100    # 누적 합계를 DB 합계로 다시 맞추는 저장 간격
+URL_MAX_LENGTH = 500        # ArticleBody.url 길이
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def storage_url(url):
+    """저장 키 - 긴 URL은 앞부분 + 전체 URL 해시 (저장과 조회가 같은 키를 쓰도록)"""
+    if len(url) <= URL_MAX_LENGTH:
+        return url
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{url[:URL_MAX_LENGTH - len(digest) - 1]}#{digest}"
+
+
+def clean_article(html):
+    """기사 HTML → (정리한 본문, 대표 이미지 URL) - 본문 영역이 없으면 None"""
+    from bs4 import BeautifulSoup  # 본문을 정리할 때만 로드
+
+    soup = BeautifulSoup(html, 'html.parser')
+    element = soup.select_one('#dic_area')
+    if element is None:
+        return None
+    image = soup.select_one('.end_photo_org img')
+    # 네이버 기사 이미지는 지연 로딩 (data-src에 원본)
+    image_url = (image.get('data-src') or image.get('src')) if image else None
+    if image_url and not image_url.startswith('http'):
+        image_url = None
+    for tag in element.select('script, style, iframe'):
+        tag.decompose()
+    return clean_text(element.get_text('\n')), image_url
+
+
+def clean_text(text):
+    """줄마다 앞뒤 공백을 지우고 빈 줄을 뺌"""
+    return '\n'.join(line.strip() for line in text.split('\n') if line.strip())
+
+
+@dataclass(slots=True)
+class StoredArticle:
+    url: str
+    text: str
+    image_url: Optional[str]
+    fetched_at: datetime
+    source: str = 'http'
+
+    def flat(self, limit=None):
+        """줄바꿈을 공백으로 바꾼 본문 (limit자까지)"""
+        text = ' '.join(self.text.split('\n'))
+        return text[:limit] if limit else text
+
+
+class ArticleStore:
+    """ArticleBody 테이블 위의 본문 저장소 (스레드 안전 - 세션/DB 연결만 공유)"""
+
+    def __init__(self, max_bytes=None, revalidate_seconds=None, timeout=None):
+        self.max_bytes = max_bytes or _setting('ARTICLE_STORE_MAX_BYTES', 64 * 1024 * 1024)
+        self.revalidate = timedelta(seconds=revalidate_seconds or _setting('ARTICLE_STORE_REVALIDATE_SECONDS', 3600))
+        self.timeout = timeout or _setting('CRAWL_FETCH_TIMEOUT', 5)
+        self.fetches = 0  # 네트워크 요청 수 (304 포함)
+        self._total = None  # 압축 크기 합계 (누적 추정치, None이면 DB에서 다시 계산)
+        self._saves = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load(record):
+        return StoredArticle(
+            record.url, zlib.decompress(bytes(record.body)).decode('utf-8'),
+            record.image_url or None, record.fetched_at, record.source,
+        )
+
+    def _touch(self, record, now, **fields):
+        from news.models import ArticleBody
+
+        if fields or now - record.last_accessed >= timedelta(seconds=ACCESS_TOUCH_SECONDS):
+            ArticleBody.objects.filter(pk=record.pk).update(last_accessed=now, **fields)
+
+    def get(self, url, fetch=True, revalidate=True) -> Optional[StoredArticle]:
+        """
+        저장된 본문 (없으면 받아서 저장). 본문 영역이 없거나 요청이 실패하면 None
+
+        revalidate면 오래된 본문을 조건부 요청으로 확인한다. fetch=False면 네트워크를 쓰지 않는다.
+        """
+        from news.models import ArticleBody
+
+        now = timezone.now()
+        record = ArticleBody.objects.filter(url=storage_url(url)).first()
+        if record is not None and (not fetch or not revalidate or now - record.fetched_at < self.revalidate):
+            self._touch(record, now)
+            return self._load(record) if record.status == ArticleBody.STATUS_OK else None
+        if not fetch:
+            return None
+        return self._fetch(url, record, now)
+
+    def _fetch(self, url, record, now):
+        from news.models import ArticleBody
+
+        headers = {}
+        if record is not None and record.etag:
+            headers['If-None-Match'] = record.etag
+        if record is not None and record.last_modified:
+            headers['If-Modified-Since'] = record.last_modified
+        try:
+            with stage('article_fetch', url=url, conditional=bool(headers)) as fetch_stage:
+                response = pooled_session().get(url, headers=headers, timeout=self.timeout)
+                fetch_stage.set(status=response.status_code, bytes=len(response.content))
+            self.fetches += 1
+        except Exception as e:
+            logger.warning(f"기사 본문 요청 실패 ({url}): {str(e)}")
+            return self._load(record) if record is not None and record.status == ArticleBody.STATUS_OK else None
+
+        if response.status_code == 304 and record is not None:
+            self._touch(record, now, fetched_at=now)
+            return self._load(record) if record.status == ArticleBody.STATUS_OK else None
+        if response.status_code != 200:
+            # 재시도 후에도 실패하면 이미 저장된 본문을 그대로 씀 (요청 예외와 같은 처리)
+            logger.warning(f"기사 본문 요청 실패 ({url}): HTTP {response.status_code}")
+            return self._load(record) if record is not None and record.status == ArticleBody.STATUS_OK else None
+
+        cleaned = clean_article(response.text)
+        if cleaned is None:
+            # 본문 영역이 없는 페이지도 기록해 두어 재검증 주기 안에서는 다시 받지 않음
+            self._save(url, '', None, 'http', response, ArticleBody.STATUS_MISSING)
+            return None
+        text, image_url = cleaned
+        return self._save(url, text, image_url, 'http', response)
+
+    def put(self, url, text, image_url=None, source='selenium'):
+        """다른 경로(Selenium)로 받은 본문 저장"""
+        return self._save(url, clean_text(text), image_url, source)
+
+    def _save(self, url, text, image_url, source, response=None, status=None):
+        from news.models import ArticleBody
+
+        now = timezone.now()
+        key = storage_url(url)
+        raw = text.encode('utf-8')
+        body = zlib.compress(raw, 6)
+        content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        defaults = {
+            'body': body,
+            'image_url': (image_url or '')[:500],
+            'status': status or ArticleBody.STATUS_OK,
+            'source': source,
+            'etag': (response.headers.get('ETag', '') if response is not None else '')[:200],
+            'last_modified': (response.headers.get('Last-Modified', '') if response is not None else '')[:100],
+            'size': len(body),
+            'raw_size': len(raw),
+            'content_hash': content_hash,
+            'fetched_at': now,
+            'last_accessed': now,
+        }
+        previous = ArticleBody.objects.filter(url=key).values_list('content_hash', 'size').first()
+        if previous is None or previous[0] != content_hash:
+            defaults['changed_at'] = now
+        ArticleBody.objects.update_or_create(url=key, defaults=defaults)
+        self._account(len(body) - (previous[1] if previous else 0))
+        return StoredArticle(url, text, image_url, now, source)
+
+    def _account(self, delta):
+        """저장한 크기만큼 누적 합계 갱신 - 한도를 넘었거나 다시 맞출 때만 DB 합계 계산"""
+        with self._lock:
+            self._saves += 1
+            if self._total is None or self._saves % EVICT_RESYNC_SAVES == 0:
+                self._total = None
+            else:
+                self._total += delta
+            over = self._total is None or self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    def total_bytes(self):
+        from news.models import ArticleBody
+
+        return ArticleBody.objects.aggregate(total=Sum('size'))['total'] or 0
+
+    def evict(self):
+        """압축 크기 합계가 한도를 넘으면 오래 쓰지 않은 본문부터 삭제, 삭제 수 반환"""
+        from news.models import ArticleBody
+
+        total = self.total_bytes()
+        self._total = total
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        stale = []
+        for pk, size in ArticleBody.objects.order_by('last_accessed').values_list('pk', 'size').iterator():
+            if total <= target:
+                break
+            stale.append(pk)
+            total -= size
+        ArticleBody.objects.filter(pk__in=stale).delete()
+        self._total = total
+        logger.info(f"기사 본문 저장소 정리: {len(stale)}건 삭제, {total} bytes")
+        return len(stale)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_article_store():
+    """프로세스 공용 본문 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+        return _store
@@ -7,37 +7,37 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime
 import time
 import logging
 from django.core.cache import cache
 from django.utils import timezone
+from django.conf import settings
 import platform
 import json
 from pathlib import Path
+from .snapshot_archive import get_archive
+from .records import NewsItem, CrawlResult
+from .page_fetcher import PageFetcher, ranking_digest
+from .article_store import clean_article, get_article_store
+from .press_registry import registry as press_registry
+from news.instrumentation import annotate, stage, timed
 
 logger = logging.getLogger('crawling')  # Django 설정의 'crawling' 로거 사용
 
 class NaverNewsCrawler:
     def __init__(self):
-        self.news_companies = {
-            '005': '국민일보',
-            '023': '조선일보',
-            '020': '동아일보',
-            '081': '서울신문',
-            '025': '중앙일보',
-            '028': '한겨레',
-            '032': '경향신문',
-            '021': '문화일보',
-            '022': '세계일보',
-            '469': '한국일보'
-        }
+        self.news_companies = press_registry.names  # 코드 → 이름 (crawling/press_registry.py)
         self.CACHE_TIMEOUT = 3600  # 1시간
         # 백업 파일 경로 설정
-        self.backup_dir = Path('cache_backup')
-        self.backup_file = self.backup_dir / 'news_cache_backup.json'
+        self.backup_dir = Path(getattr(settings, 'CACHE_BACKUP_DIR', 'cache_backup'))
+        self.backup_file = self.backup_dir / 'news_cache_backup.json'  # 이전 형식 (읽기 전용 폴백)
         self._ensure_backup_dir()
+        self.archive = get_archive(self.backup_dir)
+        self.fetcher = PageFetcher()  # 조건부 요청 + 내용 해시 (crawling/page_fetcher.py)
+        self.articles = get_article_store()  # URL별 기사 본문 (crawling/article_store.py)
+        self.unchanged_presses = set()  # 직전 기사를 그대로 쓴 언론사 코드
+        self._driver = None
         
     def _ensure_backup_dir(self):
         """백업 디렉토리 생성"""
@@ -47,14 +47,13 @@ class NaverNewsCrawler:
             logger.error(f"백업 디렉토리 생성 실패: {str(e)}")
 
     def backup_cache(self, data):
-        """캐시 데이터를 파일로 백업"""
+        """캐시 데이터를 스냅샷 아카이브에 추가 (크롤링 1회당 1레코드)"""
         try:
             # datetime 객체를 문자열로 변환
             serializable_data = self._prepare_for_json(data)
             
-            with open(self.backup_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, ensure_ascii=False)
-            logger.info("캐시 백업 완료")
+            if self.archive.append(serializable_data.get('crawled_time'), serializable_data):
+                logger.info("캐시 백업 완료")
         except Exception as e:
             logger.error(f"캐시 백업 실패: {str(e)}")
 
@@ -64,7 +63,9 @@ class NaverNewsCrawler:
             return {k: self._prepare_for_json(v) for k, v in data.items()}
         elif isinstance(data, (list, tuple, set)):
             return [self._prepare_for_json(item) for item in data]
-        elif isinstance(data, (pd.Timestamp, datetime)):
+        elif isinstance(data, NewsItem):
+            return self._prepare_for_json(data.to_dict())
+        elif isinstance(data, datetime):
             return data.isoformat()
         elif hasattr(data, 'tolist'):  # numpy array 처리
             return data.tolist()
@@ -72,18 +73,88 @@ class NaverNewsCrawler:
             return self._prepare_for_json(data.__dict__)
         return data
 
-    def restore_from_backup(self):
-        """백업 파일에서 데이터 복구"""
+    def restore_from_backup(self, crawled_time=None):
+        """
+        백업에서 데이터 복구
+
+        crawled_time을 주면 그 시점(또는 직전)의 스냅샷을, 없으면 최신 스냅샷을 반환한다.
+        아카이브가 비어 있으면 이전 형식의 JSON 백업 파일을 읽는다.
+        """
         try:
+            data = self.archive.at(crawled_time) if crawled_time else self.archive.latest()
+            if data:
+                logger.info("백업에서 데이터 복구 완료")
+                return data
             if self.backup_file.exists():
                 with open(self.backup_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    logger.info("백업에서 데이터 복구 완료")
+                    logger.info("이전 형식 백업에서 데이터 복구 완료")
                     return data
         except Exception as e:
             logger.error(f"백업 복구 실패: {str(e)}")
         return None
 
+    def _result_from_backup(self):
+        """백업 스냅샷을 CrawlResult로 변환 (없으면 빈 결과)"""
+        backup_data = self.restore_from_backup()
+        if backup_data:
+            return CrawlResult.from_dicts(
+                backup_data.get('news_items', []), backup_data.get('crawled_time'), 'backup'
+            )
+        return CrawlResult()
+
+    def _published_result(self):
+        """
+        분산 모드 - 코디네이터가 공개한 최신 스냅샷 (news/crawl_shards.py)
+
+        프로세스가 처음 보는 스냅샷만 source='crawl'로 돌려 뷰가 한 번만 후처리/백업한다.
+        """
+        from news.crawl_shards import latest_published
+
+        run = latest_published()
+        if run is None:
+            return self._result_from_backup()
+        cached_data = cache.get('news_data')
+        if cached_data and cached_data.get('crawled_time') == run.crawled_time:
+            return CrawlResult.from_dicts(cached_data.get('news_items', []), run.crawled_time, 'cache')
+
+        first_seen = cache.add(f'crawl_run_seen:{run.pk}', True, timeout=self.CACHE_TIMEOUT * 24)
+        result = CrawlResult.from_dicts(
+            run.items, run.crawled_time, 'crawl' if first_seen else 'cache', run.unchanged_presses
+        )
+        cache.set('news_data', {'news_items': result.items, 'crawled_time': run.crawled_time},
+                  timeout=self.CACHE_TIMEOUT)
+        return result
+
+    def _due_codes(self, previous_items):
+        """
+        이번에 크롤링할 언론사 코드 (news/crawl_schedule.py)
+
+        적응형 주기가 꺼져 있으면 전체, 켜져 있으면 주기가 돌아왔거나 직전 기사가 없는 언론사
+        (실패 후 재시도를 기다리는 언론사 제외).
+        """
+        from news import crawl_schedule
+
+        codes = list(self.news_companies)
+        if not crawl_schedule.enabled():
+            return codes
+        present = {item['company_code'] for item in previous_items}
+        return crawl_schedule.due_codes(codes, missing=[code for code in codes if code not in present])
+
+    def _record_schedule(self, code, news_items):
+        """크롤링 결과로 다음 크롤링 시각 기록 (기사가 없으면 실패로 보고 재시도 간격을 늘림)"""
+        from news import crawl_schedule
+
+        if not crawl_schedule.enabled():
+            return
+        try:
+            if news_items:
+                crawl_schedule.record_crawl(code, self.news_companies[code], news_items)
+            else:
+                crawl_schedule.record_failure(code, self.news_companies[code])
+        except Exception as e:
+            logger.error(f"크롤링 주기 기록 실패 ({code}): {str(e)}")
+
     def setup_driver(self):
         chrome_options = Options()
         chrome_options.add_argument('--headless=new')
@@ -120,28 +191,122 @@ class NaverNewsCrawler:
             logger.error(f"Chrome Driver 초기화 실패: {e}")
             raise
             
-    def crawl_news_ranking(self, company_code, driver):
+    def _get_driver(self):
+        """Selenium 드라이버 (조건부 요청으로 충분하면 만들지 않음)"""
+        if self._driver is None:
+            self._driver = self.setup_driver()
+        return self._driver
+
+    def close_driver(self):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.error(f"드라이버 종료 실패: {str(e)}")
+            self._driver = None
+
+    def _unchanged(self, company_code, previous):
+        """바뀌지 않은 랭킹 - 직전 기사를 그대로 쓰고 unchanged_presses에 기록"""
+        self.unchanged_presses.add(company_code)
+        logger.info(f"랭킹 변경 없음: {self.news_companies[company_code]}")
+        return [NewsItem.from_dict(item) for item in previous]
+
+    def _fetch_ranking_list(self, url, page, driver):
+        """
+        랭킹 목록 요소와 그 목록을 담은 requests 응답 → (ranking_list, page 또는 None)
+
+        requests로 받은 HTML에 없으면 Selenium으로 받고 page는 None
+        (스크립트 껍데기 페이지의 검증자를 저장하지 않도록).
+        """
+        if page.ok:
+            ranking_list = BeautifulSoup(page.html, 'html.parser').select_one('.press_ranking_list')
+            if ranking_list:
+                return ranking_list, page
+        driver = driver or self._get_driver()
+        driver.get(url)
+        time.sleep(3)
+
+        wait = WebDriverWait(driver, 10)
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.press_ranking_list')))
+        return BeautifulSoup(driver.page_source, 'html.parser').select_one('.press_ranking_list'), None
+
+    def _crawl_lead(self, url, driver):
+        """
+        1위 기사 본문 요약(250자)과 고화질 이미지 → (summary, image_url 또는 None)
+
+        본문은 기사 본문 저장소(crawling/article_store.py)에서 가져온다. 저장소에 없거나
+        오래됐으면 조건부 요청으로 받고, HTML에 본문이 없을 때만 Selenium으로 받아 저장한다.
+        """
+        article = self.articles.get(url)
+        if article is None:
+            article = self._crawl_lead_selenium(url, driver)
+            if article is None:
+                return '', None
+        content = article.text
+        # 250자로 제한하고 ... 추가
+        summary = content[:250].strip()
+        if len(content) > 250:
+            summary += '...'
+        return summary, article.image_url
+
+    def _crawl_lead_selenium(self, url, driver=None):
+        """Selenium으로 본문과 이미지를 받아 본문 저장소에 저장 (실패하면 None)"""
+        driver = driver or self._get_driver()
+        driver.get(url)
+        time.sleep(2)
+        image_url = None
+        try:
+            # 본문 이미지 찾기 (기존 코드 유지)
+            try:
+                main_img = driver.find_element(By.CSS_SELECTOR, '.end_photo_org img')
+                if main_img:
+                    image_url = main_img.get_attribute('src') or None
+            except:
+                pass
+
+            content_elem = driver.find_element(By.ID, 'dic_area')
+            content = content_elem.text.strip() if content_elem else ''
+        except Exception as e:
+            logger.error(f"본문 크롤링 실패: {str(e)}")
+            return None
+        return self.articles.put(url, content, image_url)
+
+    def crawl_news_ranking(self, company_code, driver=None, previous=None):
+        """
+        언론사 랭킹 1~10위 수집
+
+        previous(직전 크롤링의 이 언론사 기사)가 있으면 조건부 요청(ETag/Last-Modified)과
+        랭킹 목록 해시(crawling/page_fetcher.py)로 바뀌지 않은 랭킹을 알아내 파싱과
+        1위 기사 본문 크롤링 없이 previous를 돌려주고 self.unchanged_presses에 코드를 넣는다.
+        비교는 previous에 함께 저장된 해시(page_digest) 기준이라 다른 프로세스가 먼저
+        공용 PageFingerprint를 갱신했어도 이 프로세스의 직전 기사와 비교한다.
+        driver가 없으면 Selenium이 필요할 때 만든다.
+        """
         try:
             logger.info(f"크롤링 시작: {self.news_companies[company_code]}")
-            started_at = datetime.now()
-            
+
             url = f"https://media.naver.com/press/{company_code}/ranking"
-            driver.get(url)
-            time.sleep(3)
-            
-            wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.press_ranking_list')))
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            previous_digest = previous[0].get('page_digest') if previous else None
+            with stage('ranking_fetch', press_code=company_code) as fetch_stage:
+                page = self.fetcher.fetch(url, expected_digest=previous_digest)
+                fetch_stage.set(status=page.status)
+                if page.not_modified and previous:
+                    return self._unchanged(company_code, previous)
+
+                ranking_list, source_page = self._fetch_ranking_list(url, page, driver)
+                if not ranking_list:
+                    logger.error("랭킹 리스트를 찾을 수 없습니다.")
+                    return None
+                digest = ranking_digest(ranking_list)
+                self.fetcher.record(url, digest, source_page)
+                changed = digest != previous_digest
+                fetch_stage.set(changed=changed)
+            if not changed and previous:
+                return self._unchanged(company_code, previous)
+
             news_items = []
-            
-            ranking_list = soup.select_one('.press_ranking_list')
-            if not ranking_list:
-                logger.error("랭킹 리스트를 찾을 수 없습니다.")
-                return None
-            
             articles = ranking_list.select('li')[:10]
-            
+
             for idx, article in enumerate(articles, 1):
                 try:
                     # 기존 이미지 처리 유지
@@ -162,49 +327,23 @@ class NaverNewsCrawler:
                         if not url.startswith('http'):
                             url = f"https://n.news.naver.com{url}"
                         
-                        # 1위 기사만 본문 크롤링
+                        # 1위 기사만 본문 크롤링 (랭킹 목록은 이미 파싱했으므로 랭킹 페이지로 돌아가지 않음)
                         summary = ''
                         if idx == 1:
-                            driver.get(url)
-                            time.sleep(2)
-                            
-                            try:
-                                # 본문 이미지 찾기 (기존 코드 유지)
-                                try:
-                                    main_img = driver.find_element(By.CSS_SELECTOR, '.end_photo_org img')
-                                    if main_img:
-                                        high_quality_url = main_img.get_attribute('src')
-                                        if high_quality_url:
-                                            image_url = high_quality_url
-                                except:
-                                    pass
-                                
-                                # 본문 크롤링 및 길이 제한
-                                content_elem = driver.find_element(By.ID, 'dic_area')
-                                if content_elem:
-                                    content = content_elem.text.strip()
-                                    # 250자로 제한하고 ... 추가
-                                    summary = content[:250].strip()
-                                    if len(content) > 250:
-                                        summary += '...'
-                                
-                            except Exception as e:
-                                logger.error(f"본문 크롤링 실패: {str(e)}")
-                            
-                            # 랭킹 페이지로 돌아가기
-                            driver.get(f"https://media.naver.com/press/{company_code}/ranking")
-                            time.sleep(2)
+                            summary, lead_image = self._crawl_lead(url, driver)
+                            image_url = lead_image or image_url
                         
-                        news_items.append({
-                            'company_code': company_code,
-                            'company_name': self.news_companies[company_code],
-                            'title': title,
-                            'url': url,
-                            'rank': idx,
-                            'image_url': image_url,
-                            'summary': summary,
-                            'crawled_at': datetime.now()
-                        })
+                        news_items.append(NewsItem(
+                            company_code=company_code,
+                            company_name=self.news_companies[company_code],
+                            title=title,
+                            url=url,
+                            rank=idx,
+                            image_url=image_url,
+                            summary=summary,
+                            crawled_at=datetime.now(),
+                            page_digest=digest
+                        ))
                         
                 except Exception as e:
                     logger.error(f"기사 파싱 중 오류 발생: {str(e)}")
@@ -217,9 +356,15 @@ class NaverNewsCrawler:
             logger.error(f"크롤링 중 오류 발생: {str(e)}")
             return None
             
+    @timed('crawl')
     def crawl_all_companies(self):
-        driver = None
+        from news import crawl_schedule
+
         try:
+            if getattr(settings, 'CRAWL_SHARDING', False):
+                # 분산 모드에서는 웹 프로세스가 직접 크롤링하지 않음 (crawl_worker/crawl_coordinator)
+                return self._published_result()
+
             # 캐시 확인 및 유효성 검사 수정
             cached_data = cache.get('news_data')
             if cached_data:
@@ -228,68 +373,99 @@ class NaverNewsCrawler:
                     # timezone-aware 비교를 위해 변환
                     if isinstance(last_crawled, str):
                         last_crawled = timezone.datetime.fromisoformat(last_crawled)
-                    time_diff = (timezone.now() - last_crawled).total_seconds()
+                    # 뷰가 변경 없음으로 확인한 스냅샷은 확인 시각 기준
+                    time_diff = (timezone.now() - (cached_data.get('checked_time') or last_crawled)).total_seconds()
                     
                     # 캐시가 만료되었으면 None 처리
                     if time_diff >= self.CACHE_TIMEOUT:
                         cache.delete('news_data')
                         cached_data = None
-                    else:
+                    # 적응형 주기: 주기가 돌아온 언론사가 없으면 캐시 사용
+                    elif not (crawl_schedule.enabled() and self._due_codes(cached_data.get('news_items', []))):
                         logger.info("캐시된 데이터 사용")
-                        return pd.DataFrame(cached_data.get('news_items', []))
+                        return CrawlResult.from_dicts(cached_data.get('news_items', []), last_crawled, 'cache')
 
             # 크롤링 락 확인
             if cache.get('crawling_in_progress'):
                 logger.info("다른 크롤링이 진행 중")
                 if cached_data:
                     logger.info("이전 캐시 데이터 사용")
-                    return pd.DataFrame(cached_data.get('news_items', []))
+                    return CrawlResult.from_dicts(
+                        cached_data.get('news_items', []), cached_data.get('crawled_time'), 'cache'
+                    )
                 # 캐시가 없는 경우 백업에서 복구 시도
-                backup_data = self.restore_from_backup()
-                if backup_data:
-                    logger.info("백업 데이터 사용")
-                    return pd.DataFrame(backup_data.get('news_items', []))
-                return pd.DataFrame([])
+                logger.info("백업 데이터 사용 시도")
+                return self._result_from_backup()
 
             # 크롤링 락 설정 (타임아웃 시간 조정)
             cache.set('crawling_in_progress', True, timeout=600)  # 10분으로 연장
 
             try:
-                # 현재 캐시 백업
-                if cached_data:
-                    self.backup_cache(cached_data)
+                # 현재 캐시는 생성 시점에 이미 아카이브되어 있으므로 다시 백업하지 않음
 
-                # 새로운 크롤링 시작
-                logger.info("새로운 크롤링 시작")
+                # 새로운 크롤링 시작 - 적응형 주기면 주기가 돌아온 언론사만 (나머지는 직전 기사 유지)
+                # 뷰가 만료된 캐시를 news_data_temp로 옮겨 두므로 직전 기사로 함께 사용
+                previous_data = cached_data or cache.get('news_data_temp') or {}
+                previous_items = previous_data.get('news_items', [])
+                previous_by_code = {}
+                for item in previous_items:
+                    previous_by_code.setdefault(item['company_code'], []).append(item)
+                codes = self._due_codes(previous_items)
+                logger.info(f"새로운 크롤링 시작: 언론사 {len(codes)}/{len(self.news_companies)}곳")
+                self.unchanged_presses = set()
                 all_news = []
-                driver = self.setup_driver()
-                for code in self.news_companies.keys():
+                failed = set()
+                for code in codes:
+                    news_items = None
                     try:
-                        news_items = self.crawl_news_ranking(code, driver)
+                        with stage('press_fetch', press_code=code, press_name=self.news_companies[code]) as press_stage:
+                            news_items = self.crawl_news_ranking(code, previous=previous_by_code.get(code))
+                            press_stage.set(articles=len(news_items or []), unchanged=code in self.unchanged_presses)
                         if news_items:
                             all_news.extend(news_items)
-                        time.sleep(2)
+                        if code not in self.unchanged_presses:
+                            time.sleep(2)
                     except Exception as e:
                         logger.error(f"신문사 크롤링 실패 ({code}): {str(e)}")
-                        continue
+                    if not news_items:
+                        failed.add(code)
+                    # 실패해도 다음 크롤링 시각을 미뤄 매 요청마다 다시 크롤링하지 않도록 기록
+                    self._record_schedule(code, news_items)
 
+                annotate(articles=len(all_news), presses=len(codes), unchanged=len(self.unchanged_presses),
+                         source='crawl' if all_news else ('cache' if previous_items else 'backup'))
+                # 이번에 크롤링하지 않았거나 실패한 언론사도 직전 기사를 그대로 쓰므로 변경 없음
+                unchanged = [
+                    code for code in self.news_companies
+                    if code in self.unchanged_presses
+                    or ((code not in codes or code in failed) and code in previous_by_code)
+                ]
+                if previous_items and not all_news:
+                    # 주기가 돌아온 언론사가 모두 실패 - 직전 기사와 시각을 그대로 씀 (백업으로 되돌리지 않음)
+                    logger.info("크롤링한 언론사가 모두 실패 - 직전 기사 유지")
+                    return CrawlResult.from_dicts(
+                        crawl_schedule.carry_over(previous_items, [], list(self.news_companies)),
+                        previous_data.get('crawled_time'), 'cache', unchanged,
+                    )
+                if all_news and previous_items:
+                    all_news = [
+                        NewsItem.from_dict(item)
+                        for item in crawl_schedule.carry_over(previous_items, all_news, list(self.news_companies))
+                    ]
                 if all_news:
+                    crawled_time = timezone.now()
                     new_cache_data = {
                         'news_items': all_news,
-                        'crawled_time': timezone.now()
+                        'crawled_time': crawled_time
                     }
                     # 새 데이터 캐시에 저장 전 기존 캐시 삭제
                     cache.delete('news_data')
                     cache.set('news_data', new_cache_data, timeout=self.CACHE_TIMEOUT)
-                    # 새 데이터 백업
-                    self.backup_cache(new_cache_data)
-                    return pd.DataFrame(all_news)
+                    # 백업은 컨텍스트까지 구성한 뒤 호출 측(views)에서 1회 기록
+                    return CrawlResult(all_news, crawled_time, 'crawl', unchanged)
 
                 # 크롤링 실패 시 백업 데이터 사용
-                backup_data = self.restore_from_backup()
-                if backup_data:
-                    return pd.DataFrame(backup_data.get('news_items', []))
-                return pd.DataFrame([])
+                return self._result_from_backup()
 
             finally:
                 # 크롤링 락 해제
@@ -298,16 +474,21 @@ class NaverNewsCrawler:
         except Exception as e:
             logger.error(f"크롤링 중 오류 발생: {str(e)}")
             # 에러 발생 시 백업 데이터 사용
-            backup_data = self.restore_from_backup()
-            if backup_data:
-                return pd.DataFrame(backup_data.get('news_items', []))
-            return pd.DataFrame([])
+            return self._result_from_backup()
 
         finally:
-            if driver:
-                driver.quit()
+            self.close_driver()
     
     def crawl_content(self, url):
+        """
+        기사 본문 (줄바꿈 대신 공백)
+
+        기사 본문 저장소에 있으면 그대로 쓰고, 없을 때만 Chrome을 띄워 받는다.
+        """
+        article = self.articles.get(url)
+        if article is not None:
+            return article.flat()
+
         driver = None
         try:
             driver = self.setup_driver()
@@ -318,20 +499,11 @@ class NaverNewsCrawler:
             wait = WebDriverWait(driver, 10)
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '#dic_area')))
             
-            # HTML 파싱
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
             # 기사 본문 찾기 (네이버 뉴스 본문 영역의 ID: dic_area)
-            content_element = soup.select_one('#dic_area')
-            if content_element:
-                # 불필요한 요소 제거
-                for tag in content_element.select('script, style, iframe'):
-                    tag.decompose()
-                    
-                # 본문 텍스트 추출 및 정제
-                content = content_element.get_text(strip=True)
-                content = ' '.join(line.strip() for line in content.split('\n') if line.strip())
-                return content
+            cleaned = clean_article(driver.page_source)
+            if cleaned:
+                content, image_url = cleaned
+                return self.articles.put(url, content, image_url).flat()
                 
             return "기사 내용을 찾을 수 없습니다."
             
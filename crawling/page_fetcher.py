@@ -0,0 +1,178 @@
+"""
+crawling/page_fetcher.py - 조건부 요청과 내용 해시로 바뀌지 않은 페이지 알아내기
+
+크롤링마다 언론사 랭킹 페이지와 1위 기사를 Selenium으로 새로 받아 다시 파싱했다.
+PageFetcher는 URL마다 ETag/Last-Modified와 관심 영역(랭킹 목록)의 내용 해시를
+PageFingerprint에 저장해 두고,
+
+1. 직전 결과가 있으면 If-None-Match/If-Modified-Since로 요청해 304면 파싱 없이 끝내고
+2. 200이어도 관심 영역 해시가 같으면 바뀌지 않은 것으로 본다.
+
+비교 기준은 호출 측이 가진 직전 스냅샷의 해시(NewsItem.page_digest)다. PageFingerprint의
+검증자는 저장된 해시가 그 해시와 같을 때만 보낸다 - 다른 프로세스가 이미 새 내용을
+기록했다면 304가 '직전 스냅샷과 같음'을 뜻하지 않기 때문이다.
+
+페이지 전체 해시는 광고/조회수 등으로 매번 달라지므로 쓰지 않는다. 저장소가 DB이므로
+분산 크롤링 워커(news/crawl_shards.py)끼리도 검증자를 공유한다.
+requests로 받은 HTML에 관심 영역이 없으면(스크립트로 그리는 페이지 등) 호출 측이
+Selenium으로 대체한다.
+
+HTTP 요청은 프로세스 공용 세션(pooled_session, 연결 풀 + 일시 오류 재시도)을 쓴다.
+기사 본문은 기사 본문 저장소(crawling/article_store.py)가 같은 세션으로 받아 보관한다.
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger('crawling')
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def pooled_session():
+    """프로세스 공용 requests 세션 (호스트별 연결 재사용, 502/503/504와 연결 오류는 2회 재시도)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests  # 실제로 요청할 때만 로드
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            pool_size = getattr(settings, 'CRAWL_HTTP_POOL_SIZE', 16)
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                                  allowed_methods=('GET',)),
+            )
+            session = requests.Session()
+            session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'ko-KR,ko;q=0.9'})
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def content_digest(*parts):
+    """관심 영역에서 뽑은 문자열들 → 해시 (순서 포함)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def ranking_digest(ranking_list):
+    """
+    .press_ranking_list 해시 - 순위별 링크·제목·이미지만 사용
+
+    '3시간 전', 조회수처럼 내용과 상관없이 바뀌는 표시는 해시에서 뺀다.
+    """
+    parts = []
+    for article in ranking_list.select('li')[:10]:
+        link = article.select_one('a._es_pc_link, a.list_img')
+        title = article.select_one('strong.list_title, strong.list_text')
+        image = article.select_one('div.list_img img')
+        parts += [
+            link.get('href', '') if link else '',
+            title.get_text(strip=True) if title else '',
+            image.get('src', '') if image else '',
+        ]
+    return content_digest(*parts)
+
+
+@dataclass(slots=True)
+class FetchedPage:
+    url: str
+    status: int = 0          # 0이면 요청 실패
+    html: str = ''
+    etag: str = ''
+    last_modified: str = ''
+
+    @property
+    def not_modified(self):
+        return self.status == 304
+
+    @property
+    def ok(self):
+        return self.status == 200 and bool(self.html)
+
+
+class PageFetcher:
+    """공용 세션 + PageFingerprint 저장소"""
+
+    def __init__(self, timeout=None, session=None):
+        self.timeout = timeout or getattr(settings, 'CRAWL_FETCH_TIMEOUT', 5)
+        self.enabled = getattr(settings, 'CRAWL_CONDITIONAL_FETCH', True)
+        self._session = session
+
+    def _get_session(self):
+        return self._session or pooled_session()
+
+    def fetch(self, url, expected_digest=None):
+        """
+        URL 요청 - 저장된 해시가 expected_digest(직전 스냅샷의 해시)와 같으면 저장된 검증자로
+        조건부 요청 (304면 html 없음)
+
+        비활성화(CRAWL_CONDITIONAL_FETCH=False)되었거나 실패하면 status 0.
+        """
+        if not self.enabled:
+            return FetchedPage(url)
+        from news.models import PageFingerprint
+
+        headers = {}
+        if expected_digest:
+            fingerprint = (
+                PageFingerprint.objects.filter(url=url, content_hash=expected_digest)
+                .only('etag', 'last_modified').first()
+            )
+            if fingerprint and fingerprint.etag:
+                headers['If-None-Match'] = fingerprint.etag
+            if fingerprint and fingerprint.last_modified:
+                headers['If-Modified-Since'] = fingerprint.last_modified
+        try:
+            response = self._get_session().get(url, headers=headers, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"페이지 요청 실패 ({url}): {str(e)}")
+            return FetchedPage(url)
+        if response.status_code == 304:
+            return FetchedPage(url, 304)
+        if response.status_code != 200:
+            return FetchedPage(url, response.status_code)
+        return FetchedPage(
+            url, 200, response.text,
+            response.headers.get('ETag', ''), response.headers.get('Last-Modified', ''),
+        )
+
+    def record(self, url, digest, page=None):
+        """
+        관심 영역 해시와 검증자 저장 - 직전 해시와 다르면(처음 보는 URL 포함) True
+
+        Selenium으로 받은 페이지는 page 없이 해시만 기록한다 (검증자는 비움).
+        """
+        if not self.enabled:
+            return True
+        from news.models import PageFingerprint
+
+        now = timezone.now()
+        fingerprint, created = PageFingerprint.objects.get_or_create(url=url[:500])
+        changed = created or fingerprint.content_hash != digest
+        fingerprint.etag = (page.etag if page and page.ok else '')[:200]
+        fingerprint.last_modified = (page.last_modified if page and page.ok else '')[:100]
+        fingerprint.content_hash = digest
+        fingerprint.checked_at = now
+        if changed:
+            fingerprint.changed_at = now
+        fingerprint.save()
+        return changed
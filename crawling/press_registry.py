@@ -0,0 +1,174 @@
+"""
+crawling/press_registry.py - 언론사 코드·이름·별칭 레지스트리
+
+크롤러(코드 → 이름), news/utils.py(제목에서 언론사 찾기), 뷰(선택 언론사 정규화)가
+같은 목록을 쓴다. 별칭은 레지스트리를 만들 때 한 번만 계산하고, 모든 별칭을
+접두사 트리 형태의 정규식 하나로 컴파일해 두므로 제목당 한 번의 search로 찾는다.
+언론사를 늘려도 제목마다 이름 목록을 순회하지 않는다.
+
+언론사 추가는 PRESSES에 Press(code, name, aliases)를 넣으면 된다.
+'신문'/'일보'를 뗀 축약형(경향신문 → 경향)은 자동으로 별칭에 들어간다.
+
+기본 크롤링 대상은 PRESSES(10곳)이다. settings.NEWS_PRESS_CODES에 코드 목록을 주면
+PRESSES + EXTRA_PRESSES 중 그 언론사만 크롤링/매칭한다 (분산 크롤링용, news/crawl_shards.py).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+_BRACKET = re.compile(r'\[(.*?)\]')
+_SHORT_SUFFIXES = ('신문', '일보')
+
+
+@dataclass(frozen=True, slots=True)
+class Press:
+    code: str                      # 네이버 언론사 코드 (media.naver.com/press/<code>)
+    name: str                      # 정규화된 표시 이름
+    aliases: Tuple[str, ...] = ()  # 제목/선택값에서 같은 언론사로 볼 다른 표기
+    short: bool = True             # 축약형을 별칭으로 쓸지 (지역명과 겹치는 지역 신문은 False)
+
+    def short_name(self):
+        """'신문'/'일보'를 뗀 축약형 (예: 경향신문 → 경향)"""
+        if not self.short:
+            return ''
+        short = self.name
+        for suffix in _SHORT_SUFFIXES:
+            short = short.replace(suffix, '')
+        return short
+
+
+PRESSES = (
+    Press('005', '국민일보'),
+    Press('023', '조선일보'),
+    Press('020', '동아일보'),
+    Press('081', '서울신문'),
+    Press('025', '중앙일보'),
+    Press('028', '한겨레'),
+    Press('032', '경향신문'),
+    Press('021', '문화일보'),
+    Press('022', '세계일보'),
+    Press('469', '한국일보'),
+)
+
+# NEWS_PRESS_CODES로 추가할 수 있는 언론사 (축약형 별칭 없음 - 일반 단어와 겹치지 않도록)
+EXTRA_PRESSES = tuple(Press(code, name, aliases, short=False) for code, name, aliases in (
+    ('001', '연합뉴스', ()), ('003', '뉴시스', ()), ('421', '뉴스1', ()),
+    ('008', '머니투데이', ()), ('009', '매일경제', ('매경',)), ('011', '서울경제', ()),
+    ('014', '파이낸셜뉴스', ()), ('015', '한국경제', ('한경',)), ('016', '헤럴드경제', ()),
+    ('018', '이데일리', ()), ('277', '아시아경제', ()), ('366', '조선비즈', ()),
+    ('002', '프레시안', ()), ('006', '미디어오늘', ()), ('047', '오마이뉴스', ()),
+    ('079', '노컷뉴스', ()), ('119', '데일리안', ()), ('052', 'YTN', ()),
+    ('055', 'SBS', ()), ('056', 'KBS', ()), ('057', 'MBN', ()), ('214', 'MBC', ()),
+    ('422', '연합뉴스TV', ()), ('437', 'JTBC', ()), ('448', 'TV조선', ()), ('449', '채널A', ()),
+    ('030', '전자신문', ()), ('031', '아이뉴스24', ()), ('092', '지디넷코리아', ()),
+    ('293', '블로터', ()), ('044', '코리아헤럴드', ()), ('640', '코리아중앙데일리', ()),
+    ('082', '부산일보', ()), ('087', '강원일보', ()), ('088', '매일신문', ()),
+    ('658', '국제신문', ()), ('656', '대전일보', ()), ('666', '경기일보', ()),
+))
+
+
+def _trie_pattern(words):
+    """
+    단어 목록 → 공통 접두사를 묶은 정규식 (예: 한겨레|한국일보 → 한(?:겨레|국(?:일보)?))
+
+    같은 위치에서는 더 긴 단어가 먼저 일치하도록 종료 지점을 선택적 그룹으로 만든다.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # 단어 끝 표시
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+
+class PressRegistry:
+    """언론사 목록과 미리 계산한 별칭 매처"""
+
+    def __init__(self, presses):
+        self.presses = tuple(presses)
+        self.by_code = {press.code: press for press in self.presses}
+        # 크롤러/템플릿이 쓰는 코드 → 이름 (등록 순서 유지)
+        self.names = {press.code: press.name for press in self.presses}
+
+        # 별칭 → Press (이름이 같은 별칭은 먼저 등록된 언론사 우선)
+        self._by_alias = {}
+        for press in self.presses:
+            for alias in (press.name, *press.aliases, press.short_name()):
+                if alias:
+                    self._by_alias.setdefault(alias, press)
+        self._matcher = re.compile(_trie_pattern(self._by_alias)) if self._by_alias else None
+
+    def __iter__(self):
+        return iter(self.presses)
+
+    def __len__(self):
+        return len(self.presses)
+
+    def codes(self):
+        return list(self.by_code)
+
+    def name(self, code, default=None):
+        press = self.by_code.get(code)
+        return press.name if press else default
+
+    def search(self, text) -> Optional[Press]:
+        """text 안에서 가장 앞에 나오는 별칭의 언론사 (같은 위치면 긴 별칭 우선)"""
+        if not text or self._matcher is None:
+            return None
+        match = self._matcher.search(text)
+        return self._by_alias[match.group()] if match else None
+
+    def canonical(self, name) -> Optional[str]:
+        """별칭/축약형/코드 → 정규화된 이름 (모르는 이름이면 None)"""
+        if not name:
+            return None
+        press = self._by_alias.get(name) or self.by_code.get(name) or self.search(name)
+        return press.name if press else None
+
+    def match_title(self, title, company_code=None) -> Optional[str]:
+        """
+        기사 제목(과 코드)에서 언론사 이름 추출
+
+        1. 코드가 등록된 언론사면 그 이름
+        2. [언론사] 형식 괄호 안의 별칭
+        3. 제목 본문에서 가장 앞에 나오는 별칭
+        """
+        if company_code and company_code in self.by_code:
+            return self.by_code[company_code].name
+        if not title:
+            return None
+        bracket = _BRACKET.search(title)
+        press = (self.search(bracket.group(1)) if bracket else None) or self.search(title)
+        return press.name if press else None
+
+
+def selected_presses(codes=None):
+    """codes 순서대로 PRESSES + EXTRA_PRESSES에서 고름 (None이면 기본 PRESSES)"""
+    if not codes:
+        return PRESSES
+    known = {press.code: press for press in PRESSES + EXTRA_PRESSES}
+    unknown = [code for code in codes if code not in known]
+    if unknown:
+        raise ValueError(f"등록되지 않은 언론사 코드: {', '.join(unknown)}")
+    return tuple(known[code] for code in dict.fromkeys(codes))
+
+
+def _configured_codes():
+    try:
+        from django.conf import settings
+        return getattr(settings, 'NEWS_PRESS_CODES', None)
+    except Exception:  # Django 설정 없이 모듈만 쓰는 경우 (크롤러 단독 실행)
+        return None
+
+
+registry = PressRegistry(selected_presses(_configured_codes()))
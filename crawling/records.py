@@ -0,0 +1,95 @@
+"""
+crawling/records.py - 크롤링 결과 레코드
+
+크롤러 → 뷰 경로에서 DataFrame 대신 사용하는 가벼운 타입.
+NewsItem은 __slots__ 데이터클래스로 dict보다 작고, 기존 코드의
+item['title'], item.get('rank') 같은 접근 방식을 그대로 지원한다.
+DataFrame이 필요한 분석 코드만 CrawlResult.to_dataframe()을 명시적으로 호출한다.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class NewsItem:
+    company_code: str
+    company_name: str
+    title: str
+    url: str
+    rank: int
+    image_url: Optional[str] = None
+    summary: str = ''
+    crawled_at: Optional[datetime] = None
+    cluster_id: Optional[int] = None  # 유사 제목 클러스터 (news.dedupe)
+    story_id: Optional[int] = None    # 같은 사건 스토리 (news.stories)
+    thumbnail: Optional[str] = None   # 썸네일 원본 해시 (news.thumbnails)
+    page_digest: Optional[str] = None  # 수집한 랭킹 목록 해시 (crawling.page_fetcher)
+
+    # dict 호환 접근 - 템플릿/뷰의 기존 item['key'] 코드 유지
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            return default
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FIELD_NAMES}
+
+    @classmethod
+    def from_dict(cls, data):
+        """백업/캐시의 dict를 NewsItem으로 변환 (모르는 키는 무시)"""
+        if isinstance(data, cls):
+            return data
+        return cls(**{name: data[name] for name in FIELD_NAMES if name in data})
+
+
+FIELD_NAMES = tuple(f.name for f in fields(NewsItem))
+
+
+@dataclass(slots=True)
+class CrawlResult:
+    """
+    crawl_all_companies() 반환값
+
+    source: 'crawl'(새 크롤링), 'cache'(유효한 캐시), 'backup'(백업 복구), 'empty'
+    unchanged_presses: 새 크롤링에서 직전 스냅샷 기사를 그대로 쓴 언론사 코드
+        (랭킹이 바뀌지 않았거나 적응형 주기상 크롤링하지 않음)
+    """
+    items: List[NewsItem] = field(default_factory=list)
+    crawled_time: Optional[datetime] = None
+    source: str = 'empty'
+    unchanged_presses: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @classmethod
+    def from_dicts(cls, items, crawled_time=None, source='empty', unchanged_presses=()):
+        if isinstance(crawled_time, str):
+            crawled_time = datetime.fromisoformat(crawled_time.replace('Z', '+00:00'))
+        return cls([NewsItem.from_dict(item) for item in items], crawled_time, source, list(unchanged_presses))
+
+    @property
+    def all_unchanged(self):
+        """새 크롤링이지만 모든 언론사가 직전 스냅샷과 같음 (후처리를 건너뛸 수 있음)"""
+        codes = {item.company_code for item in self.items}
+        return bool(codes) and codes <= set(self.unchanged_presses)
+
+    def to_dicts(self):
+        return [item.to_dict() for item in self.items]
+
+    def to_dataframe(self):
+        """분석용 DataFrame 변환 (pandas는 이 시점에만 import)"""
+        import pandas as pd
+        return pd.DataFrame(self.to_dicts())
@@ -0,0 +1,231 @@
+"""
+crawling/snapshot_archive.py - 크롤링 스냅샷 아카이브
+
+크롤링 1회당 레코드 1개를 추가만 하는(append-only) 파일에 압축 저장한다.
+
+파일 구성:
+- snapshots.dat: [길이(4B)][CRC32(4B)][zlib(orjson)] 레코드의 연속
+- snapshots.idx: "크롤링시각(epoch)\\t오프셋\\t길이\\n" 줄 목록
+
+레코드는 데이터 파일에 먼저 기록·fsync 한 뒤 인덱스에 한 줄을 덧붙인다(fsync).
+인덱스에 없는 꼬리 바이트(중단된 기록)와 줄바꿈으로 끝나지 않는 인덱스 줄은 읽지 않으므로
+레코드 단위로 원자적이다. 인덱스는 늘어난 부분만 이어 읽고, 최신 스냅샷은 메모리에 보관한다.
+
+보관: 최근 SNAPSHOT_ARCHIVE_KEEP개만 남긴다. 매번 지우지 않고 보관 수를 COMPACT_SLACK
+비율만큼 넘으면 남길 레코드만 새 파일로 옮겨 교체한다(압축). 교체는 새 인덱스를
+snapshots.idx.new로 옮기는 시점에 확정되고, 중간에 멈추면 다음 기록/조회가 마저 교체한다.
+"""
+
+import bisect
+import logging
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+import orjson
+from django.conf import settings
+from filelock import FileLock
+
+logger = logging.getLogger('crawling')
+
+HEADER = struct.Struct('>II')  # (payload 길이, CRC32)
+COMPRESS_LEVEL = 6
+COMPACT_SLACK = 0.25  # 보관 수를 이 비율만큼 넘으면 압축 (레코드마다 파일을 다시 쓰지 않도록)
+
+_archives = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(directory):
+    """디렉토리별 아카이브 싱글턴 (요청마다 크롤러를 만들어도 메모리 캐시 유지)"""
+    directory = Path(directory).resolve()
+    with _archives_lock:
+        if directory not in _archives:
+            _archives[directory] = SnapshotArchive(directory)
+        return _archives[directory]
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _format_entry(entry):
+    timestamp, offset, length = entry
+    return f"{timestamp:.6f}\t{offset}\t{length}\n"
+
+
+def _to_timestamp(crawled_time):
+    if crawled_time is None:
+        return None
+    if isinstance(crawled_time, (int, float)):
+        return round(float(crawled_time), 6)
+    if isinstance(crawled_time, str):
+        from datetime import datetime
+        crawled_time = datetime.fromisoformat(crawled_time.replace('Z', '+00:00'))
+    # 인덱스에 소수점 6자리로 기록되므로 비교 기준도 맞춘다
+    return round(crawled_time.timestamp(), 6)
+
+
+class SnapshotArchive:
+    def __init__(self, directory, keep=None):
+        self.directory = Path(directory)
+        self.data_file = self.directory / 'snapshots.dat'
+        self.index_file = self.directory / 'snapshots.idx'
+        self._compact_data = self.directory / 'snapshots.dat.tmp'
+        self._compact_index = self.directory / 'snapshots.idx.new'
+        self._file_lock = FileLock(str(self.directory / 'snapshots.lock'))
+        self._lock = threading.Lock()
+        self.keep = keep or _setting('SNAPSHOT_ARCHIVE_KEEP', 288)
+        self._index_stamp = None  # (inode, 읽은 바이트 수, mtime)
+        self._index = []      # [(timestamp, offset, length)] 시간순
+        self._latest = None   # (timestamp, data)
+
+    # ----- 인덱스 -----
+    def _load_index(self):
+        """인덱스 파일이 바뀐 경우에만 읽기 (덧붙은 줄만 이어 읽고, 교체됐으면 처음부터)"""
+        if self._compact_index.exists():
+            with self._file_lock:
+                self._finish_compaction()
+        try:
+            stat = self.index_file.stat()
+        except FileNotFoundError:
+            self._index_stamp, self._index, self._latest = None, [], None
+            return self._index
+
+        stamp = self._index_stamp
+        if stamp is not None and stamp[0] == stat.st_ino and stamp[1] == stat.st_size and stamp[2] == stat.st_mtime_ns:
+            return self._index
+        appended = stamp is not None and stamp[0] == stat.st_ino and stamp[1] <= stat.st_size
+        entries = list(self._index) if appended else []
+        with open(self.index_file, 'rb') as f:
+            f.seek(stamp[1] if appended else 0)
+            chunk = f.read()
+        # 줄바꿈까지 기록된 줄만 사용 (기록 중인 마지막 줄은 다음에 다시 읽음)
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        for line in complete.decode('ascii').splitlines():
+            parts = line.split('\t')
+            if len(parts) == 3:
+                entries.append((float(parts[0]), int(parts[1]), int(parts[2])))
+        # 시계가 되돌아간 경우에도 조회는 시간순
+        if any(entries[i][0] > entries[i + 1][0] for i in range(len(entries) - 1)):
+            entries.sort(key=lambda entry: entry[0])
+        offset = (stamp[1] if appended else 0) + len(complete)
+        self._index = entries
+        self._index_stamp = (stat.st_ino, offset, stat.st_mtime_ns if offset == stat.st_size else None)
+        self._latest = None  # 다른 프로세스가 추가했을 수 있으므로 무효화
+        return self._index
+
+    def _append_index(self, entry):
+        """인덱스에 한 줄 덧붙이기 (_load_index 직후 파일 락 안에서 호출)"""
+        complete = self._index_stamp[1] if self._index_stamp else 0
+        with open(self.index_file, 'ab') as f:
+            if f.seek(0, os.SEEK_END) > complete:
+                f.truncate(complete)  # 중단된 기록이 남긴 마지막 줄 조각 제거
+            f.write(_format_entry(entry).encode('ascii'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ----- 보관 수 정리 -----
+    def _compact(self, entries):
+        """최근 keep개 레코드만 새 데이터/인덱스 파일로 옮겨 교체 (파일 락 안에서 호출)"""
+        kept = []
+        with open(self.data_file, 'rb') as source, open(self._compact_data, 'wb') as target:
+            for timestamp, offset, length in entries[-self.keep:]:
+                source.seek(offset)
+                kept.append((timestamp, target.tell(), length))
+                target.write(source.read(length))
+            target.flush()
+            os.fsync(target.fileno())
+        tmp_index = self.index_file.with_suffix('.idx.tmp')
+        with open(tmp_index, 'w', encoding='ascii') as f:
+            f.writelines(_format_entry(entry) for entry in kept)
+            f.flush()
+            os.fsync(f.fileno())
+        # 새 인덱스가 .idx.new로 옮겨지면 압축 확정 - 이후 단계는 멈춰도 다시 실행된다
+        os.replace(tmp_index, self._compact_index)
+        self._finish_compaction()
+        logger.info(f"스냅샷 아카이브 정리: {len(entries) - len(kept)}건 삭제, {len(kept)}건 보관")
+
+    def _finish_compaction(self):
+        """확정된 압축의 파일 교체 (데이터 → 인덱스 순서, 파일 락 안에서 호출)"""
+        if not self._compact_index.exists():
+            return
+        if self._compact_data.exists():
+            os.replace(self._compact_data, self.data_file)
+        os.replace(self._compact_index, self.index_file)
+
+    # ----- 기록/조회 -----
+    def append(self, crawled_time, data):
+        """스냅샷 1건 추가 (같은 크롤링 시각이 이미 최신이면 건너뜀)"""
+        timestamp = _to_timestamp(crawled_time)
+        if timestamp is None:
+            raise ValueError("crawled_time이 없는 스냅샷은 저장할 수 없습니다.")
+
+        raw = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        payload = zlib.compress(raw, COMPRESS_LEVEL)
+        record = HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock:
+            entries = self._load_index()
+            if entries and entries[-1][0] == timestamp:
+                return False
+
+            with open(self.data_file, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+            entry = (timestamp, offset, len(record))
+            self._append_index(entry)
+
+            entries = self._load_index()
+            if len(entries) > self.keep * (1 + COMPACT_SLACK):
+                self._compact(entries)
+                entries = self._load_index()
+            # 읽기 경로와 같은 형태(JSON 역직렬화 결과)로 보관
+            self._latest = (timestamp, orjson.loads(raw)) if entries and entries[-1][0] == timestamp else None
+        return True
+
+    def _read(self, entry):
+        _, offset, length = entry
+        with open(self.data_file, 'rb') as f:
+            f.seek(offset)
+            record = f.read(length)
+        size, crc = HEADER.unpack_from(record)
+        payload = record[HEADER.size:HEADER.size + size]
+        if len(payload) != size or zlib.crc32(payload) != crc:
+            raise ValueError(f"손상된 스냅샷 레코드 (offset={offset})")
+        return orjson.loads(zlib.decompress(payload))
+
+    def latest(self):
+        """가장 최근 스냅샷 (인덱스 mtime이 같으면 메모리 사본 반환)"""
+        with self._lock:
+            entries = self._load_index()
+            if not entries:
+                return None
+            if self._latest is None or self._latest[0] != entries[-1][0]:
+                self._latest = (entries[-1][0], self._read(entries[-1]))
+            return self._latest[1]
+
+    def at(self, crawled_time):
+        """crawled_time 시점 또는 그 직전의 스냅샷"""
+        timestamp = _to_timestamp(crawled_time)
+        if timestamp is None:
+            return None
+        with self._lock:
+            entries = self._load_index()
+            pos = bisect.bisect_right([entry[0] for entry in entries], timestamp)
+            if pos == 0:
+                return None
+            entry = entries[pos - 1]
+            if self._latest is not None and self._latest[0] == entry[0]:
+                return self._latest[1]
+        return self._read(entry)
+
+    def timestamps(self):
+        """보관 중인 스냅샷의 크롤링 시각 목록 (epoch 초)"""
+        with self._lock:
+            return [entry[0] for entry in self._load_index()]
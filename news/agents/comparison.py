@@ -0,0 +1,232 @@
+"""
+news/agents/comparison.py - 언론사 비교 분석 (map-reduce)
+
+기사가 많은 키워드는 전체 기사를 한 번에 보내는 대신
+1. map: 언론사별 부분 분석을 동시에 실행하고
+2. reduce: 부분 분석들을 합쳐 classification/comparison/summary 구조로 정리한다.
+
+map 결과는 (언론사, 기사 집합 해시) 단위로 캐시하므로, 새 기사가 추가되면
+해당 언론사의 map 단계만 다시 실행된다.
+기사가 적으면(COMPARISON_MAPREDUCE_MIN_ARTICLES 미만) 기존처럼 한 번의 호출로 분석한다.
+"""
+
+import asyncio
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..llm import INTERACTIVE, achat
+from ..prompting import get_budget, pack_articles
+
+logger = logging.getLogger('news')
+
+MAP_MODEL = "gpt-3.5-turbo"
+REDUCE_MODEL = "gpt-3.5-turbo-16k"
+MAP_MAX_TOKENS = 400
+REDUCE_MAX_TOKENS = 4000
+MAP_CACHE_TIMEOUT = 60 * 60 * 6
+PROMPT_VERSION = 'v1'  # 프롬프트를 바꾸면 올려서 이전 map 캐시를 무효화
+
+MAP_SYSTEM_PROMPT = """
+한 언론사의 기사들만 보고 이 언론사의 보도 방식을 정리해주세요:
+- 전면에 내세운 사실
+- 강조하는 맥락과 프레임
+- 특징적인 표현과 어조 (실제 표현 인용)
+5줄 이내로, 언론사 이름을 주어로 작성하세요.
+"""
+
+ANALYSIS_STEPS = """
+1. 보도 관점 분석
+각 언론사의 보도 프레임을 분석하세요:
+- 어떤 사실을 전면에 내세우는가?
+- 어떤 맥락을 강조하는가?
+- 어떤 표현과 어조를 사용하는가?
+
+2. 주요 쟁점 분석
+핵심 쟁점별로 언론사들의 대립되는 시각을 분석하세요:
+- 쟁점 1: [언론사A]는 [프레임A]로, [언론사B]는 [프레임B]로 해석
+- 쟁점 2: [언론사C]는 [관점C]를, [언론사D]는 [관점D]를 강조
+
+3. 종합 분석
+전체 보도의 지형도를 그려주세요:
+- 주요 진영과 프레임은 어떻게 형성되어 있는가?
+- 각 진영의 핵심 주장과 근거는 무엇인가?
+- 이 보도들이 여론 형성에 미치는 영향은?
+
+※ 구체적 사례와 표현을 인용하며 분석할 것
+"""
+
+SINGLE_SYSTEM_PROMPT = "다음 세 단계로 분석해주세요:\n" + ANALYSIS_STEPS
+
+REDUCE_SYSTEM_PROMPT = (
+    "아래는 같은 키워드에 대한 언론사별 보도 분석입니다. "
+    "이를 종합해 다음 세 단계로 분석해주세요:\n" + ANALYSIS_STEPS
+)
+
+
+def use_map_reduce(articles):
+    """기사 수가 기준 이상이고 언론사가 2곳 이상이면 map-reduce 사용"""
+    min_articles = getattr(settings, 'COMPARISON_MAPREDUCE_MIN_ARTICLES', 8)
+    presses = {_press(article) for article in articles}
+    return len(articles) >= min_articles and len(presses) >= 2
+
+
+def _press(article):
+    return article.get('source') or article.get('company_name') or '알 수 없음'
+
+
+def _format_article(article):
+    return (
+        f"제목: {article['title']}\n"
+        f"요약: {article.get('summary') or '요약 없음'}"
+    )
+
+
+def _format_article_with_press(article):
+    return (
+        f"제목: {article['title']}\n"
+        f"언론사: {_press(article)}\n"
+        f"요약: {article.get('summary') or '요약 없음'}"
+    )
+
+
+def _analysis_result(text, packed):
+    parts = text.split('\n\n', 2)
+    return {
+        'classification': parts[0] if len(parts) > 0 else '분류 결과 없음',
+        'comparison': parts[1] if len(parts) > 1 else '비교 분석 결과 없음',
+        'summary': parts[2] if len(parts) > 2 else '요약 결과 없음',
+        # 프롬프트에서 잘리거나 빠진 항목 기록
+        'prompt': {
+            **packed.stats(),
+            'decisions': [d for d in packed.decisions if d['action'] != 'included'],
+        },
+    }
+
+
+def _map_cache_key(press, articles):
+    """언론사 + 기사 집합(URL/제목, 요약) 해시 - 순서와 무관"""
+    entries = sorted(
+        f"{article.get('url') or article['title']}\x1f{article.get('summary') or ''}"
+        for article in articles
+    )
+    digest = hashlib.md5('\x1e'.join([PROMPT_VERSION, press, *entries]).encode('utf-8')).hexdigest()
+    return f"comparison_map:{digest}"
+
+
+async def _call_llm(system_prompt, user_prompt, model, max_tokens, priority=INTERACTIVE):
+    response = await achat(
+        user_prompt, system=system_prompt, model=model,
+        temperature=0.3, max_tokens=max_tokens, priority=priority,
+    )
+    return response.content
+
+
+async def _map_press(press, articles, semaphore, priority=INTERACTIVE):
+    """언론사 1곳의 부분 분석 (캐시 우선)"""
+    cache_key = _map_cache_key(press, articles)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return press, cached, True
+
+    packed = pack_articles(
+        articles, _format_article,
+        budget=get_budget('comparison_map'),
+        model=MAP_MODEL,
+        label=f"comparison_map:{press}",
+    )
+    async with semaphore:
+        partial = await _call_llm(
+            MAP_SYSTEM_PROMPT,
+            f"언론사: {press}\n\n{packed.text}",
+            MAP_MODEL,
+            MAP_MAX_TOKENS,
+            priority,
+        )
+    cache.set(cache_key, partial, timeout=MAP_CACHE_TIMEOUT)
+    return press, partial, False
+
+
+async def compare_by_press(articles, keyword='', priority=INTERACTIVE):
+    """
+    언론사별 map → reduce 비교 분석
+
+    Args:
+        articles: [{'title', 'source' 또는 'company_name', 'summary', 'url', 'rank'}, ...]
+
+    Returns:
+        dict: {'classification', 'comparison', 'summary', 'prompt', 'map'}
+    """
+    by_press = {}
+    for article in articles:
+        by_press.setdefault(_press(article), []).append(article)
+
+    semaphore = asyncio.Semaphore(getattr(settings, 'COMPARISON_MAP_CONCURRENCY', 4))
+    results = await asyncio.gather(
+        *(_map_press(press, press_articles, semaphore, priority) for press, press_articles in by_press.items()),
+        return_exceptions=True,
+    )
+
+    partials = []
+    cached_count = 0
+    for (press, press_articles), result in zip(by_press.items(), results):
+        if isinstance(result, Exception):
+            logger.error(f"[{keyword}] {press} 부분 분석 실패: {str(result)}")
+            continue
+        _, partial, cached = result
+        cached_count += cached
+        partials.append({
+            'source': press,
+            'rank': min(article.get('rank') or 999 for article in press_articles),
+            'count': len(press_articles),
+            'summary': partial,
+        })
+    if not partials:
+        raise RuntimeError('모든 언론사의 부분 분석이 실패했습니다.')
+
+    packed = pack_articles(
+        partials,
+        lambda partial: f"[{partial['source']}] (기사 {partial['count']}건)\n{partial['summary']}",
+        budget=get_budget('comparison'),
+        model=REDUCE_MODEL,
+        label=f"comparison_reduce:{keyword}",
+    )
+    result = await _call_llm(REDUCE_SYSTEM_PROMPT, packed.text, REDUCE_MODEL, REDUCE_MAX_TOKENS, priority)
+
+    logger.info(
+        f"[{keyword}] map-reduce 비교 분석: 언론사 {len(by_press)}곳 "
+        f"(캐시 {cached_count}, 실패 {len(by_press) - len(partials)})"
+    )
+    analysis = _analysis_result(result, packed)
+    analysis['map'] = {
+        'presses': len(by_press),
+        'cached': cached_count,
+        'failed': len(by_press) - len(partials),
+    }
+    return analysis
+
+
+async def compare_single(articles, keyword='', priority=INTERACTIVE):
+    """전체 기사를 한 번의 호출로 비교 분석 (기사가 적을 때)"""
+    packed = pack_articles(
+        articles, _format_article_with_press,
+        budget=get_budget('comparison'),
+        model=REDUCE_MODEL,
+        label=f"comparison:{keyword}",
+    )
+    result = await _call_llm(SINGLE_SYSTEM_PROMPT, packed.text, REDUCE_MODEL, REDUCE_MAX_TOKENS, priority)
+    return _analysis_result(result, packed)
+
+
+async def compare_articles(articles, keyword='', priority=INTERACTIVE):
+    """기사 수에 따라 map-reduce 또는 단일 호출로 비교 분석"""
+    if use_map_reduce(articles):
+        return await compare_by_press(articles, keyword, priority)
+    return await compare_single(articles, keyword, priority)
+
+
+def compare_articles_sync(articles, keyword='', priority=INTERACTIVE):
+    """동기 뷰에서 호출하기 위한 래퍼"""
+    return asyncio.run(compare_articles(articles, keyword, priority))
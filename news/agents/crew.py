@@ -1,15 +1,17 @@
 import logging
-import requests
-from bs4 import BeautifulSoup
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
 from typing import List, Dict
 from datetime import datetime
+from .comparison import compare_by_press, use_map_reduce
+from ..llm import chat, achat, INTERACTIVE
 
 logger = logging.getLogger(__name__)
 
-def summarize_articles(urls, batch_size=5):
+def summarize_articles(urls, batch_size=5, priority=INTERACTIVE):
     """여러 기사를 배치로 나누어 요약하는 함수"""
+    # 본문 저장소는 요약할 때만 로드 (크롤링 때 받은 본문을 그대로 씀)
+    from crawling.article_store import get_article_store
+
+    store = get_article_store()
     try:
         # 1. URL 목록을 배치로 나누기
         batches = [urls[i:i + batch_size] for i in range(0, len(urls), batch_size)]
@@ -19,36 +21,28 @@ def summarize_articles(urls, batch_size=5):
         for batch_urls in batches:
             batch_content = []
             
-            # 2.1 배치 내 각 URL의 내용 수집
+            # 2.1 배치 내 각 URL의 내용 수집 (저장소에 없거나 오래된 본문만 요청)
             for url in batch_urls:
-                response = requests.get(url)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                article_body = soup.select_one('#dic_area')
-                
-                if article_body:
-                    content = article_body.get_text().strip()
-                    batch_content.append(f"{content[:2000]}")
+                article = store.get(url)
+                if article:
+                    batch_content.append(f"{article.text[:2000]}")
             
             # 2.2 배치 내용 한번에 요약
-            llm = ChatOpenAI(
-                model_name="gpt-3.5-turbo-16k",
-                temperature=0.5,
-                max_tokens=300
-            )
-            
             system_message = """
             당신은 뉴스 기사를 간단명료하게 요약하는 전문가입니다.
             주어진 뉴스 기사를 3줄로 요약해주세요.(180자 이내)
             핵심 내용만 추출하여 객관적으로 작성해주세요.
             """
             
-            messages = [
-                SystemMessage(content=system_message),
-                HumanMessage(content="\n".join(batch_content))
-            ]
-            
-            response = llm.generate([messages])
-            summaries = response.generations[0][0].text.split("\n\n")
+            response = chat(
+                "\n".join(batch_content),
+                system=system_message,
+                model="gpt-3.5-turbo-16k",
+                temperature=0.5,
+                max_tokens=300,
+                priority=priority
+            )
+            summaries = response.content.split("\n\n")
             
             # 2.3 URL과 요약 매핑
             for url, summary in zip(batch_urls, summaries):
@@ -60,12 +54,12 @@ def summarize_articles(urls, batch_size=5):
         logger.error(f"요약 중 오류 발생: {str(e)}")
         return {}
 
-def summarize_article(url):
+def summarize_article(url, priority=INTERACTIVE):
     """단일 기사 요약 함수"""
-    summaries = summarize_articles([url])
+    summaries = summarize_articles([url], priority=priority)
     return summaries.get(url, "기사 요약 중 오류가 발생했습니다.")
 
-async def run_analysis(news_data: List[Dict], press_stats: Dict = None) -> Dict:
+async def run_analysis(news_data: List[Dict], press_stats: Dict = None, priority: int = INTERACTIVE) -> Dict:
     """뉴스 데이터 분석 함수"""
     try:
         if not news_data:
@@ -76,6 +70,18 @@ async def run_analysis(news_data: List[Dict], press_stats: Dict = None) -> Dict:
                 'timestamp': datetime.now().isoformat()
             }
         
+        # 기사가 많으면 언론사별 부분 분석 후 종합 (map-reduce)
+        if use_map_reduce(news_data):
+            analysis = await compare_by_press(news_data, priority=priority)
+            return {
+                'success': True,
+                'classification': analysis['classification'],
+                'comparison': analysis['comparison'],
+                'summary': analysis['summary'],
+                'analyzed_articles': len(news_data),
+                'timestamp': datetime.now().isoformat()
+            }
+        
         # GPT 분석 사용
         article_list = "\n".join([
             f"제목: {article['title']}\n"
@@ -84,12 +90,6 @@ async def run_analysis(news_data: List[Dict], press_stats: Dict = None) -> Dict:
             for article in news_data
         ])
         
-        llm = ChatOpenAI(
-            temperature=0.3,
-            model_name="gpt-3.5-turbo-16k",
-            max_tokens=4000,
-        )
-        
         system_prompt = """
         모든 참여 언론사의 기사를 빠짐없이 분석하여 다음 형식으로 정리해주세요:
 
@@ -111,13 +111,15 @@ async def run_analysis(news_data: List[Dict], press_stats: Dict = None) -> Dict:
         ※ 언론사는 중복 없이 분석해주세요.
         """
         
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=article_list)
-        ]
-        
-        response = llm.generate([messages])
-        result = response.generations[0][0].text
+        response = await achat(
+            article_list,
+            system=system_prompt,
+            model="gpt-3.5-turbo-16k",
+            temperature=0.3,
+            max_tokens=4000,
+            priority=priority
+        )
+        result = response.content
         parts = result.split('\n\n', 2)
         
         return {
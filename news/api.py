@@ -0,0 +1,378 @@
+"""
+news/api.py - 읽기 전용 JSON API (v1)
+
+현재 크롤링 스냅샷의 언론사별 랭킹, 키워드 랭킹, 최근 1h/6h/24h 키워드 순위, 키워드별 기사, 키워드 추이,
+같은 스토리의 다른 언론사 기사, 저장된 요약, 언론사별 크롤링 주기를
+orjson으로 직렬화해 제공한다.
+
+공통 규칙:
+- 커서 페이지네이션: ?limit=20&cursor=<next_cursor>
+- 필드 선택: ?fields=title,url,rank
+- 스냅샷 기반 응답은 버전별로 캐시되며, ETag(버전)로 304를 지원한다.
+"""
+
+import base64
+import hashlib
+import logging
+
+import orjson
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views.decorators.http import require_http_methods
+
+from .crawl_schedule import enabled as adaptive_schedule_enabled, interval_bounds, schedule_status
+from .keyword_windows import get_keyword_windows
+from .live import current_version
+from .snapshots import snapshot_version
+from .models import KeywordRollup, NewsSummary
+from .rollups import keyword_trend as build_keyword_trend
+from .stories import similar_articles as find_similar_articles
+
+logger = logging.getLogger('news')
+
+API_CACHE_PREFIX = 'api_v1'
+API_CACHE_TIMEOUT = 60 * 60  # 버전이 키에 포함되므로 크롤링 주기만큼 유지
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+MAX_PARAM_LENGTH = 500  # 캐시 키에 들어가는 쿼리 값 최대 길이
+MAX_TREND_BUCKETS = {KeywordRollup.PERIOD_HOUR: 24 * 7, KeywordRollup.PERIOD_DAY: 90}
+
+ARTICLE_FIELDS = ('company_code', 'company_name', 'title', 'url', 'rank', 'image_url', 'summary', 'crawled_at', 'cluster_id', 'story_id')
+KEYWORD_FIELDS = ('keyword', 'count', 'related_keywords')
+WINDOW_KEYWORD_FIELDS = ('keyword', 'count', 'average', 'related_keywords')
+SUMMARY_FIELDS = ('id', 'keyword', 'crawled_time', 'created_at', 'articles', 'analysis')
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _default(obj):
+    """orjson이 기본 지원하지 않는 타입 처리"""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return sorted(obj) if isinstance(obj, (set, frozenset)) else list(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+def dumps(data):
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class OrjsonResponse(HttpResponse):
+    """orjson으로 직렬화하는 JsonResponse 대체 클래스"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
+
+
+def _encode_cursor(version, offset):
+    raw = orjson.dumps({'v': version, 'o': offset})
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = orjson.loads(base64.urlsafe_b64decode(padded))
+        version, offset = data['v'], int(data['o'])
+    except Exception:
+        raise ApiError('잘못된 cursor 값입니다.')
+    if offset < 0:
+        raise ApiError('잘못된 cursor 값입니다.')
+    return version, offset
+
+
+def _parse_limit(request):
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError('limit은 정수여야 합니다.')
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _parse_fields(request, allowed):
+    fields = request.GET.get('fields')
+    if not fields:
+        return allowed
+    selected = tuple(f.strip() for f in fields.split(',') if f.strip())
+    unknown = [f for f in selected if f not in allowed]
+    if unknown:
+        raise ApiError(f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(allowed)})")
+    return selected
+
+
+def _select(record, fields):
+    return {field: record.get(field) for field in fields}
+
+
+def _paginate(request, records, version, fields):
+    """스냅샷 버전에 묶인 오프셋 커서로 페이지 구성"""
+    limit = _parse_limit(request)
+    offset = 0
+    cursor = request.GET.get('cursor')
+    if cursor:
+        cursor_version, offset = _decode_cursor(cursor)
+        if cursor_version != version:
+            raise ApiError('스냅샷이 갱신되어 cursor가 만료되었습니다. 처음부터 다시 요청하세요.', status=410)
+
+    page = records[offset:offset + limit]
+    next_offset = offset + len(page)
+    return {
+        'version': version,
+        'count': len(records),
+        'next_cursor': _encode_cursor(version, next_offset) if next_offset < len(records) else None,
+        'data': [_select(record, fields) for record in page],
+    }
+
+
+def _cache_params(request, names):
+    """
+    캐시 키용 쿼리 - 뷰가 쓰는 파라미터만 정규화해서 사용 (모르는 파라미터는 키에서 뺌)
+
+    limit은 범위 안으로, fields는 중복 제거, cursor는 검증 후 다시 인코딩한다.
+    """
+    params = []
+    for name in names:
+        value = request.GET.get(name)
+        if name == 'limit':
+            # 생략/범위 밖 값도 실제로 쓰이는 값으로 (같은 응답은 같은 키)
+            params.append(f"limit={_parse_limit(request)}")
+            continue
+        if value is None or value == '':
+            continue
+        if len(value) > MAX_PARAM_LENGTH:
+            raise ApiError(f"{name} 값이 너무 깁니다 (최대 {MAX_PARAM_LENGTH}자).")
+        if name == 'fields':
+            value = ','.join(dict.fromkeys(f.strip() for f in value.split(',') if f.strip()))
+        elif name == 'cursor':
+            value = _encode_cursor(*_decode_cursor(value))
+        params.append(f"{name}={value}")
+    return '&'.join(params)
+
+
+def snapshot_api(*params):
+    """
+    스냅샷 API 공통 처리 (params: 뷰가 쓰는 쿼리 파라미터 이름)
+
+    - 현재 버전 기준 ETag/304
+    - (경로, 정규화한 쿼리, 버전) 단위 응답 바이트 캐시 - news_data가 현재 버전일 때만
+      (크롤링 중 news_data가 비어 있을 때의 빈 응답이 버전 캐시에 남지 않도록)
+    - ApiError를 JSON 에러 응답으로 변환
+    """
+    def decorator(view):
+        def wrapper(request, *args, **kwargs):
+            version = current_version()
+            if version is None:
+                return OrjsonResponse({'error': '아직 크롤링된 데이터가 없습니다.'}, status=503)
+
+            etag = f'"{version}"'
+            if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+                response = HttpResponse(status=304)
+                response['ETag'] = etag
+                return response
+
+            try:
+                query = _cache_params(request, params)
+            except ApiError as e:
+                return OrjsonResponse({'error': e.message}, status=e.status)
+            digest = hashlib.md5(f"{request.path}?{query}".encode('utf-8')).hexdigest()
+            cache_key = f"{API_CACHE_PREFIX}:{version}:{digest}"
+
+            body = cache.get(cache_key)
+            cacheable = True
+            if body is None:
+                cacheable = snapshot_version(_snapshot_data().get('crawled_time')) == version
+                try:
+                    payload = view(request, version, *args, **kwargs)
+                except ApiError as e:
+                    return OrjsonResponse({'error': e.message}, status=e.status)
+                body = dumps(payload)
+                if cacheable:
+                    cache.set(cache_key, body, timeout=API_CACHE_TIMEOUT)
+
+            response = HttpResponse(body, content_type='application/json')
+            if cacheable:
+                # 현재 버전의 데이터로 만든 응답만 ETag를 붙여 클라이언트가 빈 응답을 재사용하지 않도록
+                response['ETag'] = etag
+            response['Cache-Control'] = 'no-cache'
+            return response
+
+        wrapper.__name__ = view.__name__
+        wrapper.__doc__ = view.__doc__
+        return require_http_methods(["GET"])(wrapper)
+    return decorator
+
+
+def _snapshot_data():
+    return cache.get('news_data') or {}
+
+
+@snapshot_api('press', 'limit', 'cursor', 'fields')
+def rankings(request, version):
+    """언론사별 랭킹 (?press=조선일보 로 필터링)"""
+    news_items = _snapshot_data().get('news_items', [])
+    press = request.GET.get('press')
+    records = [
+        item for item in news_items
+        if not press or item.get('company_name') == press
+    ]
+    records.sort(key=lambda x: (x.get('company_name', ''), x.get('rank', 999)))
+    return _paginate(request, records, version, _parse_fields(request, ARTICLE_FIELDS))
+
+
+@snapshot_api('limit', 'cursor', 'fields')
+def keyword_rankings(request, version):
+    """키워드 랭킹"""
+    records = [
+        {'keyword': keyword, 'count': count, 'related_keywords': sorted(group)}
+        for keyword, count, group in _snapshot_data().get('keyword_rankings', [])
+    ]
+    return _paginate(request, records, version, _parse_fields(request, KEYWORD_FIELDS))
+
+
+@snapshot_api('limit', 'cursor', 'fields')
+def keyword_articles(request, version, keyword):
+    """키워드가 제목에 포함된 기사"""
+    records = [
+        item for item in _snapshot_data().get('news_items', [])
+        if keyword in item['title']
+    ]
+    records.sort(key=lambda x: x.get('rank', 999))
+    payload = _paginate(request, records, version, _parse_fields(request, ARTICLE_FIELDS))
+    payload['keyword'] = keyword
+    return payload
+
+
+@snapshot_api('period', 'count')
+def keyword_trend(request, version, keyword):
+    """
+    키워드 기사 수 추이 (?period=day|hour&count=7)
+
+    집계는 크롤링마다 갱신되므로 스냅샷 버전 단위로 캐시한다.
+    """
+    period = request.GET.get('period', KeywordRollup.PERIOD_DAY)
+    if period not in MAX_TREND_BUCKETS:
+        raise ApiError(f"period는 {', '.join(MAX_TREND_BUCKETS)} 중 하나여야 합니다.")
+    try:
+        count = int(request.GET.get('count', 7))
+    except ValueError:
+        raise ApiError('count는 정수여야 합니다.')
+    count = max(1, min(count, MAX_TREND_BUCKETS[period]))
+
+    return {
+        'version': version,
+        'keyword': keyword,
+        'period': period,
+        'data': build_keyword_trend(keyword, period, count),
+    }
+
+
+@snapshot_api('url', 'k')
+def similar_articles(request, version):
+    """같은 스토리로 보이는 기사 (?url=<기사 URL>&k=10, 스토리 인덱스 최근접 이웃)"""
+    url = request.GET.get('url')
+    if not url:
+        raise ApiError('url 파라미터가 필요합니다.')
+    try:
+        k = max(1, min(int(request.GET.get('k', 10)), MAX_LIMIT))
+    except ValueError:
+        raise ApiError('k는 정수여야 합니다.')
+    return {
+        'version': version,
+        'url': url,
+        'data': find_similar_articles(url, k),
+    }
+
+
+@require_http_methods(["GET"])
+def keyword_windows(request):
+    """
+    최근 시간 창별 키워드 순위 (?window=6h&limit=10&fields=keyword,count)
+
+    창은 조회 시점 기준으로 만료되므로 스냅샷 버전 캐시를 쓰지 않는다 (창 합계 정렬만 수행).
+    """
+    windows = get_keyword_windows()
+    try:
+        fields = _parse_fields(request, WINDOW_KEYWORD_FIELDS)
+        limit = _parse_limit(request)
+        names = list(windows.windows)
+        selected = request.GET.get('window')
+        if selected:
+            if selected not in windows.windows:
+                raise ApiError(f"window는 {', '.join(names)} 중 하나여야 합니다.")
+            names = [selected]
+    except ApiError as e:
+        return OrjsonResponse({'error': e.message}, status=e.status)
+
+    rankings = windows.rankings(limit)
+    return OrjsonResponse({
+        'version': current_version(),
+        'data': {
+            name: {
+                'crawls': rankings[name]['crawls'],
+                'keywords': [
+                    _select({'keyword': keyword, 'count': count, 'average': average,
+                             'related_keywords': sorted(group)}, fields)
+                    for keyword, count, average, group in rankings[name]['keywords']
+                ],
+            }
+            for name in names
+        },
+    })
+
+
+@require_http_methods(["GET"])
+def crawl_schedule(request):
+    """
+    언론사별 적응형 크롤링 주기와 마지막 결정 (news/crawl_schedule.py)
+
+    다음 크롤링 시각은 시간이 지나면 바뀌므로 캐시하지 않는다.
+    """
+    from crawling.press_registry import registry
+
+    low, high = interval_bounds()
+    return OrjsonResponse({
+        'adaptive': adaptive_schedule_enabled(),
+        'min_interval_seconds': low,
+        'max_interval_seconds': high,
+        'data': schedule_status(registry.codes()),
+    })
+
+
+@require_http_methods(["GET"])
+def summaries(request):
+    """
+    저장된 키워드 요약 (최신순, id 기반 keyset 커서)
+
+    요약은 같은 스냅샷 안에서도 새로 저장되므로 버전 캐시를 쓰지 않는다.
+    """
+    try:
+        fields = _parse_fields(request, SUMMARY_FIELDS)
+        limit = _parse_limit(request)
+        queryset = NewsSummary.objects.order_by('-id')
+
+        cursor = request.GET.get('cursor')
+        if cursor:
+            try:
+                queryset = queryset.filter(id__lt=int(cursor))
+            except ValueError:
+                raise ApiError('잘못된 cursor 값입니다.')
+        if request.GET.get('keyword'):
+            queryset = queryset.filter(keyword=request.GET['keyword'])
+    except ApiError as e:
+        return OrjsonResponse({'error': e.message}, status=e.status)
+
+    rows = list(queryset.values(*SUMMARY_FIELDS)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return OrjsonResponse({
+        'version': current_version(),
+        'next_cursor': str(rows[-1]['id']) if has_more else None,
+        'data': [_select(row, fields) for row in rows],
+    })
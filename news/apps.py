@@ -1,5 +1,17 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'news'
\ No newline at end of file
+    name = 'news'
+
+    def ready(self):
+        # 파일/콘솔 핸들러를 리스너 스레드로 옮김 (요청 스레드는 큐에 넣기만 함)
+        if getattr(settings, 'LOG_QUEUE_ENABLED', False):
+            from .log_pipeline import start_queue_logging
+            start_queue_logging()
+
+        # 트레이스 내보내기를 켠 경우에만 OpenTelemetry SDK를 불러옴
+        if (getattr(settings, 'TRACING', None) or {}).get('exporter'):
+            from .tracing import configure_tracing
+            configure_tracing()
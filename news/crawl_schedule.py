@@ -0,0 +1,245 @@
+"""
+news/crawl_schedule.py - 언론사별 적응형 크롤링 주기
+
+모든 언론사를 같은 주기(CACHE_TIMEOUT 1시간)로 다시 크롤링하는 대신, 언론사마다
+랭킹이 얼마나 자주 바뀌는지(churn)를 기록해 각자의 주기로 크롤링한다.
+
+- 변동 수: 직전 크롤링과 같은 순위 자리에 다른 기사가 있으면 1 (새 기사 진입 + 순위 이동)
+- 변동률: 변동 수 / 경과 시간(시간)을 지수 평균(CRAWL_CHURN_SMOOTHING)한 값
+- 다음 주기: 변동률로 CRAWL_TARGET_CHANGES개 순위가 바뀔 것으로 보이는 시간.
+  한 번에 절반~두 배까지만 바꾸고 CRAWL_MIN/MAX_INTERVAL_SECONDS 안으로 제한한다.
+
+크롤링이 실패하거나 기사가 없으면 변동 기록(last_urls)은 그대로 두고 주기를 두 배씩
+늘린 시각(최대 CRAWL_MAX_INTERVAL_SECONDS)에 다시 시도한다 (record_failure).
+
+주기 결정은 PressSchedule에 남고 /api/v1/crawl/schedule/ 과
+python manage.py crawl_coordinator --schedule 로 볼 수 있다.
+크롤링하지 않은 언론사는 직전 스냅샷의 기사를 그대로 이어 쓴다 (carry_over).
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import PressSchedule
+
+logger = logging.getLogger('crawling')
+
+# 가장 이른 다음 크롤링 시각 - 캐시된 페이지 요청마다 주기 테이블을 조회하지 않도록 잠시 보관
+NEXT_DUE_CACHE_KEY = 'crawl_schedule_next_due'
+NEXT_DUE_CACHE_TIMEOUT = 60  # 다른 프로세스의 기록은 이 시간 안에 반영
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enabled():
+    return _setting('CRAWL_ADAPTIVE', True)
+
+
+def interval_bounds():
+    return _setting('CRAWL_MIN_INTERVAL_SECONDS', 600), _setting('CRAWL_MAX_INTERVAL_SECONDS', 3600)
+
+
+def count_changes(previous_urls, urls):
+    """같은 순위 자리의 기사가 바뀐 수 (한쪽에만 있는 자리도 변동)"""
+    return sum(
+        1 for rank in range(max(len(previous_urls), len(urls)))
+        if previous_urls[rank:rank + 1] != urls[rank:rank + 1]
+    )
+
+
+def _format_seconds(seconds):
+    return f"{seconds // 60}분" if seconds % 60 == 0 else f"{seconds}초"
+
+
+def next_interval(current, churn_per_hour):
+    """
+    변동률 → 다음 주기(초)와 결정 설명
+
+    변동률이 0이면 최대 주기 쪽으로 두 배씩 늘린다.
+    """
+    low, high = interval_bounds()
+    target = _setting('CRAWL_TARGET_CHANGES', 3)
+    ideal = target / churn_per_hour * 3600 if churn_per_hour else float('inf')
+    # 관측 한 번으로 주기가 급변하지 않도록 절반~두 배로 제한
+    interval = int(min(max(ideal, current / 2), current * 2))
+    interval = min(max(interval, low), high)
+    if interval == low:
+        reason = '최소'
+    elif interval == high:
+        reason = '최대'
+    elif interval < current:
+        reason = '단축'
+    elif interval > current:
+        reason = '연장'
+    else:
+        reason = '유지'
+    return interval, reason
+
+
+def load(codes):
+    """언론사 코드 → PressSchedule (없는 언론사는 빠짐)"""
+    return {schedule.press_code: schedule for schedule in PressSchedule.objects.filter(press_code__in=codes)}
+
+
+def due_codes(codes, now=None, missing=()):
+    """
+    지금 크롤링할 언론사 코드 (codes 순서 유지)
+
+    주기 기록이 없거나 다음 크롤링 시각이 CRAWL_DUE_SLACK_SECONDS 안으로 다가온 언론사.
+    곧 돌아올 언론사를 함께 크롤링해 드라이버를 한 번 더 띄우지 않는다.
+    missing(직전 스냅샷에 기사가 없는 언론사)은 주기와 상관없이 포함하되,
+    실패 후 재시도를 기다리는 언론사는 뺀다.
+    """
+    now = now or timezone.now()
+    horizon = now + timedelta(seconds=_setting('CRAWL_DUE_SLACK_SECONDS', 60))
+    missing = set(missing)
+    earliest = cache.get(NEXT_DUE_CACHE_KEY)
+    if earliest is not None and earliest > horizon and not missing:
+        return []
+    schedules = load(codes)
+    if len(schedules) == len(set(codes)):
+        cache.set(NEXT_DUE_CACHE_KEY, min(schedule.next_due for schedule in schedules.values()),
+                  timeout=NEXT_DUE_CACHE_TIMEOUT)
+
+    def due(code):
+        schedule = schedules.get(code)
+        if schedule is None or schedule.next_due <= horizon:
+            return True
+        return code in missing and not schedule.failures
+
+    return [code for code in codes if due(code)]
+
+
+def record_crawl(press_code, press_name, items, now=None):
+    """언론사 1곳 크롤링 결과로 변동률과 다음 크롤링 시각 갱신"""
+    now = now or timezone.now()
+    urls = [item['url'] for item in sorted(items, key=lambda item: item['rank'])]
+    low, high = interval_bounds()
+    schedule = PressSchedule.objects.filter(press_code=press_code).first()
+
+    if schedule is None or schedule.last_crawled is None:
+        interval = min(max(_setting('CRAWL_INITIAL_INTERVAL_SECONDS', low), low), high)
+        schedule = schedule or PressSchedule(press_code=press_code)
+        changes, churn, decision = len(urls), None, f"첫 크롤링 → {_format_seconds(interval)}"
+    else:
+        changes = count_changes(schedule.last_urls, urls)
+        hours = max((now - schedule.last_crawled).total_seconds(), 1) / 3600
+        rate = changes / hours
+        smoothing = _setting('CRAWL_CHURN_SMOOTHING', 0.5)
+        churn = rate if schedule.churn_per_hour is None else smoothing * rate + (1 - smoothing) * schedule.churn_per_hour
+        interval, reason = next_interval(schedule.interval_seconds, churn)
+        decision = (
+            f"변동 {changes}/{len(urls)} ({hours * 60:.0f}분), 시간당 {churn:.1f} → "
+            f"{_format_seconds(interval)} ({reason})"
+        )
+
+    schedule.press_name = press_name
+    schedule.interval_seconds = interval
+    schedule.next_due = now + timedelta(seconds=interval)
+    schedule.last_crawled = now
+    schedule.last_urls = urls
+    schedule.last_changes = min(changes, 32767)
+    schedule.churn_per_hour = churn
+    schedule.crawls += 1
+    schedule.failures = 0
+    schedule.last_decision = decision[:200]
+    schedule.save()
+    cache.delete(NEXT_DUE_CACHE_KEY)
+    logger.info(f"크롤링 주기 [{press_name}] {decision}")
+    return schedule
+
+
+def record_failure(press_code, press_name, now=None):
+    """
+    크롤링 실패(또는 기사 없음) - 연속 실패마다 주기를 두 배로 늘린 시각에 재시도
+
+    변동 기록(last_urls, last_crawled)은 그대로 두어 다음 성공 때 정상 비교한다.
+    기록이 없던 언론사는 첫 주기 뒤에 다시 시도한다.
+    """
+    now = now or timezone.now()
+    low, high = interval_bounds()
+    schedule = PressSchedule.objects.filter(press_code=press_code).first()
+    if schedule is None:
+        initial = min(max(_setting('CRAWL_INITIAL_INTERVAL_SECONDS', low), low), high)
+        schedule = PressSchedule(press_code=press_code, press_name=press_name, interval_seconds=initial)
+    schedule.failures = min(schedule.failures + 1, 32767)
+    # 주기(interval_seconds)는 그대로 두고 재시도 간격만 늘림 - 성공하면 원래 주기로 돌아감
+    interval = min(schedule.interval_seconds * 2 ** min(schedule.failures, 16), high)
+    schedule.next_due = now + timedelta(seconds=interval)
+    schedule.last_decision = f"실패 {schedule.failures}회 → {_format_seconds(interval)} 뒤 재시도"
+    schedule.save()
+    cache.delete(NEXT_DUE_CACHE_KEY)
+    logger.warning(f"크롤링 주기 [{press_name}] {schedule.last_decision}")
+    return schedule
+
+
+def refresh_due(crawled_time):
+    """
+    캐시된 스냅샷(crawled_time)을 캐시 만료 전에 새로 고쳐야 하는지
+
+    - 분산 모드: 더 최근에 공개된 크롤링이 있으면
+    - 적응형 주기: 크롤링 주기가 돌아온 언론사가 있으면
+    """
+    if _setting('CRAWL_SHARDING', False):
+        from .crawl_shards import latest_published_time
+
+        published = latest_published_time()
+        return published is not None and (crawled_time is None or published > crawled_time)
+    if not enabled():
+        return False
+    from crawling.press_registry import registry
+
+    return bool(due_codes(registry.codes()))
+
+
+def carry_over(previous_items, fresh_items, codes):
+    """
+    새로 크롤링한 기사 + 이번에 크롤링하지 않은 언론사의 직전 기사 (codes 순서)
+
+    previous_items/fresh_items는 NewsItem 또는 dict 목록.
+    """
+    fresh_codes = {item['company_code'] for item in fresh_items}
+    by_code = {}
+    for item in fresh_items:
+        by_code.setdefault(item['company_code'], []).append(item)
+    for item in previous_items:
+        if item['company_code'] not in fresh_codes:
+            by_code.setdefault(item['company_code'], []).append(item)
+    return [item for code in codes for item in by_code.get(code, ())]
+
+
+def schedule_status(codes, now=None):
+    """상태 화면용 언론사별 주기 (codes 순서, 기록 없는 언론사는 due=True)"""
+    from crawling.press_registry import registry
+
+    now = now or timezone.now()
+    schedules = load(codes)
+    rows = []
+    for code in codes:
+        schedule = schedules.get(code)
+        if schedule is None:
+            rows.append({'press_code': code, 'press_name': registry.name(code, code), 'due': True,
+                         'interval_seconds': None, 'next_due': None, 'last_crawled': None,
+                         'last_changes': None, 'churn_per_hour': None, 'crawls': 0, 'failures': 0,
+                         'decision': ''})
+            continue
+        rows.append({
+            'press_code': code,
+            'press_name': schedule.press_name,
+            'due': schedule.next_due <= now,
+            'interval_seconds': schedule.interval_seconds,
+            'next_due': schedule.next_due,
+            'last_crawled': schedule.last_crawled,
+            'last_changes': schedule.last_changes,
+            'churn_per_hour': round(schedule.churn_per_hour, 2) if schedule.churn_per_hour is not None else None,
+            'crawls': schedule.crawls,
+            'failures': schedule.failures,
+            'decision': schedule.last_decision,
+        })
+    return rows
@@ -0,0 +1,315 @@
+"""
+news/crawl_shards.py - 언론사 단위 분산 크롤링 (작업 테이블 + 임대)
+
+크롤러 하나가 Selenium 드라이버 하나로 언론사를 차례로 돌면 크롤링 시간이 언론사 수에
+비례한다. 분산 모드에서는 크롤링 1회를 CrawlRun으로 만들고 언론사마다 CrawlTask를 넣는다.
+여러 프로세스/호스트의 워커(python manage.py crawl_worker)가 같은 DB에서 작업을
+임대(lease)해 처리하고, 결과 기사를 작업 행에 기록한다.
+
+- 임대: 대기 중이거나 임대가 만료된 작업을 조건부 UPDATE(이전 상태/임대 값이 그대로일
+  때만)로 가져간다. 행 잠금(SELECT FOR UPDATE)을 쓰지 않으므로 SQLite에서도 동작하고,
+  두 워커가 같은 작업을 동시에 가져가지 않는다.
+- 실패/워커 중단: 실패는 시도 횟수가 남아 있으면 다시 대기로, 워커가 죽으면 임대가
+  만료된 뒤 다른 워커가 가져간다.
+- 공개: 코디네이터(python manage.py crawl_coordinator)가 모든 작업이 끝났거나 마감이
+  지나면 완료된 언론사 기사를 등록 순서대로 합쳐 CrawlRun.items로 공개한다.
+  마감까지 처리되지 않은 작업은 skipped로 남는다.
+- 적응형 주기 (news/crawl_schedule.py): 코디네이터는 주기가 돌아온 언론사만 작업으로 만들고,
+  공개할 때 완료된 언론사의 변동률을 기록하며 나머지 언론사는 직전 공개 스냅샷의 기사를 잇는다.
+- 변경 감지 (crawling/page_fetcher.py): 워커는 직전 공개 스냅샷의 기사를 넘겨 랭킹이 바뀌지
+  않은 언론사를 파싱 없이 끝내고(CrawlTask.unchanged), 공개 스냅샷은 직전과 같은 언론사를
+  CrawlRun.unchanged_presses로 알린다.
+
+웹 프로세스는 settings.CRAWL_SHARDING이 켜져 있으면 직접 크롤링하지 않고
+최근 공개된 스냅샷을 읽는다 (crawling/naver_news_crawler.py).
+"""
+
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import crawl_schedule
+from .instrumentation import stage
+from .models import CrawlRun, CrawlTask
+
+logger = logging.getLogger('crawling')
+
+TERMINAL_STATUSES = (CrawlTask.STATUS_DONE, CrawlTask.STATUS_FAILED, CrawlTask.STATUS_SKIPPED)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _json_ready(item):
+    """NewsItem → JSON 필드에 넣을 dict (datetime은 백업처럼 ISO 문자열)"""
+    data = item.to_dict() if hasattr(item, 'to_dict') else dict(item)
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in data.items()}
+
+
+# --- 크롤링 1회 생성 ---------------------------------------------------------------
+
+
+def due_presses():
+    """이번 크롤링 언론사 - 적응형 주기가 돌아왔거나 최근 공개 스냅샷에 없는 언론사 (재시도 대기 제외, 꺼져 있으면 전체)"""
+    from crawling.press_registry import registry
+
+    if not crawl_schedule.enabled():
+        return list(registry)
+    latest = latest_published()
+    present = {item['company_code'] for item in latest.items} if latest else set()
+    codes = registry.codes()
+    due = set(crawl_schedule.due_codes(codes, missing=[code for code in codes if code not in present]))
+    return [press for press in registry if press.code in due]
+
+
+def start_run(presses=None, deadline_seconds=None):
+    """언론사별 작업을 가진 CrawlRun 생성 (presses: Press 목록, 기본은 설정된 언론사 전체)"""
+    from crawling.press_registry import registry
+
+    presses = list(presses or registry)
+    now = timezone.now()
+    run = CrawlRun.objects.create(
+        started_at=now,
+        deadline=now + timedelta(seconds=deadline_seconds or _setting('CRAWL_DEADLINE_SECONDS', 600)),
+        press_count=len(presses),
+    )
+    CrawlTask.objects.bulk_create([
+        CrawlTask(run=run, press_code=press.code, press_name=press.name) for press in presses
+    ])
+    logger.info(f"분산 크롤링 #{run.pk} 시작: 언론사 {len(presses)}곳")
+    return run
+
+
+# --- 워커 쪽: 임대 / 완료 / 실패 ----------------------------------------------------
+
+
+def lease_task(worker_id, lease_seconds=None, now=None):
+    """
+    처리할 작업 하나를 임대 (없으면 None)
+
+    진행 중이고 마감 전인 크롤링의 대기 작업 또는 임대가 만료된 작업 중 먼저 시작한
+    크롤링, 시도 횟수가 적은 작업부터 고른다.
+    """
+    now = now or timezone.now()
+    lease_seconds = lease_seconds or _setting('CRAWL_LEASE_SECONDS', 180)
+    candidates = (
+        CrawlTask.objects
+        .filter(run__status=CrawlRun.STATUS_RUNNING, run__deadline__gt=now,
+                attempts__lt=_setting('CRAWL_MAX_ATTEMPTS', 3))
+        .filter(Q(status=CrawlTask.STATUS_PENDING) | Q(status=CrawlTask.STATUS_LEASED, lease_expires__lte=now))
+        .order_by('run__started_at', 'attempts', 'id')
+        .values('id', 'status', 'lease_owner', 'lease_expires')[:20]
+    )
+    for candidate in candidates:
+        # 다른 워커가 먼저 가져갔으면 조건이 맞지 않아 0행 갱신 → 다음 후보
+        leased = CrawlTask.objects.filter(**candidate).update(
+            status=CrawlTask.STATUS_LEASED,
+            lease_owner=worker_id,
+            lease_expires=now + timedelta(seconds=lease_seconds),
+            attempts=F('attempts') + 1,
+        )
+        if leased:
+            return CrawlTask.objects.select_related('run').get(pk=candidate['id'])
+    return None
+
+
+def _owned(task, worker_id):
+    """아직 이 워커가 임대 중인 작업만 (임대가 만료돼 다른 워커가 가져갔으면 0행)"""
+    return CrawlTask.objects.filter(pk=task.pk, status=CrawlTask.STATUS_LEASED, lease_owner=worker_id)
+
+
+def complete_task(task, worker_id, items, unchanged=False):
+    """수집 기사 기록 - 임대를 잃었으면 False (다른 워커의 결과를 덮어쓰지 않음)"""
+    return bool(_owned(task, worker_id).update(
+        status=CrawlTask.STATUS_DONE,
+        items=[_json_ready(item) for item in items],
+        unchanged=unchanged,
+        error='',
+        lease_expires=None,
+        finished_at=timezone.now(),
+    ))
+
+
+def fail_task(task, worker_id, error):
+    """실패 기록 - 시도 횟수가 남아 있으면 다시 대기, 아니면 failed"""
+    retry = task.attempts < _setting('CRAWL_MAX_ATTEMPTS', 3)
+    return bool(_owned(task, worker_id).update(
+        status=CrawlTask.STATUS_PENDING if retry else CrawlTask.STATUS_FAILED,
+        error=str(error)[:2000],
+        lease_owner='',
+        lease_expires=None,
+        finished_at=None if retry else timezone.now(),
+    ))
+
+
+def run_worker(crawler, worker_id=None, lease_seconds=None, max_tasks=None, idle_exit=None,
+               poll_interval=2.0):
+    """
+    작업을 임대해 crawler.crawl_news_ranking(code, previous=직전 기사)로 처리하는 루프
+
+    드라이버는 크롤러가 필요할 때 만들어 작업 사이에 재사용하고, 크롤링이 예외로 끝나면 닫는다.
+    idle_exit초 동안 작업이 없으면 종료 (None이면 계속 대기). 처리한 작업 수 반환.
+    """
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    idle_since = time.monotonic()
+    published_at, previous_by_code = None, {}
+    try:
+        while max_tasks is None or processed < max_tasks:
+            task = lease_task(worker_id, lease_seconds)
+            if task is None:
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            # 직전 공개 스냅샷의 언론사별 기사 (새로 공개됐을 때만 다시 읽음)
+            latest_time = latest_published_time()
+            if latest_time != published_at:
+                published_at, previous_by_code = latest_time, {}
+                latest = latest_published()
+                for item in latest.items if latest else ():
+                    previous_by_code.setdefault(item['company_code'], []).append(item)
+
+            try:
+                crawler.unchanged_presses.discard(task.press_code)
+                with stage('press_fetch', press_code=task.press_code, press_name=task.press_name,
+                           run=task.run_id, worker=worker_id) as press_stage:
+                    items = crawler.crawl_news_ranking(task.press_code, previous=previous_by_code.get(task.press_code))
+                    unchanged = task.press_code in crawler.unchanged_presses
+                    press_stage.set(articles=len(items or []), unchanged=unchanged)
+                if items:
+                    if not complete_task(task, worker_id, items, unchanged):
+                        logger.warning(f"임대 만료로 결과 버림: {task}")
+                else:
+                    fail_task(task, worker_id, '수집된 기사 없음')
+            except Exception as e:
+                logger.error(f"언론사 크롤링 실패 ({task.press_code}): {str(e)}")
+                fail_task(task, worker_id, e)
+                crawler.close_driver()
+            processed += 1
+            idle_since = time.monotonic()
+    finally:
+        crawler.close_driver()
+    return processed
+
+
+# --- 코디네이터 쪽: 공개 -----------------------------------------------------------
+
+
+def publish_run(run, now=None):
+    """
+    완료된 언론사 기사를 합쳐 공개 (남은 작업은 skipped)
+
+    이번에 크롤링하지 않았거나 실패한 언론사는 직전 공개 스냅샷의 기사를 잇는다.
+    다른 코디네이터가 먼저 공개했으면 False.
+    """
+    from crawling.press_registry import registry
+
+    now = now or timezone.now()
+    tasks = list(run.tasks.order_by('id'))
+    done = [task for task in tasks if task.status == CrawlTask.STATUS_DONE]
+    items = [item for task in done for item in task.items]
+    completed = len(done)
+    unchanged = {task.press_code for task in done if task.unchanged}
+    previous = latest_published()
+    if previous is not None:
+        codes = list(dict.fromkeys([*registry.codes(), *(task.press_code for task in tasks)]))
+        items = crawl_schedule.carry_over(previous.items, items, codes)
+        done_codes = {task.press_code for task in done}
+        unchanged |= {item['company_code'] for item in previous.items} - done_codes
+
+    published = CrawlRun.objects.filter(pk=run.pk, status=CrawlRun.STATUS_RUNNING).update(
+        status=CrawlRun.STATUS_PUBLISHED,
+        crawled_time=now,
+        items=items,
+        completed_count=completed,
+        unchanged_presses=sorted(unchanged),
+    )
+    if not published:
+        return False
+    run.tasks.exclude(status__in=TERMINAL_STATUSES).update(
+        status=CrawlTask.STATUS_SKIPPED, lease_owner='', lease_expires=None
+    )
+    run.refresh_from_db()
+    if crawl_schedule.enabled():
+        for task in tasks:
+            if task in done and task.items:
+                crawl_schedule.record_crawl(task.press_code, task.press_name, task.items, task.finished_at or now)
+            else:
+                # 실패/마감으로 건너뛴 언론사는 재시도 간격을 늘려 매 크롤링마다 다시 넣지 않음
+                crawl_schedule.record_failure(task.press_code, task.press_name, now)
+    logger.info(
+        f"분산 크롤링 #{run.pk} 공개: 언론사 {completed}/{run.press_count}곳, 기사 {len(items)}건"
+    )
+    prune_runs()
+    return True
+
+
+def publish_ready_runs(now=None):
+    """모든 작업이 끝났거나 마감이 지난 진행 중 크롤링을 공개하고 공개한 목록 반환"""
+    now = now or timezone.now()
+    max_attempts = _setting('CRAWL_MAX_ATTEMPTS', 3)
+    published = []
+    for run in CrawlRun.objects.filter(status=CrawlRun.STATUS_RUNNING).order_by('started_at'):
+        # 시도 횟수를 다 쓴 채 임대가 만료된 작업은 더 임대되지 않으므로 실패로 정리
+        run.tasks.filter(
+            status=CrawlTask.STATUS_LEASED, lease_expires__lte=now, attempts__gte=max_attempts
+        ).update(status=CrawlTask.STATUS_FAILED, error='임대 만료', lease_owner='', lease_expires=None)
+
+        finished = not run.tasks.exclude(status__in=TERMINAL_STATUSES).exists()
+        if (finished or run.deadline <= now) and publish_run(run, now):
+            published.append(run)
+    return published
+
+
+def latest_published():
+    """가장 최근에 공개된 (기사가 있는) 크롤링 - 없으면 None"""
+    return (
+        CrawlRun.objects
+        .filter(status=CrawlRun.STATUS_PUBLISHED, completed_count__gt=0)
+        .order_by('-crawled_time')
+        .first()
+    )
+
+
+def latest_published_time():
+    """가장 최근 공개 시각만 조회 (기사 JSON은 읽지 않음)"""
+    return (
+        CrawlRun.objects
+        .filter(status=CrawlRun.STATUS_PUBLISHED, completed_count__gt=0)
+        .order_by('-crawled_time')
+        .values_list('crawled_time', flat=True)
+        .first()
+    )
+
+
+def prune_runs(keep=None):
+    """최근 keep회만 남기고 공개된 크롤링 삭제 (작업은 CASCADE)"""
+    keep = keep or _setting('CRAWL_RUN_KEEP', 48)
+    stale = list(
+        CrawlRun.objects.filter(status=CrawlRun.STATUS_PUBLISHED)
+        .order_by('-crawled_time').values_list('pk', flat=True)[keep:]
+    )
+    if stale:
+        CrawlRun.objects.filter(pk__in=stale).delete()
+    return len(stale)
+
+
+def run_status(run):
+    """작업 상태별 개수 {'pending': 3, 'done': 7, ...}"""
+    counts = dict.fromkeys((status for status, _ in CrawlTask.STATUS_CHOICES), 0)
+    for status in run.tasks.values_list('status', flat=True):
+        counts[status] += 1
+    return counts
@@ -0,0 +1,142 @@
+"""
+news/dedupe.py - 언론사 간 유사 제목(통신사 기사 등) 묶기
+
+제목을 정규화해 문자 n-gram 집합으로 만들고 MinHash 서명을 구한 뒤,
+LSH 밴드 버킷으로 후보 쌍만 비교한다. 전체 쌍 비교(O(n²)) 없이
+기사 수에 선형으로 클러스터 id를 붙인다.
+
+- 같은 클러스터: 추정 Jaccard 유사도 >= threshold 인 쌍을 Union-Find로 연결
+- cluster_id: 클러스터 대표 기사(가장 높은 순위)의 입력 목록 내 위치
+"""
+
+import re
+from functools import lru_cache
+
+import mmh3
+
+NGRAM_SIZE = 2          # 한글 제목은 음절 2-gram이 3-gram보다 변형(조사·어미)에 덜 민감
+NUM_PERM = 96
+BANDS = 32              # 32밴드 × 3행 → 유사도 약 0.3부터 후보로 잡힘
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.4
+
+MASK_SEED = 20250121
+
+
+_TAG_PATTERN = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】')
+_NOISE_PATTERN = re.compile(r'[^\w]+')
+
+
+def normalize_title(title):
+    """[속보]·(종합) 같은 머리표와 공백·문장부호 제거"""
+    title = _TAG_PATTERN.sub('', title or '')
+    return _NOISE_PATTERN.sub('', title).lower()
+
+
+@lru_cache(maxsize=1)
+def _masks():
+    """고정 시드로 만든 순열 마스크 (프로세스가 달라도 같은 서명, numpy는 처음 쓸 때 로드)"""
+    import numpy as np
+    return np.random.default_rng(MASK_SEED).integers(0, 2**63, size=NUM_PERM, dtype=np.uint64)
+
+
+def _shingles(text, size=NGRAM_SIZE):
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(title):
+    """제목의 MinHash 서명 (길이 NUM_PERM의 uint64 배열, 빈 제목이면 None)"""
+    import numpy as np
+
+    shingles = _shingles(normalize_title(title))
+    if not shingles:
+        return None
+    hashes = np.fromiter(
+        (mmh3.hash64(shingle, signed=False)[0] for shingle in shingles),
+        dtype=np.uint64, count=len(shingles)
+    )
+    # XOR 마스크를 순열 대신 사용: 각 행의 최솟값이 한 개의 MinHash 값
+    return np.bitwise_xor.outer(_masks(), hashes).min(axis=1)
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_titles(titles, threshold=DEFAULT_THRESHOLD):
+    """
+    제목 목록의 클러스터 id 목록
+
+    Args:
+        titles: 제목 문자열 목록 (우선순위가 높은 것이 앞에 오도록 정렬해 전달)
+        threshold: 같은 클러스터로 볼 최소 추정 Jaccard 유사도
+
+    Returns:
+        list[int]: titles와 같은 길이, 각 제목이 속한 클러스터 대표의 위치
+    """
+    import numpy as np
+
+    signatures = [minhash_signature(title) for title in titles]
+    parent = list(range(len(titles)))
+
+    buckets = {}
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for band in range(BANDS):
+            key = (band, signature[band * ROWS:(band + 1) * ROWS].tobytes())
+            buckets.setdefault(key, []).append(i)
+
+    # 버킷 안의 모든 쌍을 비교 (첫 제목과만 비교하면 첫 제목과 무관한 유사 쌍을 놓침, 버킷은 작음)
+    checked = set()
+    for members in buckets.values():
+        for start, first in enumerate(members, 1):
+            for other in members[start:]:
+                if (first, other) in checked:
+                    continue
+                checked.add((first, other))
+                similarity = np.count_nonzero(signatures[first] == signatures[other]) / NUM_PERM
+                if similarity >= threshold:
+                    root_a, root_b = _find(parent, first), _find(parent, other)
+                    if root_a != root_b:
+                        # 앞선(우선순위 높은) 제목이 대표가 되도록 작은 위치를 루트로
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return [_find(parent, i) for i in range(len(titles))]
+
+
+def assign_clusters(news_items, threshold=DEFAULT_THRESHOLD):
+    """
+    기사 목록에 cluster_id를 붙여 반환 (순위가 높은 기사가 클러스터 대표)
+
+    cluster_id는 news_items 내 대표 기사의 위치다.
+    """
+    order = sorted(range(len(news_items)), key=lambda i: (news_items[i].get('rank') or 999, i))
+    cluster_ids = cluster_titles([news_items[i]['title'] for i in order], threshold)
+    for position, index in enumerate(order):
+        item = news_items[index]
+        if isinstance(item, dict):
+            item['cluster_id'] = order[cluster_ids[position]]
+        else:
+            item.cluster_id = order[cluster_ids[position]]
+    return news_items
+
+
+def unique_by_cluster(items):
+    """클러스터별 첫 기사만 남김 (cluster_id가 없으면 제목 기준)"""
+    seen = set()
+    unique = []
+    for item in items:
+        key = item.get('cluster_id')
+        if key is None:
+            key = item.get('title')
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
@@ -0,0 +1,287 @@
+"""
+news/fake_openai.py - 벤치마크용 로컬 OpenAI 호환 서버
+
+실제 OpenAI를 호출하지 않고 요약/분석 파이프라인의 지연과 처리량을 재기 위한 가짜 서버.
+AsyncOpenAI(base_url=...)가 그대로 붙을 수 있도록 /v1/chat/completions 형식을 따른다.
+
+- 지연 분포: 첫 토큰까지의 시간 (fixed / uniform / normal / lognormal)
+- 토큰 속도: 응답 토큰을 초당 tokens_per_second로 내보냄 (stream=True면 SSE 청크로)
+- 준비된 응답: 시스템/사용자 프롬프트에 포함된 문구로 응답 선택
+- 오류 주입: error_rate 비율로 429 응답 (스케줄러 재시도 확인용)
+- 기사 페이지: GET /article/<...> 는 #dic_area 본문이 있는 HTML (본문 수집 경로 대체)
+
+사용법:
+    server = FakeOpenAIServer(latency='lognormal:0.6,0.4', tokens_per_second=80)
+    server.start()   # 백그라운드 스레드
+    ... settings.LLM_BASE_URL = server.base_url ...
+    server.stop()
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from statistics import median
+
+import orjson
+
+from .prompting import count_tokens
+
+logger = logging.getLogger('news')
+
+# (프롬프트에 포함된 문구, 응답) - 앞에서부터 처음 일치하는 응답 사용
+DEFAULT_RESPONSES = [
+    ('3줄로 요약', (
+        "정부가 관련 대책을 발표하며 후속 조치에 나섰다.\n"
+        "여야는 대책의 실효성을 두고 엇갈린 평가를 내놓았다.\n"
+        "전문가들은 구체적인 이행 계획이 필요하다고 지적했다."
+    )),
+    ('보도 방식을 정리', (
+        "이 언론사는 정부 발표 내용을 전면에 내세웠다.\n"
+        "정책의 배경과 기대 효과를 강조하는 프레임을 사용했다.\n"
+        "'신속한 대응', '후속 조치' 같은 표현을 반복했다."
+    )),
+    ('세 단계로 분석', (
+        "1. 보도 관점 분석\n보수 성향 언론은 정책 성과를, 진보 성향 언론은 절차 문제를 부각했다.\n\n"
+        "2. 주요 쟁점 분석\n쟁점 1: 대책의 실효성, 쟁점 2: 재원 마련 방안을 두고 시각이 갈렸다.\n\n"
+        "3. 종합 분석\n두 진영 모두 후속 조치의 필요성에는 동의하나 강조점이 다르다."
+    )),
+    ('트렌드', (
+        "**1. 트렌드:** 정책 발표와 정치권 반응이 주요 뉴스를 차지했다.\n"
+        "**2. 관계:** 정책 키워드와 정당 키워드가 함께 등장하는 기사가 많다.\n"
+        "**3. 인사이트:** 언론사별로 같은 사안을 다른 프레임으로 다루고 있다."
+    )),
+]
+DEFAULT_CONTENT = "분석 결과입니다. 주요 언론사들은 같은 사안을 서로 다른 관점에서 보도했다."
+
+ARTICLE_TEMPLATE = """<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body><article id="dic_area">{body}</article></body></html>"""
+ARTICLE_BODY = (
+    "정부는 이날 관계부처 합동 브리핑을 열고 관련 대책을 발표했다. "
+    "대책에는 단계별 이행 계획과 재원 마련 방안이 포함됐다. "
+    "여당은 신속한 대응이라고 평가했지만 야당은 실효성이 의문이라고 반박했다. "
+    "전문가들은 구체적인 후속 조치가 뒤따라야 한다고 지적했다. "
+) * 6
+
+
+def parse_latency(spec):
+    """
+    지연 분포 문자열 → 초 단위 샘플 함수
+
+    fixed:0.5 | uniform:0.2,1.0 | normal:0.6,0.2 | lognormal:0.6,0.4 (중앙값, 시그마)
+    """
+    name, _, args = spec.partition(':')
+    values = [float(v) for v in args.split(',') if v] if args else []
+    if name == 'fixed':
+        value = values[0] if values else 0.0
+        return lambda rng: value
+    if name == 'uniform':
+        low, high = values
+        return lambda rng: rng.uniform(low, high)
+    if name == 'normal':
+        mean, std = values
+        return lambda rng: max(0.0, rng.gauss(mean, std))
+    if name == 'lognormal':
+        median_seconds, sigma = values
+        mu = math.log(median_seconds)
+        return lambda rng: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+
+class FakeOpenAIServer:
+    def __init__(self, host='127.0.0.1', port=0, latency='fixed:0', tokens_per_second=0,
+                 responses=None, error_rate=0.0, seed=None):
+        """
+        Args:
+            port: 0이면 빈 포트 자동 할당 (base_url로 확인)
+            latency: 첫 토큰까지의 지연 분포 (parse_latency 형식)
+            tokens_per_second: 응답 토큰 속도 (0이면 지연 없이 한 번에)
+            responses: [(문구, 응답)] - DEFAULT_RESPONSES 앞에 우선 적용
+            error_rate: 429 응답 비율 (0~1)
+        """
+        self.sample_latency = parse_latency(latency)
+        self.tokens_per_second = tokens_per_second
+        self.responses = list(responses or []) + DEFAULT_RESPONSES
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.completion_tokens = 0
+        self.latencies = []
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def article_base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/article"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fake-openai', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self):
+        with self.stats_lock:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'completion_tokens': self.completion_tokens,
+                'latency_p50_ms': round(median(self.latencies) * 1000, 1) if self.latencies else 0.0,
+            }
+
+    # ----- 응답 구성 -----
+    def _pick_response(self, messages):
+        prompt = '\n'.join(message.get('content') or '' for message in messages)
+        for phrase, content in self.responses:
+            if phrase in prompt:
+                return content
+        return DEFAULT_CONTENT
+
+    def _plan(self, body):
+        """(지연 초, 응답 본문, finish_reason, 오류 여부)"""
+        with self.rng_lock:
+            latency = self.sample_latency(self.rng)
+            failed = self.rng.random() < self.error_rate
+        content = self._pick_response(body.get('messages', []))
+        finish_reason = 'stop'
+        max_tokens = body.get('max_tokens')
+        model = body.get('model', 'gpt-3.5-turbo')
+        if max_tokens and count_tokens(content, model) > max_tokens:
+            content = content[:max_tokens]
+            finish_reason = 'length'
+        return latency, content, finish_reason, failed
+
+    def _record(self, latency, tokens, failed):
+        with self.stats_lock:
+            self.requests += 1
+            self.errors += failed
+            self.completion_tokens += tokens
+            self.latencies.append(latency)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                logger.debug(f"fake-openai {self.address_string()} {format % args}")
+
+            def _send_json(self, status, payload):
+                data = orjson.dumps(payload)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.startswith('/article/'):
+                    html = ARTICLE_TEMPLATE.format(title=self.path, body=ARTICLE_BODY).encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(html)))
+                    self.end_headers()
+                    self.wfile.write(html)
+                elif self.path.rstrip('/') == '/v1/models':
+                    self._send_json(200, {'object': 'list', 'data': [
+                        {'id': 'gpt-3.5-turbo', 'object': 'model', 'owned_by': 'fake'},
+                        {'id': 'gpt-3.5-turbo-16k', 'object': 'model', 'owned_by': 'fake'},
+                    ]})
+                else:
+                    self._send_json(404, {'error': {'message': 'not found'}})
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/v1/chat/completions':
+                    self._send_json(404, {'error': {'message': 'not found'}})
+                    return
+                body = orjson.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                latency, content, finish_reason, failed = server._plan(body)
+                model = body.get('model', 'gpt-3.5-turbo')
+                time.sleep(latency)
+
+                if failed:
+                    server._record(latency, 0, True)
+                    self._send_json(429, {'error': {
+                        'message': 'Rate limit reached (fake)', 'type': 'rate_limit_error', 'code': 'rate_limit_exceeded',
+                    }})
+                    return
+
+                prompt_tokens = sum(count_tokens(m.get('content') or '', model) for m in body.get('messages', []))
+                completion_tokens = count_tokens(content, model)
+                server._record(latency, completion_tokens, False)
+                completion_id = f"chatcmpl-fake-{uuid.uuid4().hex[:12]}"
+
+                if body.get('stream'):
+                    self._stream(completion_id, model, content, finish_reason)
+                    return
+
+                if server.tokens_per_second:
+                    time.sleep(completion_tokens / server.tokens_per_second)
+                self._send_json(200, {
+                    'id': completion_id,
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': model,
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': content},
+                        'finish_reason': finish_reason,
+                    }],
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens,
+                    },
+                })
+
+            def _stream(self, completion_id, model, content, finish_reason):
+                """토큰 속도에 맞춰 SSE 청크 전송 (한글은 글자 단위로 근사)"""
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+
+                def chunk(delta, finish=None):
+                    payload = orjson.dumps({
+                        'id': completion_id,
+                        'object': 'chat.completion.chunk',
+                        'created': int(time.time()),
+                        'model': model,
+                        'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish}],
+                    })
+                    self.wfile.write(b'data: ' + payload + b'\n\n')
+                    self.wfile.flush()
+
+                interval = 1 / server.tokens_per_second if server.tokens_per_second else 0
+                chunk({'role': 'assistant', 'content': ''})
+                for piece in content:
+                    chunk({'content': piece})
+                    if interval:
+                        time.sleep(interval)
+                chunk({}, finish_reason)
+                self.wfile.write(b'data: [DONE]\n\n')
+                self.wfile.flush()
+
+        return Handler
@@ -0,0 +1,133 @@
+"""
+news/ingest.py - 크롤링 결과를 Article/Keyword 모델에 일괄 저장
+
+크롤링 1회(약 100건)를 기사별 save() 대신 몇 개의 쿼리로 저장한다.
+1. Article: URL unique 인덱스 기준 bulk_create(update_conflicts=True) 업서트
+2. Keyword: bulk_create(ignore_conflicts=True) 후 id 조회
+3. 기사-키워드 연결: through 테이블에 직접 bulk 삭제/삽입
+"""
+
+import logging
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Article, Keyword
+
+logger = logging.getLogger('news')
+
+ARTICLE_UPDATE_FIELDS = ['title', 'source', 'press_name', 'rank', 'published_at', 'updated_at']
+BATCH_SIZE = 500
+
+
+def _truncate(value, field_name, model=Article):
+    max_length = model._meta.get_field(field_name).max_length
+    value = value or ''
+    return value[:max_length] if max_length else value
+
+
+def _published_at(crawled_at, crawled_time):
+    """
+    기사 수집 시각 (timezone-aware)
+
+    크롤러의 crawled_at은 시스템 로컬 시각의 naive datetime(백업에서는 ISO 문자열)이므로
+    로컬 시간대로 해석한다. 그대로 저장하면 UTC로 간주되어 시간대 차이만큼 어긋난다.
+    """
+    if isinstance(crawled_at, str):
+        try:
+            crawled_at = datetime.fromisoformat(crawled_at)
+        except ValueError:
+            crawled_at = None
+    if not isinstance(crawled_at, datetime):
+        return crawled_time
+    return crawled_at.astimezone() if timezone.is_naive(crawled_at) else crawled_at
+
+
+def _build_articles(news_items, crawled_time):
+    """URL 기준으로 중복 제거한 Article 인스턴스 목록 (같은 URL은 상위 순위 우선)"""
+    articles = {}
+    for item in sorted(news_items, key=lambda x: x.get('rank') or 999):
+        url = item.get('url')
+        if not url or url in articles:
+            continue
+        press_name = item.get('company_name') or ''
+        articles[url] = Article(
+            title=_truncate(item.get('title'), 'title'),
+            url=url,
+            source=_truncate(press_name, 'source'),
+            press_name=_truncate(press_name, 'press_name'),
+            rank=item.get('rank'),
+            published_at=_published_at(item.get('crawled_at'), crawled_time),
+        )
+    return list(articles.values())
+
+
+def _link_keywords(article_ids, keyword_rankings):
+    """
+    키워드 순위의 키워드를 제목에 포함한 기사와 연결
+
+    Args:
+        article_ids: {url: (article_id, title)}
+        keyword_rankings: extract_keywords() 결과 [(키워드, 빈도, 관련 그룹), ...]
+    """
+    names = [keyword for keyword, _, _ in keyword_rankings]
+    if not names:
+        return 0
+
+    Keyword.objects.bulk_create(
+        [Keyword(name=_truncate(name, 'name', Keyword)) for name in names],
+        ignore_conflicts=True,
+        batch_size=BATCH_SIZE,
+    )
+    keyword_ids = dict(Keyword.objects.filter(name__in=names).values_list('name', 'id'))
+
+    Through = Article.keywords.through
+    links = [
+        Through(article_id=article_id, keyword_id=keyword_ids[name])
+        for article_id, title in article_ids.values()
+        for name in names
+        if name in keyword_ids and name in title
+    ]
+
+    # 이번 크롤링 기사들의 기존 연결을 교체 (한 번의 DELETE)
+    Through.objects.filter(article_id__in=[article_id for article_id, _ in article_ids.values()]).delete()
+    Through.objects.bulk_create(links, ignore_conflicts=True, batch_size=BATCH_SIZE)
+    return len(links)
+
+
+def ingest_news_items(news_items, crawled_time, keyword_rankings=()):
+    """
+    크롤링 결과를 DB에 업서트
+
+    Args:
+        news_items: NewsItem(또는 dict) 목록
+        crawled_time: 크롤링 시각 (published_at 기본값)
+        keyword_rankings: 기사와 연결할 키워드 순위
+
+    Returns:
+        dict: {'articles': 저장 기사 수, 'links': 키워드 연결 수}
+    """
+    articles = _build_articles(news_items, crawled_time)
+    if not articles:
+        return {'articles': 0, 'links': 0}
+
+    with transaction.atomic():
+        Article.objects.bulk_create(
+            articles,
+            update_conflicts=True,
+            unique_fields=['url'],
+            update_fields=ARTICLE_UPDATE_FIELDS,
+            batch_size=BATCH_SIZE,
+        )
+        # 업서트는 백엔드에 따라 pk를 돌려주지 않으므로 URL로 한 번에 조회
+        article_ids = {
+            url: (article_id, title)
+            for url, article_id, title in Article.objects.filter(
+                url__in=[article.url for article in articles]
+            ).values_list('url', 'id', 'title')
+        }
+        link_count = _link_keywords(article_ids, keyword_rankings)
+
+    logger.info(f"기사 DB 저장 완료: 기사 {len(article_ids)}건, 키워드 연결 {link_count}건")
+    return {'articles': len(article_ids), 'links': link_count}
@@ -0,0 +1,249 @@
+"""
+news/instrumentation.py - 요청 단계별 시간 측정
+
+with stage('crawl'): ... 로 감싼 구간의 시간을
+1. 현재 요청의 Server-Timing 응답 헤더 (ServerTimingMiddleware)
+2. 프로세스 전체 히스토그램 (/metrics, Prometheus 텍스트 형식)
+3. OpenTelemetry 스팬 (settings.TRACING으로 내보내기를 켠 경우, news/tracing.py)
+에 함께 기록한다.
+
+요청 밖(크론, 관리 명령)에서도 stage()를 쓸 수 있으며 이 경우 Server-Timing 없이 기록된다.
+히스토그램은 프로세스별로 유지되므로 gunicorn 워커가 여럿이면 워커마다 따로 수집된다.
+스레드 풀로 넘기는 작업은 in_current_context()로 감싸야 부모 스팬/요청 타이밍이 이어진다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from opentelemetry import context as otel_context
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+# 초 단위 버킷 - 캐시 조회(ms)부터 Selenium 크롤링(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+_request_timings = ContextVar('request_timings', default=None)
+# 내보내기를 설정하지 않으면 API 기본값(기록하지 않는 스팬)이라 비용이 거의 없음
+_tracer = trace.get_tracer('newsdocs')
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램 (스레드 안전)"""
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}  # 레이블 값 튜플 → [버킷별 개수..., 합계, 개수]
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            labels = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+            for bound, count in zip(self.buckets, series):
+                bucket_labels = ','.join(labels + [f'le="{bound}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {count}")
+            bucket_labels = ','.join(labels + ['le="+Inf"'])
+            lines.append(f"{self.name}_bucket{{{bucket_labels}}} {series[-1]}")
+            label_text = '{' + ','.join(labels) + '}' if labels else ''
+            lines.append(f"{self.name}_sum{label_text} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{label_text} {series[-1]}")
+        return '\n'.join(lines)
+
+
+REQUEST_SECONDS = Histogram(
+    'newsdocs_request_duration_seconds', '뷰별 요청 처리 시간', ('view', 'method', 'status')
+)
+STAGE_SECONDS = Histogram(
+    'newsdocs_stage_duration_seconds', '단계별 처리 시간 (크롤링, 토큰화, LLM, 렌더링 등)', ('stage',)
+)
+REGISTRY = (REQUEST_SECONDS, STAGE_SECONDS)
+
+
+def record_stage(name, seconds):
+    """이미 잰 시간을 단계로 기록 (반복문 안에서 누적한 시간 등)"""
+    STAGE_SECONDS.observe(seconds, stage=name)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.append((name, seconds))
+
+
+def _span_attributes(attributes):
+    """None은 빼고, OTel이 받지 않는 타입은 문자열로"""
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items() if value is not None
+    }
+
+
+class Stage:
+    """시작한 구간 - 끝낼 때 시간 기록과 스팬 종료 (stage()/start_stage()가 반환)"""
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.span = _tracer.start_span(name, attributes=_span_attributes(attributes))
+        self._token = otel_context.attach(trace.set_span_in_context(self.span))
+        self.started = time.perf_counter()
+
+    def set(self, **attributes):
+        self.span.set_attributes(_span_attributes(attributes))
+
+    def end(self, error=None):
+        seconds = time.perf_counter() - self.started
+        if error is not None:
+            self.span.record_exception(error)
+            self.span.set_status(Status(StatusCode.ERROR, str(error)))
+        otel_context.detach(self._token)
+        self.span.end()
+        record_stage(self.name, seconds)
+        return seconds
+
+
+def start_stage(name, **attributes):
+    """with 블록으로 감싸기 어려운 구간용 - 같은 함수 안에서 end()를 호출할 것"""
+    return Stage(name, attributes)
+
+
+@contextmanager
+def stage(name, **attributes):
+    """구간 시간 측정 + 스팬 - 예외가 나도 기록"""
+    current = Stage(name, attributes)
+    try:
+        yield current
+    except BaseException as e:
+        current.end(e)
+        raise
+    else:
+        current.end()
+
+
+def annotate(**attributes):
+    """현재 스팬(stage/timed 구간)에 속성 추가"""
+    trace.get_current_span().set_attributes(_span_attributes(attributes))
+
+
+def in_current_context(func):
+    """
+    스레드 풀에 넘길 함수를 감싸 제출 시점의 컨텍스트(부모 스팬, 요청 타이밍)에서 실행
+
+    호출마다 컨텍스트 복사본을 쓰므로 여러 스레드에서 동시에 실행해도 된다.
+    """
+    parent = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        return parent.copy().run(func, *args, **kwargs)
+    return run
+
+
+def timed(name):
+    """함수 전체를 stage(name)으로 감싸는 데코레이터 (동기/비동기 함수 모두 지원)"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def server_timing_header(timings, total):
+    """같은 이름의 단계는 합산, 여러 번이면 desc에 횟수 표시"""
+    totals = {}
+    counts = {}
+    for name, seconds in timings:
+        totals[name] = totals.get(name, 0.0) + seconds
+        counts[name] = counts.get(name, 0) + 1
+    entries = []
+    for name, seconds in totals.items():
+        entry = f"{name};dur={seconds * 1000:.1f}"
+        if counts[name] > 1:
+            entry += f';desc="{counts[name]}x"'
+        entries.append(entry)
+    entries.append(f"total;dur={total * 1000:.1f}")
+    return ', '.join(entries)
+
+
+class ServerTimingMiddleware:
+    """요청별 단계 시간을 Server-Timing 헤더로 내보내고 요청 시간 히스토그램에 기록"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _request_timings.set([])
+        started = time.perf_counter()
+        # 상위 서비스가 보낸 traceparent가 있으면 이어서 기록
+        with _tracer.start_as_current_span(
+            f"{request.method} {request.path}",
+            context=propagate.extract(request.headers),
+            kind=SpanKind.SERVER,
+            attributes={'http.request.method': request.method, 'url.path': request.path},
+        ) as span:
+            try:
+                response = self.get_response(request)
+                total = time.perf_counter() - started
+                response['Server-Timing'] = server_timing_header(_request_timings.get(), total)
+            finally:
+                _request_timings.reset(token)
+
+            match = getattr(request, 'resolver_match', None)
+            view_name = match.view_name if match else 'unmatched'
+            span.update_name(f"{request.method} {view_name}")
+            span.set_attribute('http.route', view_name)
+            span.set_attribute('http.response.status_code', response.status_code)
+
+        REQUEST_SECONDS.observe(total, view=view_name, method=request.method, status=response.status_code)
+        return response
+
+
+def _metrics_allowed(request):
+    """허용 IP(METRICS_ALLOWED_IPS) 또는 Bearer 토큰(METRICS_TOKEN)이 맞는 요청"""
+    if request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ('127.0.0.1', '::1')):
+        return True
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    return bool(token) and hmac.compare_digest(authorization.encode(), f'Bearer {token}'.encode())
+
+
+def metrics(request):
+    """Prometheus 텍스트 형식 지표 (허용되지 않은 요청에는 존재를 드러내지 않고 404)"""
+    if not _metrics_allowed(request):
+        raise Http404
+    body = '\n'.join(histogram.render() for histogram in REGISTRY) + '\n'
+    return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,227 @@
+"""
+news/keyword_ranker.py - 크롤링 사이에 유지되는 증분 키워드 랭킹
+
+extract_keywords()는 크롤링마다 모든 제목(~100건)을 Okt로 다시 분석하고
+제목 × 키워드 부분 문자열 검사를 처음부터 한다. 시간 단위로 바뀌는 제목은 일부뿐이므로
+IncrementalKeywordRanker는 다음 상태를 유지하고 바뀐 제목만큼만 갱신한다.
+
+- 제목별 키워드 목록 (Okt 분석 결과, 제목이 빠져도 LRU로 잠시 보관)
+- 키워드 빈도, 키워드별 포함 제목 (기사 건수), 동시 출현 횟수
+- 제목별로 포함된 키워드 (부분 문자열 기준, 동시 출현 계산용)
+
+새 제목은 현재 어휘 전체와, 새로 생긴 키워드는 현재 제목 전체와만 비교한다.
+순위 산출은 news.utils.merge_keywords를 그대로 쓰므로 결과는 extract_keywords()와 같다.
+동점 순서(처음 나온 순서)만 제목 순서를 따라 가벼운 dict 순회로 복원한다.
+전체 재계산과 같은지는 python manage.py test news.tests(공백 토크나이저)와
+python manage.py check_keyword_ranker(Okt 포함)로 검사한다.
+"""
+
+import threading
+from collections import Counter, OrderedDict
+
+from .instrumentation import annotate, timed
+from .utils import merge_keywords, stop_words, title_keywords
+
+EXTRACTION_CACHE_SIZE = 2048  # 현재 제목에서 빠진 제목의 키워드 목록 보관 수
+
+
+class IncrementalKeywordRanker:
+    """
+    제목 추가/삭제를 반영해 extract_keywords(titles)와 같은 결과를 유지
+
+    같은 제목이 여러 번 들어오면 extract_keywords처럼 중복 횟수만큼 센다.
+    스레드 안전 (한 인스턴스를 요청 스레드끼리 공유 가능).
+    """
+
+    def __init__(self, limit=10, keywords_per_title=4, extractor=None):
+        self.limit = limit
+        self.keywords_per_title = keywords_per_title
+        self.extractor = extractor or (lambda title: title_keywords(title, keywords_per_title))
+        self._lock = threading.RLock()
+        self._sequence = []               # 현재 제목 (입력 순서, 중복 포함)
+        self._multiplicity = Counter()    # 제목 → 중복 횟수
+        self._keywords = {}               # 현재 제목 → 키워드 목록
+        self._extracted = OrderedDict()   # 빠진 제목 → 키워드 목록 (LRU)
+        self._keyword_count = Counter()   # 키워드 → 빈도 (제목별 키워드 목록 합계)
+        self._hits = {}                   # 제목 → 제목에 포함된 어휘 키워드
+        self._containing = {}             # 어휘 키워드 → 키워드를 포함한 제목
+        self._article_count = Counter()   # 어휘 키워드 → 포함한 제목 수 (중복 포함)
+        self._cooccurrence = {}           # 키워드 → Counter(함께 포함된 키워드 → 제목 수)
+        self.extractions = 0              # extractor 호출 횟수 (Okt 분석 횟수)
+
+    def __len__(self):
+        return len(self._sequence)
+
+    @property
+    def titles(self):
+        return list(self._sequence)
+
+    # --- 제목별 키워드 ---------------------------------------------------------
+
+    def _extract(self, title):
+        keywords = self._keywords.get(title)
+        if keywords is None:
+            keywords = self._extracted.pop(title, None)
+        if keywords is None:
+            keywords = list(self.extractor(title))
+            self.extractions += 1
+        return keywords
+
+    def _forget(self, title):
+        self._extracted[title] = self._keywords.pop(title)
+        while len(self._extracted) > EXTRACTION_CACHE_SIZE:
+            self._extracted.popitem(last=False)
+
+    # --- 동시 출현 ---------------------------------------------------------------
+
+    def _bump(self, k1, k2, weight):
+        row = self._cooccurrence.setdefault(k1, Counter())
+        row[k2] += weight
+        if row[k2] <= 0:
+            del row[k2]
+            if not row:
+                del self._cooccurrence[k1]
+
+    def _add_pairs(self, keywords, weight):
+        """한 제목에 함께 포함된 키워드 쌍에 weight를 더함 (extract_keywords처럼 stop_words 제외)"""
+        keywords = [keyword for keyword in keywords if keyword not in stop_words]
+        for k1 in keywords:
+            for k2 in keywords:
+                if k1 != k2:
+                    self._bump(k1, k2, weight)
+
+    def _add_pairs_with(self, keyword, others, weight):
+        """keyword와 others 각각의 쌍(양방향)에 weight를 더함"""
+        if keyword in stop_words:
+            return
+        for other in others:
+            if other != keyword and other not in stop_words:
+                self._bump(keyword, other, weight)
+                self._bump(other, keyword, weight)
+
+    # --- 어휘 (빈도가 1 이상인 키워드) -----------------------------------------
+
+    def _add_vocabulary(self, keyword):
+        """새 키워드 - 현재 제목 전체에서 부분 문자열로 포함된 제목을 찾음"""
+        containing = {title for title in self._multiplicity if keyword in title}
+        self._containing[keyword] = containing
+        for title in containing:
+            weight = self._multiplicity[title]
+            hits = self._hits[title]
+            self._article_count[keyword] += weight
+            self._add_pairs_with(keyword, hits, weight)
+            hits.add(keyword)
+
+    def _remove_vocabulary(self, keyword):
+        for title in self._containing.pop(keyword, ()):
+            hits = self._hits[title]
+            hits.discard(keyword)
+            self._add_pairs_with(keyword, hits, -self._multiplicity[title])
+        self._article_count.pop(keyword, None)
+        self._cooccurrence.pop(keyword, None)
+
+    # --- 변경 --------------------------------------------------------------------
+
+    def _add(self, title):
+        keywords = self._extract(title)
+        self._multiplicity[title] += 1
+        if self._multiplicity[title] == 1:
+            self._keywords[title] = keywords
+            hits = {keyword for keyword in self._keyword_count if keyword in title}
+            self._hits[title] = hits
+            for keyword in hits:
+                self._containing[keyword].add(title)
+
+        hits = self._hits[title]
+        for keyword in hits:
+            self._article_count[keyword] += 1
+        self._add_pairs(hits, 1)
+
+        for keyword in keywords:
+            self._keyword_count[keyword] += 1
+            if self._keyword_count[keyword] == 1:
+                self._add_vocabulary(keyword)
+
+    def _remove(self, title):
+        hits = self._hits[title]
+        for keyword in hits:
+            self._article_count[keyword] -= 1
+        self._add_pairs(hits, -1)
+
+        keywords = self._keywords[title]
+        self._multiplicity[title] -= 1
+        if self._multiplicity[title] == 0:
+            del self._multiplicity[title]
+            for keyword in self._hits.pop(title):
+                self._containing[keyword].discard(title)
+            self._forget(title)
+
+        for keyword in keywords:
+            self._keyword_count[keyword] -= 1
+            if self._keyword_count[keyword] == 0:
+                del self._keyword_count[keyword]
+                self._remove_vocabulary(keyword)
+
+    def add(self, title):
+        with self._lock:
+            self._add(title)
+            self._sequence.append(title)
+
+    def remove(self, title):
+        """제목 하나 삭제 (중복이면 처음 나온 것)"""
+        with self._lock:
+            self._sequence.remove(title)
+            self._remove(title)
+
+    @timed('keywords')
+    def update(self, titles):
+        """현재 제목 목록을 titles로 바꾸고 순위 반환 (바뀐 제목만 다시 분석)"""
+        titles = list(titles)
+        with self._lock:
+            extractions = self.extractions
+            delta = Counter(titles)
+            delta.subtract(self._multiplicity)
+            removed = added = 0
+            for title, change in delta.items():
+                for _ in range(-change):
+                    self._remove(title)
+                    removed += 1
+            for title, change in delta.items():
+                for _ in range(change):
+                    self._add(title)
+                    added += 1
+            self._sequence = titles
+            annotate(titles=len(titles), added=added, removed=removed,
+                     extracted=self.extractions - extractions, incremental=True)
+            return self.ranking()
+
+    def keyword_counts(self):
+        """현재 제목 전체의 키워드 빈도 (시간 창 집계용, news/keyword_windows.py)"""
+        with self._lock:
+            return Counter(self._keyword_count)
+
+    def ranking(self):
+        """extract_keywords(self.titles, limit)와 같은 결과"""
+        with self._lock:
+            # Counter.most_common 동점은 처음 나온 순서 - 현재 제목 순서대로 빈도 dict를 다시 구성
+            keyword_count = Counter()
+            for title in self._sequence:
+                for keyword in self._keywords[title]:
+                    if keyword not in keyword_count:
+                        keyword_count[keyword] = self._keyword_count[keyword]
+            return merge_keywords(
+                keyword_count, self._cooccurrence, self._article_count.__getitem__, self.limit
+            )
+
+
+_ranker = None
+_ranker_lock = threading.Lock()
+
+
+def get_keyword_ranker():
+    """프로세스 공용 랭커 (크롤링 결과 → 메인 페이지 키워드 순위)"""
+    global _ranker
+    with _ranker_lock:
+        if _ranker is None:
+            _ranker = IncrementalKeywordRanker()
+        return _ranker
@@ -0,0 +1,188 @@
+"""
+news/keyword_windows.py - 최근 1시간/6시간/24시간 키워드 순위
+
+크롤링마다 IncrementalKeywordRanker의 키워드 빈도(제목별 키워드 목록 합계)를
+시간 버킷(기본 10분)에 더하고, 창(window)마다 버킷 합계를 유지한다.
+시간이 지나 창 밖으로 나간 버킷은 합계에서 빼므로 조회 시에는
+창 합계만 정렬하면 된다 (키워드 수에 비례, DB 조회/형태소 분석 없음).
+
+count는 창 안 크롤링들의 키워드 언급 수 합계다 (한 기사가 여러 번 크롤링되면 여러 번 셈).
+크롤링 횟수로 나눈 평균(average)을 함께 제공한다.
+
+창은 프로세스 메모리에 있으므로, 재시작 직후 처음 조회할 때
+KeywordSnapshot(크롤링별 상위 키워드 기사 수)으로 최근 창을 채운다.
+"""
+
+import logging
+import threading
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from .utils import merge_keywords
+
+logger = logging.getLogger('news')
+
+DEFAULT_WINDOWS = {'1h': timedelta(hours=1), '6h': timedelta(hours=6), '24h': timedelta(hours=24)}
+DEFAULT_BUCKET = timedelta(minutes=10)
+
+
+def _as_timedelta(value):
+    return value if isinstance(value, timedelta) else timedelta(seconds=value)
+
+
+class _Window:
+    """창 하나 - 창 안 버킷 참조와 합계"""
+
+    def __init__(self, span, bucket):
+        self.span = span
+        self.bucket = bucket
+        self.buckets = deque()  # 창 안의 _Bucket (오래된 순)
+        self.totals = Counter()
+        self.crawls = 0
+
+    def add(self, counts, crawls):
+        self.totals.update(counts)
+        self.crawls += crawls
+
+    def expire(self, now):
+        """끝 시각이 창 시작 이전인 버킷을 합계에서 뺌"""
+        cutoff = now - self.span
+        while self.buckets and self.buckets[0].start + self.bucket <= cutoff:
+            expired = self.buckets.popleft()
+            for keyword, count in expired.counts.items():
+                remaining = self.totals[keyword] - count
+                if remaining > 0:
+                    self.totals[keyword] = remaining
+                else:
+                    del self.totals[keyword]
+            self.crawls -= expired.crawls
+
+
+class _Bucket:
+    __slots__ = ('start', 'counts', 'crawls')
+
+    def __init__(self, start):
+        self.start = start
+        self.counts = Counter()
+        self.crawls = 0
+
+
+class SlidingKeywordWindows:
+    """
+    시간 버킷 카운터 + 창별 합계
+
+    record()는 크롤링 시각 순서로 들어온다고 가정한다. 마지막 버킷보다 이전 시각이면
+    가장 긴 창 밖은 버리고, 창 안이면 마지막 버킷에 합친다.
+    """
+
+    def __init__(self, windows=None, bucket=None):
+        self.bucket = _as_timedelta(bucket or DEFAULT_BUCKET)
+        self.windows = {
+            name: _Window(_as_timedelta(span), self.bucket)
+            for name, span in (windows or DEFAULT_WINDOWS).items()
+        }
+        self.longest = max(window.span for window in self.windows.values())
+        self._lock = threading.Lock()
+        self._latest = None
+
+    def _bucket_start(self, when):
+        epoch = when.timestamp()
+        width = self.bucket.total_seconds()
+        return datetime.fromtimestamp(epoch - epoch % width, tz=dt_timezone.utc)
+
+    def _expire(self, now):
+        for window in self.windows.values():
+            window.expire(now)
+
+    def record(self, crawled_time, keyword_counts, crawls=1):
+        """크롤링 1회의 키워드 빈도를 해당 시간 버킷과 모든 창 합계에 추가"""
+        if crawled_time is None or not keyword_counts:
+            return
+        start = self._bucket_start(crawled_time)
+        with self._lock:
+            if self._latest is None or start > self._latest.start:
+                self._latest = _Bucket(start)
+                for window in self.windows.values():
+                    window.buckets.append(self._latest)
+            elif crawled_time <= self._latest.start - self.longest:
+                return  # 순서가 뒤바뀐 아주 오래된 기록
+
+            self._latest.counts.update(keyword_counts)
+            self._latest.crawls += crawls
+            for window in self.windows.values():
+                # 이미 창 밖으로 나간 창에는 더하지 않음 (다음 expire에서 빠지지 않으므로)
+                if window.buckets and window.buckets[-1] is self._latest:
+                    window.add(keyword_counts, crawls)
+            self._expire(crawled_time)
+
+    def ranking(self, window, limit=10, now=None):
+        """
+        창의 키워드 순위 - extract_keywords와 같은 (키워드, 언급 수, 연관 키워드 집합) 형식
+
+        포함 관계(예: '대통령' ⊂ '대통령실')는 extract_keywords처럼 하나로 묶는다.
+        """
+        with self._lock:
+            self._expire(now or timezone.now())
+            target = self.windows[window]
+            totals = Counter(target.totals)
+        return merge_keywords(totals, {}, totals.__getitem__, limit)
+
+    def crawls(self, window, now=None):
+        with self._lock:
+            self._expire(now or timezone.now())
+            return self.windows[window].crawls
+
+    def rankings(self, limit=10, now=None):
+        """모든 창의 {창 이름: {'crawls', 'keywords': [(키워드, 언급 수, 평균, 연관 키워드)]}}"""
+        now = now or timezone.now()
+        result = {}
+        for name in self.windows:
+            crawls = self.crawls(name, now)
+            result[name] = {
+                'crawls': crawls,
+                'keywords': [
+                    (keyword, count, round(count / crawls, 2) if crawls else 0, group)
+                    for keyword, count, group in self.ranking(name, limit, now)
+                ],
+            }
+        return result
+
+    def seed_from_snapshots(self, now=None):
+        """재시작 직후 KeywordSnapshot으로 가장 긴 창을 채움 (크롤링별 상위 키워드만 있음)"""
+        from .models import KeywordSnapshot
+
+        now = now or timezone.now()
+        since = now - self.longest
+        by_crawl = {}
+        for row in KeywordSnapshot.objects.filter(crawled_time__gt=since).order_by('crawled_time').values(
+            'crawled_time', 'keyword', 'article_count'
+        ):
+            by_crawl.setdefault(row['crawled_time'], Counter())[row['keyword']] = row['article_count']
+        for crawled_time, counts in by_crawl.items():
+            self.record(crawled_time, counts)
+        return len(by_crawl)
+
+
+_windows = None
+_windows_lock = threading.Lock()
+
+
+def get_keyword_windows():
+    """프로세스 공용 창 (처음 호출 시 KeywordSnapshot으로 채움)"""
+    global _windows
+    with _windows_lock:
+        if _windows is None:
+            _windows = SlidingKeywordWindows(
+                getattr(settings, 'KEYWORD_WINDOWS', None),
+                getattr(settings, 'KEYWORD_WINDOW_BUCKET_SECONDS', None),
+            )
+            try:
+                seeded = _windows.seed_from_snapshots()
+                if seeded:
+                    logger.info(f"키워드 시간 창 복원: 크롤링 {seeded}회")
+            except Exception as e:
+                logger.error(f"키워드 시간 창 복원 실패: {str(e)}")
+        return _windows
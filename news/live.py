@@ -0,0 +1,127 @@
+"""
+news/live.py - 크롤링 버전 확인(조건부 폴링)과 랭킹 변경분(delta) 계산
+
+새 크롤링이 끝나면 publish_version()으로 버전(crawled_time epoch 초)과
+언론사별 랭킹 요약을 캐시에 기록한다. 브라우저는 LIVE_POLL_SECONDS마다 버전을
+조건부 요청(ETag/304)으로 확인하고, 버전이 바뀌었을 때만 페이지를 다시 불러온다.
+요청은 캐시 조회 한 번으로 바로 끝나므로 sync 워커를 붙잡지 않는다.
+ranking_delta()는 바뀐 순위 항목만 필요한 API 클라이언트용이다.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from crawling.snapshot_archive import get_archive
+from .snapshots import snapshot_version
+
+logger = logging.getLogger('news')
+
+VERSION_CACHE_KEY = 'news_version'
+RANKING_CACHE_PREFIX = 'ranking_snapshot'
+RANKING_HISTORY_TIMEOUT = 60 * 60 * 24  # 이전 버전 랭킹은 하루 동안 보관
+
+
+def _ranking_key(version):
+    return f"{RANKING_CACHE_PREFIX}:{version}"
+
+
+def compact_rankings(news_items):
+    """뉴스 목록을 {언론사: {순위: [제목, URL]}} 형태로 축약"""
+    rankings = {}
+    for item in news_items:
+        company = item.get('company_name')
+        if company:
+            rankings.setdefault(company, {})[str(item.get('rank'))] = [item['title'], item['url']]
+    return rankings
+
+
+def publish_version(crawled_time, news_items):
+    """새 크롤링 버전과 랭킹 요약을 캐시에 기록"""
+    version = snapshot_version(crawled_time)
+    if version is None:
+        return None
+    cache.set(_ranking_key(version), compact_rankings(news_items), timeout=RANKING_HISTORY_TIMEOUT)
+    cache.set(VERSION_CACHE_KEY, version, timeout=None)
+    logger.info(f"새 버전 공지: v{version}")
+    return version
+
+
+def current_version():
+    """현재 버전 조회 - 공지된 버전이 없으면 news_data의 crawled_time 사용"""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version:
+        return version
+    cached_data = cache.get('news_data') or {}
+    return snapshot_version(cached_data.get('crawled_time'))
+
+
+def get_rankings(version):
+    """버전별 랭킹 요약 조회 (캐시 → 현재 news_data → 스냅샷 아카이브 순)"""
+    rankings = cache.get(_ranking_key(version))
+    if rankings is None:
+        cached_data = cache.get('news_data') or {}
+        if snapshot_version(cached_data.get('crawled_time')) == version:
+            rankings = compact_rankings(cached_data.get('news_items', []))
+    if rankings is None and version:
+        # 캐시에서 밀려난 과거 버전은 스냅샷 아카이브에서 복원
+        try:
+            archived = get_archive(settings.CACHE_BACKUP_DIR).at(int(version) + 1)
+        except (ValueError, OSError) as e:
+            logger.warning(f"아카이브 랭킹 조회 실패 (v{version}): {str(e)}")
+            archived = None
+        if archived and snapshot_version(archived.get('crawled_time')) == version:
+            rankings = compact_rankings(archived.get('news_items', []))
+            cache.set(_ranking_key(version), rankings, timeout=RANKING_HISTORY_TIMEOUT)
+    return rankings
+
+
+def ranking_delta(since):
+    """
+    since 버전 이후 바뀐 랭킹 항목만 반환
+
+    Returns:
+        dict: {
+            'version': 현재 버전,
+            'since': 요청 버전,
+            'full': since 버전 랭킹이 없어 전체를 내려주는지 여부,
+            'changes': {언론사: [{'rank', 'title', 'url'}, ...]},
+            'removed': {언론사: [순위, ...]}
+        }
+        또는 변경이 없으면 None
+    """
+    version = current_version()
+    if version is None or version == since:
+        return None
+
+    current = get_rankings(version) or {}
+    previous = get_rankings(since) if since else None
+    full = previous is None
+    previous = previous or {}
+
+    changes = {}
+    removed = {}
+    for company, ranks in current.items():
+        old_ranks = previous.get(company, {})
+        changed = [
+            {'rank': int(rank), 'title': entry[0], 'url': entry[1]}
+            for rank, entry in ranks.items()
+            if old_ranks.get(rank) != entry
+        ]
+        if changed:
+            changes[company] = sorted(changed, key=lambda x: x['rank'])
+        gone = [int(rank) for rank in old_ranks if rank not in ranks]
+        if gone:
+            removed[company] = sorted(gone)
+    for company, old_ranks in previous.items():
+        if company not in current:
+            removed[company] = sorted(int(rank) for rank in old_ranks)
+
+    return {
+        'version': version,
+        'since': since,
+        'full': full,
+        'changes': changes,
+        'removed': removed,
+    }
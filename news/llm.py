@@ -0,0 +1,324 @@
+"""
+news/llm.py - LLM 요청 스케줄러
+
+모든 LLM 호출(utils, views, agents)은 chat()/achat()을 거친다.
+
+- 전용 이벤트 루프 스레드 1개에서 AsyncOpenAI 클라이언트를 공유 (연결 재사용)
+- 모델별 토큰 버킷: 분당 요청 수(rpm)와 분당 토큰 수(tpm)
+- 동시 실행 상한(LLM_MAX_CONCURRENCY), 백그라운드 작업은 별도 상한으로 제한해
+  대화형 요청을 위한 자리를 항상 남겨 둠
+- 우선순위 큐: 대기 중인 대화형 요청이 백그라운드 요청보다 먼저 실행됨
+- tenacity 재시도: 지수 백오프 + 지터, 요청별 타임아웃
+- finish_reason == 'length'이면 max_tokens를 늘려 한 번만 다시 요청
+
+openai/tenacity는 첫 호출 때 불러온다 (LLM을 쓰지 않는 워커/명령의 기동 비용 절감).
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from opentelemetry import context as otel_context
+
+from .instrumentation import stage
+from .prompting import count_tokens
+
+logger = logging.getLogger('news')
+
+INTERACTIVE = 0   # 사용자가 기다리는 요청
+BACKGROUND = 10   # 크론/사전 계산
+
+DEFAULT_RATE_LIMIT = {'rpm': 500, 'tpm': 160000}
+
+
+def _retryable_errors():
+    import openai
+    return (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+@dataclass
+class LLMResult:
+    content: str
+    finish_reason: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    attempts: int = 1
+    queued_ms: float = 0.0
+    elapsed_ms: float = 0.0
+
+    @property
+    def total_tokens(self):
+        return self.prompt_tokens + self.completion_tokens
+
+
+class TokenBucket:
+    """capacity만큼 모았다가 분당 capacity 속도로 채워지는 버킷"""
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount):
+        amount = min(float(amount), self.capacity)
+        async with self.lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+
+@dataclass
+class _Job:
+    messages: list
+    model: str
+    params: dict
+    priority: int
+    future: asyncio.Future
+    estimated_tokens: int
+    submitted: float
+    trace_context: object = None  # 호출한 쪽의 OTel 컨텍스트 (스케줄러 스레드에서 부모 스팬으로 이어 붙임)
+
+
+class LLMScheduler:
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='llm-scheduler', daemon=True)
+        self._started = threading.Event()
+        self._sequence = itertools.count()
+        self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._setup())
+        self._started.set()
+        self.loop.run_forever()
+        self.loop.close()
+
+    async def _setup(self):
+        from openai import AsyncOpenAI
+
+        max_concurrency = _setting('LLM_MAX_CONCURRENCY', 4)
+        background_limit = min(_setting('LLM_BACKGROUND_MAX_CONCURRENCY', 2), max_concurrency)
+        # LLM_BASE_URL이 없으면 SDK 기본값(OPENAI_BASE_URL 환경변수 또는 api.openai.com)
+        self.client = AsyncOpenAI(
+            base_url=_setting('LLM_BASE_URL', None),
+            timeout=_setting('LLM_TIMEOUT', 60),
+            max_retries=0,
+        )
+        self.queue = asyncio.PriorityQueue()
+        self.background_slots = asyncio.Semaphore(max(1, background_limit))
+        self.buckets = {}
+        self.workers = [self.loop.create_task(self._worker()) for _ in range(max_concurrency)]
+
+    def _buckets(self, model):
+        if model not in self.buckets:
+            limits = {**DEFAULT_RATE_LIMIT, **_setting('LLM_RATE_LIMITS', {}).get(model, {})}
+            self.buckets[model] = (TokenBucket(limits['rpm']), TokenBucket(limits['tpm']))
+        return self.buckets[model]
+
+    # ----- 실행 -----
+    async def _worker(self):
+        while True:
+            _, _, job = await self.queue.get()
+            token = otel_context.attach(job.trace_context) if job.trace_context is not None else None
+            try:
+                if not job.future.cancelled():
+                    result = await self._execute(job)
+                    if not job.future.cancelled():
+                        job.future.set_result(result)
+            except Exception as e:
+                if not job.future.cancelled():
+                    job.future.set_exception(e)
+            finally:
+                if token is not None:
+                    otel_context.detach(token)
+                if job.priority >= BACKGROUND:
+                    self.background_slots.release()
+                self.queue.task_done()
+
+    async def _execute(self, job):
+        from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+        queued_ms = (time.monotonic() - job.submitted) * 1000
+        requests_bucket, tokens_bucket = self._buckets(job.model)
+        params = dict(job.params)
+        attempts = 0
+
+        async def request(max_tokens):
+            nonlocal attempts
+            retrying = AsyncRetrying(
+                retry=retry_if_exception_type(_retryable_errors()),
+                wait=wait_random_exponential(multiplier=1, max=_setting('LLM_RETRY_MAX_WAIT', 20)),
+                stop=stop_after_attempt(_setting('LLM_MAX_ATTEMPTS', 4)),
+                reraise=True,
+            )
+            async for attempt in retrying:
+                with attempt:
+                    attempts += 1
+                    if attempt.retry_state.attempt_number > 1:
+                        logger.warning(f"LLM 재시도 {attempt.retry_state.attempt_number}회차 ({job.model})")
+                    with stage('llm_request', model=job.model, attempt=attempt.retry_state.attempt_number,
+                               max_tokens=max_tokens) as request_stage:
+                        await requests_bucket.acquire(1)
+                        await tokens_bucket.acquire(job.estimated_tokens)
+                        request_stage.set(rate_limit_wait_ms=round((time.perf_counter() - request_stage.started) * 1000, 1))
+                        return await self.client.chat.completions.create(
+                            model=job.model,
+                            messages=job.messages,
+                            max_tokens=max_tokens,
+                            **params,
+                        )
+
+        started = time.monotonic()
+        max_tokens = params.pop('max_tokens')
+        response = await request(max_tokens)
+        choice = response.choices[0]
+
+        # 응답 길이 제한에 걸리면 한 번만 늘려서 다시 요청 (프롬프트는 그대로)
+        retry_limit = _setting('LLM_LENGTH_RETRY_MAX_TOKENS', 2000)
+        if choice.finish_reason == 'length' and max_tokens < retry_limit:
+            logger.warning(f"응답 길이 제한 도달 - max_tokens {max_tokens} → {retry_limit} 로 재요청")
+            response = await request(retry_limit)
+            choice = response.choices[0]
+
+        usage = response.usage
+        return LLMResult(
+            content=choice.message.content or '',
+            finish_reason=choice.finish_reason,
+            model=job.model,
+            prompt_tokens=getattr(usage, 'prompt_tokens', 0),
+            completion_tokens=getattr(usage, 'completion_tokens', 0),
+            attempts=attempts,
+            queued_ms=queued_ms,
+            elapsed_ms=(time.monotonic() - started) * 1000,
+        )
+
+    async def _enqueue(self, job):
+        if job.priority >= BACKGROUND:
+            # 백그라운드 작업은 자리를 얻은 뒤에야 큐에 들어감 → 대화형 요청 자리 보장
+            await self.background_slots.acquire()
+        job.future = self.loop.create_future()
+        job.submitted = time.monotonic()
+        await self.queue.put((job.priority, next(self._sequence), job))
+        return await job.future
+
+    def submit(self, messages, model, priority, params):
+        estimated = sum(count_tokens(m['content'], model) for m in messages) + params['max_tokens']
+        job = _Job(messages, model, params, priority, None, estimated, 0.0, otel_context.get_current())
+        return asyncio.run_coroutine_threadsafe(self._enqueue(job), self.loop)
+
+    # ----- 종료 -----
+    async def _shutdown(self):
+        """워커와 대기 중인 요청을 취소하고 HTTP 연결 풀을 닫음 (호출 측 future는 취소로 끝남)"""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks(self.loop) if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.client.close()
+
+    def close(self, timeout=10):
+        """작업 취소 → 클라이언트 종료 → 루프 정지 → 스레드 종료 대기"""
+        if not self._thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"LLM 스케줄러 종료 중 오류: {str(e)}")
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+def reset_scheduler():
+    """다음 호출부터 설정(LLM_BASE_URL 등)을 다시 읽어 새 스케줄러 사용 (벤치마크용)"""
+    global _scheduler
+    with _scheduler_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.close()
+
+
+def _messages(system, user):
+    messages = []
+    if system:
+        messages.append({'role': 'system', 'content': system})
+    messages.append({'role': 'user', 'content': user})
+    return messages
+
+
+def _annotate_result(llm_stage, result):
+    llm_stage.set(
+        prompt_tokens=result.prompt_tokens,
+        completion_tokens=result.completion_tokens,
+        finish_reason=result.finish_reason,
+        attempts=result.attempts,
+        queued_ms=round(result.queued_ms, 1),
+    )
+
+
+async def achat(user, system=None, model='gpt-3.5-turbo', temperature=0.7, max_tokens=300,
+                priority=INTERACTIVE, **params):
+    """
+    비동기 LLM 호출 (어느 이벤트 루프에서든 사용 가능)
+
+    Returns:
+        LLMResult
+    """
+    with stage('llm', model=model, priority=priority) as llm_stage:
+        future = get_scheduler().submit(
+            _messages(system, user), model, priority,
+            {'temperature': temperature, 'max_tokens': max_tokens, **params},
+        )
+        result = await asyncio.wrap_future(future)
+        _annotate_result(llm_stage, result)
+        return result
+
+
+def chat(user, system=None, model='gpt-3.5-turbo', temperature=0.7, max_tokens=300,
+         priority=INTERACTIVE, **params):
+    """동기 LLM 호출 (뷰/크론 등 동기 코드용)"""
+    with stage('llm', model=model, priority=priority) as llm_stage:
+        future = get_scheduler().submit(
+            _messages(system, user), model, priority,
+            {'temperature': temperature, 'max_tokens': max_tokens, **params},
+        )
+        result = future.result()
+        _annotate_result(llm_stage, result)
+        return result
@@ -0,0 +1,84 @@
+"""
+news/log_pipeline.py - 요청 스레드를 막지 않는 로그 처리
+
+settings.LOGGING으로 만든 파일/콘솔 핸들러를 QueueListener 스레드로 옮기고,
+각 로거에는 QueueHandler만 남긴다. 요청 스레드는 레코드를 큐에 넣기만 하고
+파일 쓰기·포맷팅은 리스너 스레드가 처리한다.
+
+핫패스(키워드 추출, 언론사 이름 추출)는 하위 로거(news.keywords, news.press)로
+로그를 남기며 settings.LOGGING에서 단계별로 레벨을 올리거나 SampleFilter로 일부만 남긴다.
+"""
+
+import atexit
+import logging
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+
+_listeners = []
+_started = False
+_start_lock = threading.Lock()
+
+
+class SampleFilter(logging.Filter):
+    """
+    rate 비율의 레코드만 통과 (WARNING 이상은 항상 통과)
+
+    settings.LOGGING 예:
+        'filters': {'sample_keywords': {'()': 'news.log_pipeline.SampleFilter', 'rate': 0.01}}
+    """
+
+    def __init__(self, rate=1.0, name=''):
+        super().__init__(name)
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+def caller_name(depth=1):
+    """호출한 함수 이름 (inspect.stack()과 달리 소스 파일을 읽지 않음)"""
+    return sys._getframe(depth + 1).f_code.co_name
+
+
+def start_queue_logging():
+    """
+    설정된 로거의 핸들러를 QueueHandler → QueueListener 구조로 교체
+
+    같은 핸들러 조합을 쓰는 로거끼리는 큐와 리스너를 공유한다.
+    여러 번 호출해도 한 번만 적용된다.
+    """
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        queue_handlers = {}
+        for name in (getattr(settings, 'LOGGING', {}) or {}).get('loggers', {}):
+            logger = logging.getLogger(name)
+            handlers = tuple(h for h in logger.handlers if not isinstance(h, QueueHandler))
+            if not handlers:
+                continue
+            if handlers not in queue_handlers:
+                log_queue = queue.SimpleQueue()
+                listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+                listener.start()
+                _listeners.append(listener)
+                queue_handlers[handlers] = QueueHandler(log_queue)
+            for handler in handlers:
+                logger.removeHandler(handler)
+            logger.addHandler(queue_handlers[handlers])
+        _started = True
+    atexit.register(stop_queue_logging)
+
+
+def stop_queue_logging():
+    """남은 레코드를 모두 기록하고 리스너 종료"""
+    global _started
+    with _start_lock:
+        while _listeners:
+            _listeners.pop().stop()
+        _started = False
@@ -0,0 +1,124 @@
+"""
+핫패스 로깅 비용 측정: 동기 핸들러 vs 큐 핸들러 vs DEBUG 게이팅 vs 샘플링
+
+extract_keywords와 같은 형태(제목당 5줄)로 로그를 남길 때 요청 스레드가
+부담하는 시간을 비교한다. 파일은 임시 디렉터리에 기록한다.
+
+사용법:
+    python manage.py benchmark_logging --titles 100 --repeat 20
+"""
+
+import inspect
+import logging
+import os
+import tempfile
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from django.core.management.base import BaseCommand
+
+from news.log_pipeline import SampleFilter, caller_name
+
+SAMPLE_TITLE = "[속보] 정부, 부동산 대책 발표… 여야 '실효성' 공방 이어져"
+SAMPLE_PHRASES = ['정부', '부동산', '부동산 대책', '대책 발표', '여야', '실효성', '공방']
+
+
+def _eager(logger, titles):
+    """변경 전: f-string INFO 로그 (레벨과 무관하게 문자열을 먼저 만듦)"""
+    for i in range(titles):
+        logger.info(f"\n원본 제목: {SAMPLE_TITLE} {i}")
+        logger.info(f"구문 추출: {SAMPLE_PHRASES}")
+        logger.info(f"5글자 이하 단일 키워드 필터링 후: {SAMPLE_PHRASES[:5]}")
+        logger.info(f"stop_words 필터링 후: {SAMPLE_PHRASES[:4]}")
+        logger.info(f"최종 추출된 키워드: {SAMPLE_PHRASES[:3]}")
+
+
+def _gated(logger, titles):
+    """변경 후: DEBUG 여부를 한 번 확인하고 지연 포맷팅"""
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for i in range(titles):
+        if debug:
+            logger.debug("원본 제목: %s %d", SAMPLE_TITLE, i)
+            logger.debug("구문 추출: %s", SAMPLE_PHRASES)
+            logger.debug("5글자 이하 단일 키워드 필터링 후: %s", SAMPLE_PHRASES[:5])
+            logger.debug("stop_words 필터링 후: %s", SAMPLE_PHRASES[:4])
+            logger.debug("최종 추출된 키워드: %s", SAMPLE_PHRASES[:3])
+
+
+class Command(BaseCommand):
+    help = '키워드 추출 핫패스 로깅 비용 비교 (동기/큐/게이팅/샘플링, inspect.stack)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--titles', type=int, default=100, help='제목 수 (기본 100, 제목당 5줄)')
+        parser.add_argument('--repeat', type=int, default=20, help='반복 횟수 (기본 20)')
+
+    def _logger(self, name, level, handlers, filters=()):
+        logger = logging.getLogger(f'benchmark_logging.{name}')
+        logger.handlers = list(handlers)
+        logger.filters = list(filters)
+        logger.setLevel(level)
+        logger.propagate = False
+        return logger
+
+    def _measure(self, func, logger, titles, repeat):
+        func(logger, titles)  # 워밍업
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func(logger, titles)
+        return (time.perf_counter() - started) * 1000 / repeat
+
+    def handle(self, *args, **options):
+        titles, repeat = options['titles'], options['repeat']
+        formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s')
+
+        with tempfile.TemporaryDirectory() as workdir, open(os.devnull, 'w') as devnull:
+            def file_and_console(name):
+                file_handler = logging.FileHandler(os.path.join(workdir, f'{name}.log'), encoding='utf-8')
+                console = logging.StreamHandler(devnull)
+                for handler in (file_handler, console):
+                    handler.setFormatter(formatter)
+                return [file_handler, console]
+
+            sync_handlers = file_and_console('sync')
+            queued_handlers = file_and_console('queued')
+            log_queue = SimpleQueue()
+            listener = QueueListener(log_queue, *queued_handlers, respect_handler_level=True)
+            listener.start()
+            queue_handler = QueueHandler(log_queue)
+
+            results = []
+            try:
+                results.append(('변경 전: 동기 핸들러, f-string INFO', self._measure(
+                    _eager, self._logger('sync', logging.INFO, sync_handlers), titles, repeat)))
+                results.append(('큐 핸들러, f-string INFO', self._measure(
+                    _eager, self._logger('queue', logging.INFO, [queue_handler]), titles, repeat)))
+                results.append(('변경 후: 큐 + DEBUG 게이팅 (INFO 레벨)', self._measure(
+                    _gated, self._logger('gated', logging.INFO, [queue_handler]), titles, repeat)))
+                results.append(('큐 + DEBUG 켬 + 1% 샘플링', self._measure(
+                    _gated, self._logger('sampled', logging.DEBUG, [queue_handler], [SampleFilter(0.01)]),
+                    titles, repeat)))
+                results.append(('큐 + DEBUG 켬 (샘플링 없음)', self._measure(
+                    _gated, self._logger('debug', logging.DEBUG, [queue_handler]), titles, repeat)))
+            finally:
+                listener.stop()
+                for handler in sync_handlers + queued_handlers:
+                    handler.close()
+
+        baseline = results[0][1]
+        self.stdout.write(f"== 제목 {titles}건 × 5줄, {repeat}회 평균 (요청 스레드 기준) ==")
+        for name, elapsed_ms in results:
+            ratio = f"{baseline / elapsed_ms:8.1f}x" if elapsed_ms else '       ∞'
+            self.stdout.write(f"{name:<36} {elapsed_ms:9.3f} ms  ({elapsed_ms * 1000 / titles:8.2f} µs/제목) {ratio}")
+
+        # 호출 함수 이름 조회 비용 (_get_gpt_response가 호출마다 두 번 사용하던 방식)
+        calls = 200
+        started = time.perf_counter()
+        for _ in range(calls):
+            inspect.stack()[1].function
+        stack_us = (time.perf_counter() - started) * 1e6 / calls
+        started = time.perf_counter()
+        for _ in range(calls):
+            caller_name()
+        frame_us = (time.perf_counter() - started) * 1e6 / calls
+        self.stdout.write(f"호출 함수 조회: inspect.stack() {stack_us:.1f} µs, caller_name() {frame_us:.2f} µs")
@@ -0,0 +1,225 @@
+"""
+크롤링 픽스처 → 키워드 → 요약 → 분석 전체 파이프라인 벤치마크
+
+실제 OpenAI 대신 로컬 가짜 서버(news.fake_openai)에 붙어 실행하므로
+비용과 네트워크 변동 없이 단계별 지연(p50/p95)과 처리량을 비교할 수 있다.
+
+단계:
+    context        prepare_news_context (클러스터, 스토리, 키워드 추출)
+    news_summary   analyze_keywords_with_llm_sync (news_summary 뷰의 LLM 분석)
+    analyze_trends analyze_trends 뷰 (POST)
+    article_summary article_summary (기사 요약 + 언론사 비교 분석)
+
+사용법:
+    python manage.py benchmark_pipeline --iterations 10 --concurrency 2 --latency lognormal:0.6,0.4
+    python manage.py benchmark_pipeline --fixture cache_backup/fixture.json --json
+"""
+
+import math
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils import timezone
+
+from crawling.records import NewsItem
+from news.sample_data import load_fixture, synthetic_items
+
+STAGES = ('context', 'news_summary', 'analyze_trends', 'article_summary')
+
+
+def percentile(values, pct):
+    """최근접 순위 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = '가짜 OpenAI 서버로 크롤링 픽스처→키워드→요약→분석 파이프라인의 p50/p95 지연과 처리량 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=5, help='파이프라인 실행 횟수 (기본 5)')
+        parser.add_argument('--concurrency', type=int, default=1, help='동시에 실행할 파이프라인 수 (기본 1)')
+        parser.add_argument('--items', type=int, default=100, help='가짜 크롤링 기사 수 (--fixture가 없을 때)')
+        parser.add_argument('--fixture', help='크롤링 백업 JSON ({"news_items": [...]} 또는 기사 목록)')
+        parser.add_argument('--latency', default='lognormal:0.6,0.4', help='가짜 서버 첫 토큰 지연 분포')
+        parser.add_argument('--tokens-per-second', type=float, default=80, help='가짜 서버 토큰 속도')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='가짜 서버 429 응답 비율')
+        parser.add_argument('--seed', type=int, default=7)
+        parser.add_argument('--warm', action='store_true',
+                            help='반복 사이에 캐시를 비우지 않음 (요약/map 캐시 적중 포함 측정)')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def handle(self, *args, **options):
+        # 지연 import: 명령 목록 조회 시 뷰/LLM 모듈을 불러오지 않도록
+        from news import llm, stories
+        from news.fake_openai import FakeOpenAIServer
+        from news.models import NewsSummary
+
+        backend = settings.CACHES['default']['BACKEND']
+        if not options['warm'] and 'locmem' not in backend:
+            raise CommandError(f"공유 캐시({backend})는 비울 수 없습니다. --warm으로 실행하세요.")
+
+        try:
+            server = FakeOpenAIServer(
+                latency=options['latency'],
+                tokens_per_second=options['tokens_per_second'],
+                error_rate=options['error_rate'],
+                seed=options['seed'],
+            ).start()
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options['fixture']:
+            fixture = load_fixture(options['fixture'], server.article_base_url)
+        else:
+            fixture = synthetic_items(options['items'], server.article_base_url)
+        if not fixture:
+            raise CommandError('픽스처에 기사가 없습니다.')
+
+        # 가짜 서버로 LLM 연결, 스토리 인덱스는 임시 디렉터리에 (운영 인덱스 보호)
+        original = {name: getattr(settings, name, None) for name in ('LLM_BASE_URL', 'CACHE_BACKUP_DIR')}
+        original_api_key = os.environ.get('OPENAI_API_KEY')
+        workdir = tempfile.TemporaryDirectory(prefix='benchmark_pipeline_')
+        settings.LLM_BASE_URL = server.base_url
+        settings.CACHE_BACKUP_DIR = workdir.name
+        os.environ['OPENAI_API_KEY'] = original_api_key or 'fake-key'
+        llm.reset_scheduler()
+        stories._story_index = None
+
+        timings = {stage: [] for stage in STAGES + ('total',)}
+        failures = []
+        crawled_times = []
+        lock = threading.Lock()
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, options['concurrency'])) as executor:
+                futures = [
+                    executor.submit(self._run_pipeline, i, fixture, options['warm'], timings, crawled_times, lock)
+                    for i in range(options['iterations'])
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failures.append(f"{type(e).__name__}: {e}")
+            wall_seconds = time.perf_counter() - started
+        finally:
+            NewsSummary.objects.filter(crawled_time__in=crawled_times).delete()
+            llm.reset_scheduler()
+            stories._story_index = None
+            for name, value in original.items():
+                setattr(settings, name, value)
+            if original_api_key is None:
+                os.environ.pop('OPENAI_API_KEY', None)
+            server.stop()
+            workdir.cleanup()
+
+        self._report(options, fixture, timings, failures, wall_seconds, server.stats())
+
+    def _run_pipeline(self, iteration, fixture, warm, timings, crawled_times, lock):
+        from news.utils import analyze_keywords_with_llm_sync
+        from news.views import analyze_trends, article_summary, prepare_news_context
+
+        if not warm:
+            cache.clear()
+        # 반복마다 다른 크롤링 시각 → 저장된 요약(NewsSummary)을 재사용하지 않음
+        crawled_time = timezone.now().replace(microsecond=0) + timedelta(seconds=iteration)
+        news_items = [NewsItem.from_dict(item.to_dict()) for item in fixture]
+        for item in news_items:
+            item.crawled_at = crawled_time
+        with lock:
+            crawled_times.append(crawled_time)
+
+        measured = {}
+        pipeline_started = time.perf_counter()
+
+        started = time.perf_counter()
+        context = prepare_news_context(news_items, crawled_time)
+        cache.set('news_data', context, timeout=None)
+        measured['context'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        analyze_keywords_with_llm_sync(context['keyword_rankings'], [
+            {'title': item.title, 'company_name': item.company_name, 'rank': item.rank} for item in news_items
+        ])
+        measured['news_summary'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        request = RequestFactory().post(
+            '/analyze-trends/', data=orjson.dumps({'analysis_type': 'basic'}), content_type='application/json'
+        )
+        response = analyze_trends(request)
+        measured['analyze_trends'] = time.perf_counter() - started
+        if response.status_code != 200:
+            raise RuntimeError(f"analyze_trends 응답 {response.status_code}")
+
+        started = time.perf_counter()
+        article_summary(None)
+        measured['article_summary'] = time.perf_counter() - started
+
+        measured['total'] = time.perf_counter() - pipeline_started
+        with lock:
+            for stage, seconds in measured.items():
+                timings[stage].append(seconds)
+
+    def _report(self, options, fixture, timings, failures, wall_seconds, server_stats):
+        completed = len(timings['total'])
+        summary = {
+            'iterations': options['iterations'],
+            'completed': completed,
+            'failed': len(failures),
+            'concurrency': options['concurrency'],
+            'articles': len(fixture),
+            'latency': options['latency'],
+            'tokens_per_second': options['tokens_per_second'],
+            'wall_seconds': round(wall_seconds, 3),
+            'throughput_per_minute': round(completed / wall_seconds * 60, 2) if wall_seconds else 0.0,
+            'llm': server_stats,
+            'stages': {
+                stage: {
+                    'p50_ms': round(percentile(values, 50) * 1000, 1),
+                    'p95_ms': round(percentile(values, 95) * 1000, 1),
+                    'max_ms': round(max(values) * 1000, 1) if values else 0.0,
+                    'mean_ms': round(statistics.fmean(values) * 1000, 1) if values else 0.0,
+                }
+                for stage, values in timings.items()
+            },
+            'errors': failures,
+        }
+
+        if options['json']:
+            self.stdout.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
+            return
+
+        self.stdout.write(
+            f"== 기사 {len(fixture)}건, {completed}/{options['iterations']}회 완료 "
+            f"(동시 {options['concurrency']}, 지연 {options['latency']}, {options['tokens_per_second']} tok/s) =="
+        )
+        self.stdout.write(f"{'단계':<16} {'p50':>10} {'p95':>10} {'max':>10} {'평균':>10}")
+        for stage, stats in summary['stages'].items():
+            self.stdout.write(
+                f"{stage:<16} {stats['p50_ms']:>8.1f}ms {stats['p95_ms']:>8.1f}ms "
+                f"{stats['max_ms']:>8.1f}ms {stats['mean_ms']:>8.1f}ms"
+            )
+        self.stdout.write(
+            f"처리량: 분당 {summary['throughput_per_minute']} 파이프라인 ({summary['wall_seconds']}초)"
+        )
+        self.stdout.write(
+            f"LLM 호출: {server_stats['requests']}회 (429 {server_stats['errors']}회), "
+            f"출력 토큰 {server_stats['completion_tokens']}"
+        )
+        for error in failures:
+            self.stdout.write(self.style.ERROR(f"실패: {error}"))
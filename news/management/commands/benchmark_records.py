@@ -0,0 +1,86 @@
+"""
+크롤링 결과 전달 방식 비교: DataFrame 왕복 vs NewsItem 레코드
+
+사용법:
+    python manage.py benchmark_records --items 100 --repeat 200
+"""
+
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from crawling.records import CrawlResult, NewsItem
+
+
+def _sample_dicts(count):
+    return [{
+        'company_code': '023',
+        'company_name': '조선일보',
+        'title': f'테스트 기사 제목 {i} - 크롤링 결과 전달 방식 비교',
+        'url': f'https://n.news.naver.com/article/023/{i:010d}',
+        'rank': i % 10 + 1,
+        'image_url': f'https://imgnews.pstatic.net/image/023/{i}.jpg',
+        'summary': '',
+        'crawled_at': datetime.now(),
+    } for i in range(count)]
+
+
+def _measure(func, repeat):
+    """평균 실행 시간(ms)과 1회 실행의 메모리 할당 최고치(KB)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def _import_seconds(module):
+    """새 인터프리터에서 모듈 import에 걸리는 시간 (인터프리터 기동 포함)"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', f'import {module}'], check=True)
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = '크롤링 결과의 DataFrame 왕복과 NewsItem 레코드 방식의 시간/메모리/기동 비용 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=100, help='기사 수 (기본 100)')
+        parser.add_argument('--repeat', type=int, default=200, help='반복 횟수 (기본 200)')
+
+    def handle(self, *args, **options):
+        raw = _sample_dicts(options['items'])
+        repeat = options['repeat']
+
+        results = {}
+        try:
+            import pandas as pd
+            results['DataFrame 왕복'] = _measure(
+                lambda: pd.DataFrame([dict(item) for item in raw]).to_dict('records'), repeat
+            )
+        except ImportError:
+            self.stdout.write('pandas가 설치되어 있지 않아 DataFrame 측정을 건너뜁니다.')
+
+        results['NewsItem 레코드'] = _measure(
+            lambda: CrawlResult([NewsItem(**item) for item in raw]).items, repeat
+        )
+
+        self.stdout.write(f"== 기사 {options['items']}건, {repeat}회 평균 ==")
+        for name, (elapsed_ms, peak_kb) in results.items():
+            self.stdout.write(f"{name:<16} {elapsed_ms:8.3f} ms  할당 최고치 {peak_kb:8.1f} KB")
+
+        self.stdout.write('== 모듈 import 시간 (새 프로세스) ==')
+        for module in ('crawling.records', 'pandas'):
+            try:
+                self.stdout.write(f"{module:<16} {_import_seconds(module) * 1000:8.1f} ms")
+            except subprocess.CalledProcessError:
+                self.stdout.write(f"{module:<16} import 실패")
@@ -0,0 +1,98 @@
+"""
+증분 키워드 랭킹(news/keyword_ranker.py)이 전체 재계산과 같은지 무작위 변경으로 검사
+
+매 라운드 현재 제목에서 일부를 빼고(중복 제목 포함) 새 제목을 넣거나 순서를 섞은 뒤
+IncrementalKeywordRanker.update() 결과를 rank_keywords()(= extract_keywords 5~6단계)
+전체 재계산과 비교한다. 하나라도 다르면 실패(종료 코드 1).
+
+--tokenizer okt는 실제 extract_keywords와 같은 Okt 분석을 쓰고,
+whitespace는 JVM 없이 순위 계산 부분만 검사한다 (공백 단위 단어를 키워드로 사용).
+같은 검사를 whitespace로 줄여 돌리는 테스트: python manage.py test news.tests
+
+사용법:
+    python manage.py check_keyword_ranker --rounds 500 --seed 7
+    python manage.py check_keyword_ranker --fixture cache_backup/fixture.json --tokenizer okt
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news.keyword_ranker import IncrementalKeywordRanker
+from news.sample_data import mutate_titles, title_pool, whitespace_keywords
+from news.utils import rank_keywords, title_keywords
+
+
+class Command(BaseCommand):
+    help = '증분 키워드 랭킹이 전체 재계산과 같은지 무작위 제목 추가/삭제로 검사'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=300, help='변경 라운드 수 (기본 300)')
+        parser.add_argument('--titles', type=int, default=100, help='현재 제목 수 (기본 100)')
+        parser.add_argument('--churn', type=float, default=0.2, help='라운드당 최대 교체 비율 (기본 0.2)')
+        parser.add_argument('--limit', type=int, default=10, help='순위 키워드 수 (기본 10)')
+        parser.add_argument('--fixture', help='크롤링 백업 JSON (없으면 가짜 크롤링 제목)')
+        parser.add_argument('--tokenizer', choices=('whitespace', 'okt'), default='whitespace')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        size, limit = options['titles'], options['limit']
+        extractor = title_keywords if options['tokenizer'] == 'okt' else whitespace_keywords
+        pool = title_pool(size, rng, options['fixture'])
+
+        cache = {}
+
+        def extract(title):
+            if title not in cache:
+                cache[title] = extractor(title)
+            return cache[title]
+
+        ranker = IncrementalKeywordRanker(limit=limit, extractor=extractor)
+        titles = rng.choices(pool, k=size)
+        incremental_seconds = full_seconds = 0.0
+        failures = 0
+
+        for round_no in range(options['rounds']):
+            if round_no:
+                titles = mutate_titles(titles, pool, rng, options['churn'])
+
+            started = time.perf_counter()
+            if rng.random() < 0.1 and titles:
+                # add/remove API도 같은 상태를 만드는지 확인 (remove는 처음 나온 제목을 뺌)
+                extra = rng.choice(pool)
+                ranker.update(titles)
+                ranker.add(extra)
+                ranker.remove(extra)
+                titles = titles + [extra]
+                titles.remove(extra)
+                result = ranker.ranking()
+            else:
+                result = ranker.update(titles)
+            incremental_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            expected = rank_keywords(titles, [extract(title) for title in titles], limit)
+            full_seconds += time.perf_counter() - started
+
+            if result != expected:
+                failures += 1
+                self.stderr.write(self.style.ERROR(f"라운드 {round_no}: 결과 불일치 (제목 {len(titles)}건)"))
+                self.stderr.write(f"  증분: {result}")
+                self.stderr.write(f"  전체: {expected}")
+                if failures >= 5:
+                    break
+
+        rounds = round_no + 1
+        self.stdout.write(
+            f"라운드 {rounds}회, 제목 {size}건, 제목 분석 {ranker.extractions}회 "
+            f"(전체 재계산이면 {rounds * size}회)"
+        )
+        self.stdout.write(
+            f"평균 갱신 시간: 증분 {incremental_seconds * 1000 / rounds:.2f} ms, "
+            f"전체 {full_seconds * 1000 / rounds:.2f} ms (제목 분석 캐시 사용)"
+        )
+        if failures:
+            raise CommandError(f"증분 랭킹 불일치 {failures}건")
+        self.stdout.write(self.style.SUCCESS('증분 랭킹 = 전체 재계산'))
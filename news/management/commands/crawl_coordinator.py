@@ -0,0 +1,106 @@
+"""
+분산 크롤링 코디네이터 (news/crawl_shards.py)
+
+크롤링 1회(CrawlRun)와 언론사별 작업을 만들고, 모든 작업이 끝나거나 마감이 지나면
+완료된 언론사 기사를 합쳐 공개한다. 공개된 스냅샷은 웹 프로세스가 읽는다
+(settings.CRAWL_SHARDING). 크론에서 주기적으로 실행하면 된다.
+
+--workers N을 주면 이 호스트에서 워커 N개를 함께 띄운다 (다른 호스트의 워커는
+python manage.py crawl_worker로 따로 실행).
+
+적응형 주기(CRAWL_ADAPTIVE)가 켜져 있으면 주기가 돌아온 언론사만 크롤링하므로
+크론은 최소 주기(CRAWL_MIN_INTERVAL_SECONDS)보다 자주 실행해도 된다.
+
+사용법:
+    python manage.py crawl_coordinator --workers 4
+    python manage.py crawl_coordinator --deadline 300 --press-codes 001 003 015
+    python manage.py crawl_coordinator --publish-only   # 마감 지난 크롤링만 공개
+    python manage.py crawl_coordinator --status
+    python manage.py crawl_coordinator --schedule      # 언론사별 크롤링 주기와 결정 이유
+"""
+
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from crawling.press_registry import selected_presses
+from crawling.press_registry import registry
+from news.crawl_schedule import schedule_status
+from news.crawl_shards import due_presses, publish_ready_runs, run_status, start_run
+from news.models import CrawlRun
+
+
+class Command(BaseCommand):
+    help = '분산 크롤링을 시작하고 언론사 작업이 모이면 스냅샷을 공개'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--deadline', type=int, help='공개 마감 (초, 기본 CRAWL_DEADLINE_SECONDS)')
+        parser.add_argument('--press-codes', nargs='+', help='이번 크롤링 언론사 코드 (기본: 설정된 언론사 전체)')
+        parser.add_argument('--workers', type=int, default=0, help='이 호스트에서 함께 띄울 워커 수')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='공개 조건 확인 간격 (초)')
+        parser.add_argument('--publish-only', action='store_true', help='새 크롤링 없이 공개 조건만 확인')
+        parser.add_argument('--status', action='store_true', help='최근 크롤링 상태 출력')
+        parser.add_argument('--schedule', action='store_true', help='언론사별 적응형 크롤링 주기 출력')
+
+    def handle(self, *args, **options):
+        if options['status']:
+            return self._print_status()
+        if options['schedule']:
+            return self._print_schedule()
+        if options['publish_only']:
+            for run in publish_ready_runs():
+                self.stdout.write(f"공개: {run}")
+            return
+
+        try:
+            presses = selected_presses(options['press_codes']) if options['press_codes'] else due_presses()
+        except ValueError as e:
+            raise CommandError(str(e))
+        if not presses:
+            publish_ready_runs()
+            self.stdout.write('크롤링 주기가 돌아온 언론사 없음')
+            return
+        run = start_run(presses, options['deadline'])
+        self.stdout.write(f"크롤링 #{run.pk}: 언론사 {run.press_count}곳, 마감 {timezone.localtime(run.deadline):%H:%M:%S}")
+
+        workers = [
+            subprocess.Popen([sys.executable, sys.argv[0], 'crawl_worker', '--idle-exit', '5'])
+            for _ in range(options['workers'])
+        ]
+        try:
+            while True:
+                publish_ready_runs()
+                run.refresh_from_db()
+                if run.status == CrawlRun.STATUS_PUBLISHED:
+                    break
+                time.sleep(options['poll_interval'])
+        finally:
+            for worker in workers:
+                try:
+                    worker.wait(timeout=60)
+                except subprocess.TimeoutExpired:
+                    worker.terminate()
+
+        counts = run_status(run)
+        elapsed = (run.crawled_time - run.started_at).total_seconds()
+        self.stdout.write(self.style.SUCCESS(
+            f"크롤링 #{run.pk} 공개: 언론사 {run.completed_count}/{run.press_count}곳, "
+            f"기사 {len(run.items)}건, {elapsed:.1f}초 (실패 {counts['failed']}, 마감 초과 {counts['skipped']})"
+        ))
+
+    def _print_status(self):
+        for run in CrawlRun.objects.order_by('-started_at')[:10]:
+            counts = ', '.join(f"{status} {count}" for status, count in run_status(run).items() if count)
+            self.stdout.write(f"{run} - 시작 {timezone.localtime(run.started_at):%m-%d %H:%M:%S} ({counts})")
+
+    def _print_schedule(self):
+        for row in schedule_status(registry.codes()):
+            next_due = f"{timezone.localtime(row['next_due']):%H:%M:%S}" if row['next_due'] else '-'
+            interval = f"{row['interval_seconds'] // 60}분" if row['interval_seconds'] else '-'
+            self.stdout.write(
+                f"{'*' if row['due'] else ' '} {row['press_name']:<10} 주기 {interval:>5}  다음 {next_due}  "
+                f"크롤링 {row['crawls']}회  {row['decision']}"
+            )
@@ -0,0 +1,41 @@
+"""
+분산 크롤링 워커 (news/crawl_shards.py)
+
+CrawlTask 테이블에서 언론사 작업을 임대해 크롤링하고 결과를 기록한다.
+같은 DB를 쓰는 프로세스/호스트마다 여러 개 띄우면 언론사가 워커들에 나뉜다.
+작업은 crawl_coordinator가 만들고 공개한다.
+
+사용법:
+    python manage.py crawl_worker
+    python manage.py crawl_worker --worker-id host-a:1 --idle-exit 30
+"""
+
+from django.core.management.base import BaseCommand
+
+from news.crawl_shards import default_worker_id, run_worker
+
+
+class Command(BaseCommand):
+    help = '분산 크롤링 작업을 임대해 언론사 랭킹을 크롤링'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--worker-id', help='임대 소유자 이름 (기본: 호스트명:PID)')
+        parser.add_argument('--lease-seconds', type=int, help='작업 임대 시간 (기본 CRAWL_LEASE_SECONDS)')
+        parser.add_argument('--max-tasks', type=int, help='이만큼 처리하면 종료')
+        parser.add_argument('--idle-exit', type=float, help='이 시간(초) 동안 작업이 없으면 종료 (기본: 계속 대기)')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='작업이 없을 때 재확인 간격 (초)')
+
+    def handle(self, *args, **options):
+        from crawling.naver_news_crawler import NaverNewsCrawler  # Selenium은 워커에서만 로드
+
+        worker_id = options['worker_id'] or default_worker_id()
+        self.stdout.write(f"워커 {worker_id} 시작")
+        processed = run_worker(
+            NaverNewsCrawler(),
+            worker_id=worker_id,
+            lease_seconds=options['lease_seconds'],
+            max_tasks=options['max_tasks'],
+            idle_exit=options['idle_exit'],
+            poll_interval=options['poll_interval'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"워커 {worker_id} 종료: 작업 {processed}건 처리"))
@@ -0,0 +1,58 @@
+"""
+로컬 OpenAI 호환 가짜 서버 실행
+
+사용법:
+    python manage.py fake_openai --port 8765 --latency lognormal:0.6,0.4 --tokens-per-second 80
+    LLM_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake python manage.py runserver
+"""
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError
+
+from news.fake_openai import FakeOpenAIServer
+
+
+class Command(BaseCommand):
+    help = '벤치마크/개발용 OpenAI 호환 가짜 서버 (지연 분포, 토큰 속도, 준비된 응답)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency', default='lognormal:0.6,0.4',
+                            help='첫 토큰 지연 분포 (fixed:S | uniform:A,B | normal:M,SD | lognormal:MEDIAN,SIGMA)')
+        parser.add_argument('--tokens-per-second', type=float, default=80, help='응답 토큰 속도 (0이면 즉시)')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='429 응답 비율 (0~1)')
+        parser.add_argument('--responses', help='[[문구, 응답], ...] 형식의 JSON 파일 (기본 응답보다 우선)')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options):
+        responses = None
+        if options['responses']:
+            try:
+                with open(options['responses'], 'rb') as f:
+                    responses = [tuple(entry) for entry in orjson.loads(f.read())]
+            except (OSError, orjson.JSONDecodeError, TypeError) as e:
+                raise CommandError(f"응답 파일을 읽을 수 없습니다: {e}")
+
+        try:
+            server = FakeOpenAIServer(
+                host=options['host'],
+                port=options['port'],
+                latency=options['latency'],
+                tokens_per_second=options['tokens_per_second'],
+                responses=responses,
+                error_rate=options['error_rate'],
+                seed=options['seed'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f"가짜 OpenAI 서버 실행 중: {server.base_url}")
+        self.stdout.write(f"  LLM_BASE_URL={server.base_url} OPENAI_API_KEY=fake 로 앱을 실행하세요.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+            self.stdout.write(f"종료 - {server.stats()}")
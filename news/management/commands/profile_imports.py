@@ -0,0 +1,123 @@
+"""
+모듈 import 시간 측정과 예산 검사 (python -X importtime 기반)
+
+새 인터프리터에서 django.setup() 후 대상 모듈을 import하고,
+누적 import 시간·최대 메모리·무거운 모듈 로드 여부를 보고한다.
+예산(settings.IMPORT_TIME_BUDGETS_MS)을 넘거나 지연 로딩해야 할 모듈이
+올라오면 실패(종료 코드 1)하므로 CI에서 회귀 검사로 쓸 수 있다.
+
+사용법:
+    python manage.py profile_imports
+    python manage.py profile_imports news.views --budget-ms 300 --top 15
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 요청 처리 경로에서 필요할 때만 불러와야 하는 모듈 (워커 기동 시 로드되면 실패)
+DEFAULT_DEFERRED_MODULES = (
+    'selenium', 'webdriver_manager', 'pandas', 'konlpy', 'jpype', 'openai', 'httpx',
+    'tenacity', 'faiss', 'numpy', 'requests', 'bs4', 'langchain', 'langchain_openai',
+    'langchain_community', 'crewai', 'tiktoken', 'opentelemetry.sdk', 'PIL',
+)
+DEFAULT_TARGETS = ('news.urls',)  # URLconf → views/api 전체 (워커가 첫 요청 전에 불러오는 범위)
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+_CHILD_SCRIPT = """
+import resource, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_ms = (time.perf_counter() - started) * 1000
+for name in sys.argv[1:]:
+    __import__(name)
+total_ms = (time.perf_counter() - started) * 1000
+print(f"@@ {setup_ms:.1f} {total_ms:.1f} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}", file=sys.stderr)
+print("@@modules " + " ".join(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → [(모듈, 자체 µs, 누적 µs, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def profile(targets):
+    """새 프로세스에서 targets import → (행 목록, setup ms, 전체 ms, 최대 RSS KB, 로드된 모듈 집합)"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD_SCRIPT, *targets],
+        cwd=settings.BASE_DIR, env=dict(os.environ), capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        raise CommandError(f"import 실패:\n{completed.stderr[-2000:]}")
+
+    setup_ms = total_ms = 0.0
+    max_rss_kb = 0
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith('@@modules '):
+            modules = set(line.split()[1:])
+        elif line.startswith('@@ '):
+            _, setup, total, rss = line.split()
+            setup_ms, total_ms, max_rss_kb = float(setup), float(total), int(rss)
+    return parse_importtime(completed.stderr), setup_ms, total_ms, max_rss_kb, modules
+
+
+class Command(BaseCommand):
+    help = 'python -X importtime으로 모듈 import 시간을 재고 예산/지연 로딩 규칙을 검사'
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='*', help=f"import할 모듈 (기본 {', '.join(DEFAULT_TARGETS)})")
+        parser.add_argument('--budget-ms', type=float, help='django.setup() 이후 대상 import 시간 예산 (ms)')
+        parser.add_argument('--top', type=int, default=10, help='누적 시간이 긴 모듈 상위 N개 출력')
+        parser.add_argument('--allow', action='append', default=[], help='이번 실행에서 허용할 지연 로딩 모듈')
+
+    def handle(self, *args, **options):
+        targets = options['targets'] or list(DEFAULT_TARGETS)
+        budgets = getattr(settings, 'IMPORT_TIME_BUDGETS_MS', {})
+        budget_ms = options['budget_ms'] or budgets.get(' '.join(targets))
+        deferred = [
+            name for name in getattr(settings, 'IMPORT_DEFERRED_MODULES', DEFAULT_DEFERRED_MODULES)
+            if name not in options['allow']
+        ]
+
+        rows, setup_ms, total_ms, max_rss_kb, modules = profile(targets)
+        import_ms = total_ms - setup_ms
+
+        self.stdout.write(f"== {' '.join(targets)} ==")
+        self.stdout.write(f"django.setup(): {setup_ms:.1f} ms, 대상 import: {import_ms:.1f} ms, "
+                          f"최대 RSS: {max_rss_kb / 1024:.1f} MB, 로드된 모듈 {len(modules)}개")
+
+        # 최상위 패키지 단위 누적 시간 (depth 0 = 처음 import된 지점)
+        top_level = sorted((row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True)
+        self.stdout.write(f"-- 누적 시간 상위 {options['top']} (최상위 import) --")
+        for name, self_us, cumulative_us, _ in top_level[:options['top']]:
+            self.stdout.write(f"{cumulative_us / 1000:9.1f} ms  (자체 {self_us / 1000:7.1f} ms)  {name}")
+
+        failures = []
+        loaded = sorted(
+            name for name in deferred
+            if name in modules or any(module.startswith(name + '.') for module in modules)
+        )
+        if loaded:
+            failures.append(f"지연 로딩 대상이 import 시점에 로드됨: {', '.join(loaded)}")
+        if budget_ms is not None and import_ms > budget_ms:
+            failures.append(f"import 시간 {import_ms:.1f} ms > 예산 {budget_ms:.1f} ms")
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(self.style.ERROR(failure))
+            raise CommandError('import 예산 검사 실패')
+        self.stdout.write(self.style.SUCCESS('import 예산 검사 통과'))
@@ -0,0 +1,43 @@
+# Generated by Django 4.2 on 2026-10-19 02:19
+
+from django.db import migrations, models
+
+
+def remove_duplicate_urls(apps, schema_editor):
+    """unique 제약 추가 전 같은 URL의 기사 중 가장 최근 것만 남김"""
+    Article = apps.get_model('news', 'Article')
+    seen = set()
+    duplicate_ids = []
+    for article_id, url in Article.objects.order_by('url', '-updated_at', '-id').values_list('id', 'url'):
+        if url in seen:
+            duplicate_ids.append(article_id)
+        else:
+            seen.add(url)
+    if duplicate_ids:
+        Article.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_newssummary_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='press_name',
+            field=models.CharField(blank=True, default='', max_length=50, verbose_name='언론사명'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='rank',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='순위'),
+        ),
+        migrations.RunPython(remove_duplicate_urls, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='article',
+            name='url',
+            field=models.URLField(unique=True, verbose_name='기사 링크'),
+        ),
+    ]
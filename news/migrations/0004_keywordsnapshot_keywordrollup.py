@@ -0,0 +1,57 @@
+# Generated by Django 4.2 on 2026-10-19 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_article_press_rank_unique_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', '시간'), ('day', '일')], max_length=4, verbose_name='집계 단위')),
+                ('bucket', models.DateTimeField(verbose_name='구간 시작')),
+                ('keyword', models.CharField(max_length=100, verbose_name='키워드')),
+                ('article_count', models.PositiveIntegerField(default=0, verbose_name='기사 수 합계')),
+                ('crawl_count', models.PositiveIntegerField(default=0, verbose_name='크롤링 횟수')),
+                ('peak_count', models.PositiveIntegerField(default=0, verbose_name='최대 기사 수')),
+            ],
+            options={
+                'verbose_name': '키워드 집계',
+                'verbose_name_plural': '키워드 집계 목록',
+                'ordering': ['period', 'keyword', 'bucket'],
+            },
+        ),
+        migrations.CreateModel(
+            name='KeywordSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('crawled_time', models.DateTimeField(verbose_name='크롤링 시각')),
+                ('keyword', models.CharField(max_length=100, verbose_name='키워드')),
+                ('article_count', models.PositiveIntegerField(verbose_name='기사 수')),
+                ('press_counts', models.JSONField(default=dict, verbose_name='언론사별 기사 수')),
+            ],
+            options={
+                'verbose_name': '키워드 스냅샷',
+                'verbose_name_plural': '키워드 스냅샷 목록',
+                'ordering': ['-crawled_time', '-article_count'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='keywordsnapshot',
+            index=models.Index(fields=['keyword', 'crawled_time'], name='news_keywor_keyword_77d5fd_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='keywordsnapshot',
+            constraint=models.UniqueConstraint(fields=('crawled_time', 'keyword'), name='uniq_keyword_snapshot'),
+        ),
+        migrations.AddConstraint(
+            model_name='keywordrollup',
+            constraint=models.UniqueConstraint(fields=('keyword', 'period', 'bucket'), name='uniq_keyword_rollup'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2 on 2026-10-19 02:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_keywordsnapshot_keywordrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('running', '진행 중'), ('published', '공개됨')], default='running', max_length=10, verbose_name='상태')),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='시작 시각')),
+                ('deadline', models.DateTimeField(verbose_name='마감 시각')),
+                ('crawled_time', models.DateTimeField(blank=True, null=True, verbose_name='공개 스냅샷 시각')),
+                ('items', models.JSONField(default=list, verbose_name='병합된 기사 목록')),
+                ('press_count', models.PositiveSmallIntegerField(default=0, verbose_name='전체 언론사 수')),
+                ('completed_count', models.PositiveSmallIntegerField(default=0, verbose_name='완료 언론사 수')),
+            ],
+            options={
+                'verbose_name': '분산 크롤링',
+                'verbose_name_plural': '분산 크롤링 목록',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CrawlTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('press_code', models.CharField(max_length=10, verbose_name='언론사 코드')),
+                ('press_name', models.CharField(max_length=50, verbose_name='언론사명')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('leased', '처리 중'), ('done', '완료'), ('failed', '실패'), ('skipped', '마감 초과')], default='pending', max_length=10, verbose_name='상태')),
+                ('lease_owner', models.CharField(blank=True, default='', max_length=100, verbose_name='임대 워커')),
+                ('lease_expires', models.DateTimeField(blank=True, null=True, verbose_name='임대 만료')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('items', models.JSONField(default=list, verbose_name='수집 기사')),
+                ('error', models.TextField(blank=True, default='', verbose_name='마지막 오류')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시각')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='news.crawlrun', verbose_name='크롤링')),
+            ],
+            options={
+                'verbose_name': '언론사 크롤링 작업',
+                'verbose_name_plural': '언론사 크롤링 작업 목록',
+                'ordering': ['run', 'press_code'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='crawlrun',
+            index=models.Index(fields=['status', 'crawled_time'], name='news_crawlr_status_89f666_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='crawltask',
+            index=models.Index(fields=['status', 'lease_expires'], name='news_crawlt_status_08bd7a_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='crawltask',
+            constraint=models.UniqueConstraint(fields=('run', 'press_code'), name='uniq_crawl_task_press'),
+        ),
+    ]
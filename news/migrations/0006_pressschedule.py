@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-19 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_crawlrun_crawltask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PressSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('press_code', models.CharField(max_length=10, unique=True, verbose_name='언론사 코드')),
+                ('press_name', models.CharField(max_length=50, verbose_name='언론사명')),
+                ('interval_seconds', models.PositiveIntegerField(verbose_name='크롤링 주기 (초)')),
+                ('next_due', models.DateTimeField(db_index=True, verbose_name='다음 크롤링 시각')),
+                ('last_crawled', models.DateTimeField(blank=True, null=True, verbose_name='마지막 크롤링')),
+                ('last_urls', models.JSONField(default=list, verbose_name='마지막 랭킹 URL (순위 순)')),
+                ('last_changes', models.PositiveSmallIntegerField(default=0, verbose_name='마지막 변동 순위 수')),
+                ('churn_per_hour', models.FloatField(blank=True, null=True, verbose_name='시간당 변동 순위 수 (지수 평균)')),
+                ('crawls', models.PositiveIntegerField(default=0, verbose_name='크롤링 횟수')),
+                ('last_decision', models.CharField(blank=True, default='', max_length=200, verbose_name='마지막 주기 결정')),
+            ],
+            options={
+                'verbose_name': '언론사 크롤링 주기',
+                'verbose_name_plural': '언론사 크롤링 주기 목록',
+                'ordering': ['next_due'],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2 on 2026-10-19 02:59
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_pressschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, unique=True, verbose_name='URL')),
+                ('etag', models.CharField(blank=True, default='', max_length=200, verbose_name='ETag')),
+                ('last_modified', models.CharField(blank=True, default='', max_length=100, verbose_name='Last-Modified')),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64, verbose_name='내용 해시')),
+                ('checked_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 확인')),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 변경')),
+            ],
+            options={
+                'verbose_name': '페이지 지문',
+                'verbose_name_plural': '페이지 지문 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='crawlrun',
+            name='unchanged_presses',
+            field=models.JSONField(default=list, verbose_name='직전 스냅샷과 같은 언론사 코드'),
+        ),
+        migrations.AddField(
+            model_name='crawltask',
+            name='unchanged',
+            field=models.BooleanField(default=False, verbose_name='랭킹 변경 없음'),
+        ),
+    ]
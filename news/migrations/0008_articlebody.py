@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-19 03:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_pagefingerprint_unchanged'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleBody',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, unique=True, verbose_name='URL')),
+                ('body', models.BinaryField(verbose_name='본문 (zlib 압축)')),
+                ('image_url', models.URLField(blank=True, default='', max_length=500, verbose_name='대표 이미지')),
+                ('status', models.CharField(choices=[('ok', '정상'), ('missing', '본문 없음')], default='ok', max_length=10, verbose_name='상태')),
+                ('source', models.CharField(default='http', max_length=10, verbose_name='수집 방식')),
+                ('etag', models.CharField(blank=True, default='', max_length=200, verbose_name='ETag')),
+                ('last_modified', models.CharField(blank=True, default='', max_length=100, verbose_name='Last-Modified')),
+                ('size', models.PositiveIntegerField(default=0, verbose_name='압축 크기 (bytes)')),
+                ('raw_size', models.PositiveIntegerField(default=0, verbose_name='원문 크기 (bytes)')),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 확인')),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 변경')),
+                ('last_accessed', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='마지막 사용')),
+            ],
+            options={
+                'verbose_name': '기사 본문',
+                'verbose_name_plural': '기사 본문 목록',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-19 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_articlebody'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pressschedule',
+            name='failures',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='연속 실패 횟수'),
+        ),
+    ]
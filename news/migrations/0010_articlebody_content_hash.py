@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-19 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_pressschedule_failures'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articlebody',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=32, verbose_name='본문 해시'),
+        ),
+    ]
@@ -17,8 +17,10 @@ class Keyword(models.Model):
 
 class Article(models.Model):
     title = models.CharField(max_length=200, verbose_name='제목')
-    url = models.URLField(verbose_name='기사 링크')
+    url = models.URLField(unique=True, verbose_name='기사 링크')
     source = models.CharField(max_length=50, verbose_name='언론사')
+    press_name = models.CharField(max_length=50, blank=True, default='', verbose_name='언론사명')
+    rank = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='순위')
     published_at = models.DateTimeField(verbose_name='발행일')
     summary = models.TextField(null=True, blank=True, verbose_name='요약')
     content = models.TextField(null=True, blank=True, verbose_name='본문')
@@ -63,4 +65,186 @@ class NewsSummary(models.Model):
     @classmethod
     def cleanup_old_summaries(cls):
         threshold = timezone.now() - timedelta(minutes=30)
-        cls.objects.filter(created_at__lt=threshold).delete()
\ No newline at end of file
+        cls.objects.filter(created_at__lt=threshold).delete()
+
+class KeywordSnapshot(models.Model):
+    """크롤링 1회의 키워드별 기사 수 (언론사별 분포 포함)"""
+    crawled_time = models.DateTimeField(verbose_name='크롤링 시각')
+    keyword = models.CharField(max_length=100, verbose_name='키워드')
+    article_count = models.PositiveIntegerField(verbose_name='기사 수')
+    press_counts = models.JSONField(default=dict, verbose_name='언론사별 기사 수')
+
+    class Meta:
+        verbose_name = '키워드 스냅샷'
+        verbose_name_plural = '키워드 스냅샷 목록'
+        ordering = ['-crawled_time', '-article_count']
+        constraints = [
+            models.UniqueConstraint(fields=['crawled_time', 'keyword'], name='uniq_keyword_snapshot'),
+        ]
+        indexes = [
+            models.Index(fields=['keyword', 'crawled_time']),
+        ]
+
+    def __str__(self):
+        return f"{self.keyword} ({self.article_count}) - {self.crawled_time.strftime('%Y-%m-%d %H:%M')}"
+
+
+class KeywordRollup(models.Model):
+    """키워드 기사 수의 시간/일 단위 누적 집계 (크롤링마다 증분 갱신)"""
+    PERIOD_HOUR = 'hour'
+    PERIOD_DAY = 'day'
+    PERIOD_CHOICES = [(PERIOD_HOUR, '시간'), (PERIOD_DAY, '일')]
+
+    period = models.CharField(max_length=4, choices=PERIOD_CHOICES, verbose_name='집계 단위')
+    bucket = models.DateTimeField(verbose_name='구간 시작')
+    keyword = models.CharField(max_length=100, verbose_name='키워드')
+    article_count = models.PositiveIntegerField(default=0, verbose_name='기사 수 합계')
+    crawl_count = models.PositiveIntegerField(default=0, verbose_name='크롤링 횟수')
+    peak_count = models.PositiveIntegerField(default=0, verbose_name='최대 기사 수')
+
+    class Meta:
+        verbose_name = '키워드 집계'
+        verbose_name_plural = '키워드 집계 목록'
+        ordering = ['period', 'keyword', 'bucket']
+        constraints = [
+            # (keyword, period, bucket) 순서의 unique 인덱스가 추이 조회를 그대로 커버
+            models.UniqueConstraint(fields=['keyword', 'period', 'bucket'], name='uniq_keyword_rollup'),
+        ]
+
+    def __str__(self):
+        return f"{self.keyword} [{self.period}] {self.bucket.strftime('%Y-%m-%d %H:%M')}: {self.article_count}"
+
+
+class CrawlRun(models.Model):
+    """분산 크롤링 1회 - 언론사별 작업(CrawlTask)을 모아 하나의 스냅샷으로 공개 (news/crawl_shards.py)"""
+    STATUS_RUNNING = 'running'
+    STATUS_PUBLISHED = 'published'
+    STATUS_CHOICES = [(STATUS_RUNNING, '진행 중'), (STATUS_PUBLISHED, '공개됨')]
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_RUNNING, verbose_name='상태')
+    started_at = models.DateTimeField(default=timezone.now, verbose_name='시작 시각')
+    deadline = models.DateTimeField(verbose_name='마감 시각')
+    crawled_time = models.DateTimeField(null=True, blank=True, verbose_name='공개 스냅샷 시각')
+    items = models.JSONField(default=list, verbose_name='병합된 기사 목록')
+    press_count = models.PositiveSmallIntegerField(default=0, verbose_name='전체 언론사 수')
+    completed_count = models.PositiveSmallIntegerField(default=0, verbose_name='완료 언론사 수')
+    unchanged_presses = models.JSONField(default=list, verbose_name='직전 스냅샷과 같은 언론사 코드')
+
+    class Meta:
+        verbose_name = '분산 크롤링'
+        verbose_name_plural = '분산 크롤링 목록'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['status', 'crawled_time']),
+        ]
+
+    def __str__(self):
+        return f"크롤링 #{self.pk} [{self.status}] {self.completed_count}/{self.press_count}"
+
+
+class CrawlTask(models.Model):
+    """언론사 하나의 랭킹 크롤링 작업 - 워커가 임대(lease)해 처리하고 결과를 items에 기록"""
+    STATUS_PENDING = 'pending'
+    STATUS_LEASED = 'leased'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_SKIPPED = 'skipped'  # 마감까지 처리되지 않음
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'), (STATUS_LEASED, '처리 중'), (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'), (STATUS_SKIPPED, '마감 초과'),
+    ]
+
+    run = models.ForeignKey(CrawlRun, on_delete=models.CASCADE, related_name='tasks', verbose_name='크롤링')
+    press_code = models.CharField(max_length=10, verbose_name='언론사 코드')
+    press_name = models.CharField(max_length=50, verbose_name='언론사명')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='상태')
+    lease_owner = models.CharField(max_length=100, blank=True, default='', verbose_name='임대 워커')
+    lease_expires = models.DateTimeField(null=True, blank=True, verbose_name='임대 만료')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    items = models.JSONField(default=list, verbose_name='수집 기사')
+    error = models.TextField(blank=True, default='', verbose_name='마지막 오류')
+    unchanged = models.BooleanField(default=False, verbose_name='랭킹 변경 없음')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='완료 시각')
+
+    class Meta:
+        verbose_name = '언론사 크롤링 작업'
+        verbose_name_plural = '언론사 크롤링 작업 목록'
+        ordering = ['run', 'press_code']
+        constraints = [
+            models.UniqueConstraint(fields=['run', 'press_code'], name='uniq_crawl_task_press'),
+        ]
+        indexes = [
+            # 워커의 임대 대상 조회 (대기 또는 임대 만료)
+            models.Index(fields=['status', 'lease_expires']),
+        ]
+
+    def __str__(self):
+        return f"{self.press_name}({self.press_code}) [{self.status}] #{self.run_id}"
+
+
+class PressSchedule(models.Model):
+    """언론사별 적응형 크롤링 주기 - 랭킹 변동(churn)에 맞춰 다음 크롤링 시각을 정함 (news/crawl_schedule.py)"""
+    press_code = models.CharField(max_length=10, unique=True, verbose_name='언론사 코드')
+    press_name = models.CharField(max_length=50, verbose_name='언론사명')
+    interval_seconds = models.PositiveIntegerField(verbose_name='크롤링 주기 (초)')
+    next_due = models.DateTimeField(db_index=True, verbose_name='다음 크롤링 시각')
+    last_crawled = models.DateTimeField(null=True, blank=True, verbose_name='마지막 크롤링')
+    last_urls = models.JSONField(default=list, verbose_name='마지막 랭킹 URL (순위 순)')
+    last_changes = models.PositiveSmallIntegerField(default=0, verbose_name='마지막 변동 순위 수')
+    churn_per_hour = models.FloatField(null=True, blank=True, verbose_name='시간당 변동 순위 수 (지수 평균)')
+    crawls = models.PositiveIntegerField(default=0, verbose_name='크롤링 횟수')
+    failures = models.PositiveSmallIntegerField(default=0, verbose_name='연속 실패 횟수')
+    last_decision = models.CharField(max_length=200, blank=True, default='', verbose_name='마지막 주기 결정')
+
+    class Meta:
+        verbose_name = '언론사 크롤링 주기'
+        verbose_name_plural = '언론사 크롤링 주기 목록'
+        ordering = ['next_due']
+
+    def __str__(self):
+        return f"{self.press_name}({self.press_code}) 주기 {self.interval_seconds}s, 다음 {self.next_due}"
+
+
+class PageFingerprint(models.Model):
+    """크롤링한 페이지의 조건부 요청 검증자(ETag/Last-Modified)와 내용 해시 (crawling/page_fetcher.py)"""
+    url = models.URLField(max_length=500, unique=True, verbose_name='URL')
+    etag = models.CharField(max_length=200, blank=True, default='', verbose_name='ETag')
+    last_modified = models.CharField(max_length=100, blank=True, default='', verbose_name='Last-Modified')
+    content_hash = models.CharField(max_length=64, blank=True, default='', verbose_name='내용 해시')
+    checked_at = models.DateTimeField(default=timezone.now, verbose_name='마지막 확인')
+    changed_at = models.DateTimeField(default=timezone.now, verbose_name='마지막 변경')
+
+    class Meta:
+        verbose_name = '페이지 지문'
+        verbose_name_plural = '페이지 지문 목록'
+
+    def __str__(self):
+        return f"{self.url} ({self.content_hash[:8]})"
+
+
+class ArticleBody(models.Model):
+    """기사 본문 저장소 - URL당 한 번 받아 정리한 본문을 압축해 보관 (crawling/article_store.py)"""
+    STATUS_OK = 'ok'
+    STATUS_MISSING = 'missing'  # 페이지에 본문 영역(#dic_area)이 없음
+    STATUS_CHOICES = [(STATUS_OK, '정상'), (STATUS_MISSING, '본문 없음')]
+
+    url = models.URLField(max_length=500, unique=True, verbose_name='URL')
+    body = models.BinaryField(verbose_name='본문 (zlib 압축)')
+    image_url = models.URLField(max_length=500, blank=True, default='', verbose_name='대표 이미지')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_OK, verbose_name='상태')
+    source = models.CharField(max_length=10, default='http', verbose_name='수집 방식')  # http | selenium
+    etag = models.CharField(max_length=200, blank=True, default='', verbose_name='ETag')
+    last_modified = models.CharField(max_length=100, blank=True, default='', verbose_name='Last-Modified')
+    size = models.PositiveIntegerField(default=0, verbose_name='압축 크기 (bytes)')
+    raw_size = models.PositiveIntegerField(default=0, verbose_name='원문 크기 (bytes)')
+    content_hash = models.CharField(max_length=32, blank=True, default='', verbose_name='본문 해시')
+    fetched_at = models.DateTimeField(default=timezone.now, verbose_name='마지막 확인')
+    changed_at = models.DateTimeField(default=timezone.now, verbose_name='마지막 변경')
+    last_accessed = models.DateTimeField(default=timezone.now, db_index=True, verbose_name='마지막 사용')
+
+    class Meta:
+        verbose_name = '기사 본문'
+        verbose_name_plural = '기사 본문 목록'
+
+    def __str__(self):
+        return f"{self.url} [{self.status}] {self.size}B"
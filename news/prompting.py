@@ -0,0 +1,213 @@
+"""
+news/prompting.py - 토큰 예산 기반 프롬프트 구성
+
+기사 목록을 그대로 이어 붙이지 않고 tiktoken으로 토큰을 세어
+우선순위(순위, 언론사 다양성)대로 예산 안에 채운다.
+어떤 기사를 넣고/자르고/뺐는지는 PackedPrompt.decisions에 남긴다.
+
+우선순위: 언론사별 최상위 기사를 한 바퀴씩 돌며(라운드 로빈) 채우므로
+한 언론사의 기사만으로 예산이 소진되지 않는다.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List
+
+from django.conf import settings
+
+logger = logging.getLogger('news')
+
+DEFAULT_ENCODING = 'cl100k_base'
+# 용도별 기본 예산(토큰) - settings.LLM_PROMPT_BUDGETS로 덮어쓸 수 있음
+DEFAULT_BUDGETS = {
+    'comparison': 9000,        # article_summary: 16k 컨텍스트 - 응답 4000 - 시스템 프롬프트/여유
+    'comparison_map': 2500,    # map-reduce의 언론사별 부분 분석 (4k 모델)
+    'keyword_titles': 400,     # analyze_keywords_with_llm: 주요 기사 제목
+    'keyword_press_stats': 500,
+}
+DEFAULT_ITEM_BUDGET = 600      # 기사 1건이 차지할 수 있는 최대 토큰
+MIN_ITEM_TOKENS = 40           # 이보다 적게 남으면 잘라 넣지 않고 제외
+
+
+@lru_cache(maxsize=1)
+def _base_encoding():
+    """기본 토크나이저 (BPE 파일을 받을 수 없는 환경이면 None)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken 토크나이저 로드 실패 - 글자 수 기반 추정 사용: {str(e)}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _encoding(model):
+    """모델 토크나이저 (모르는 모델은 기본 인코딩 사용)"""
+    if _base_encoding() is None:
+        return None
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return _base_encoding()
+
+
+def count_tokens(text, model='gpt-3.5-turbo'):
+    encoding = _encoding(model)
+    if encoding is None:
+        # 한글은 대략 글자당 1토큰, 영문/숫자는 4글자당 1토큰으로 보수적으로 추정
+        return math.ceil(sum(1 if ord(ch) > 127 else 0.25 for ch in text))
+    return len(encoding.encode(text))
+
+
+def truncate_to_tokens(text, max_tokens, model='gpt-3.5-turbo'):
+    """텍스트를 max_tokens 이하로 자름 (잘린 경우 말줄임표 추가)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    encoding = _encoding(model)
+    if encoding is None:
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if count_tokens(text[:mid] + '…', model) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + '…'
+    return encoding.decode(encoding.encode(text)[:max(max_tokens - 1, 0)]) + '…'
+
+
+def get_budget(purpose):
+    budgets = {**DEFAULT_BUDGETS, **getattr(settings, 'LLM_PROMPT_BUDGETS', {})}
+    return budgets[purpose]
+
+
+@dataclass
+class PackedPrompt:
+    text: str
+    tokens: int
+    budget: int
+    included: List = field(default_factory=list)
+    decisions: List[dict] = field(default_factory=list)
+
+    @property
+    def dropped_count(self):
+        return sum(1 for d in self.decisions if d['action'] == 'dropped')
+
+    @property
+    def truncated_count(self):
+        return sum(1 for d in self.decisions if d['action'] == 'truncated')
+
+    def stats(self):
+        return {
+            'budget': self.budget,
+            'tokens': self.tokens,
+            'included': len(self.included),
+            'truncated': self.truncated_count,
+            'dropped': self.dropped_count,
+        }
+
+
+def _priority_order(items):
+    """언론사별로 순위순 정렬 후 라운드 로빈으로 섞은 순서"""
+    by_press = {}
+    for item in sorted(items, key=lambda x: x.get('rank') or 999):
+        press = item.get('source') or item.get('company_name') or ''
+        by_press.setdefault(press, []).append(item)
+
+    # 최상위 기사의 순위가 높은 언론사부터 한 바퀴씩
+    queues = sorted(by_press.values(), key=lambda articles: articles[0].get('rank') or 999)
+    ordered = []
+    depth = 0
+    while any(depth < len(queue) for queue in queues):
+        ordered.extend(queue[depth] for queue in queues if depth < len(queue))
+        depth += 1
+    return ordered
+
+
+def pack_articles(items, format_item: Callable, budget, separator='\n\n', max_items=None,
+                  item_budget=DEFAULT_ITEM_BUDGET, model='gpt-3.5-turbo', label='prompt'):
+    """
+    기사 목록을 토큰 예산 안에 우선순위대로 채워 프롬프트 본문 생성
+
+    Args:
+        items: 기사 dict/NewsItem 목록 (rank, source 또는 company_name 사용)
+        format_item: 기사 → 프롬프트 문자열
+        budget: 본문 전체 토큰 예산
+        max_items: 포함할 최대 기사 수 (None이면 예산까지)
+        item_budget: 기사 1건 최대 토큰 (넘으면 잘라서 포함, 예산/언론사 수를 넘지 않음)
+        label: 로그 식별용 이름
+
+    Returns:
+        PackedPrompt: 결과 본문은 원래 순서(입력 순서)로 정렬됨
+    """
+    separator_tokens = count_tokens(separator, model)
+    # 언론사마다 최소 1건은 들어갈 수 있도록 기사당 상한을 예산/언론사 수로 제한
+    press_count = len({item.get('source') or item.get('company_name') or '' for item in items}) or 1
+    item_budget = min(item_budget, max(budget // press_count, MIN_ITEM_TOKENS))
+    position = {id(item): i for i, item in enumerate(items)}
+    remaining = budget
+    chosen = []
+    decisions = []
+
+    for item in _priority_order(items):
+        text = format_item(item)
+        tokens = count_tokens(text, model)
+        cost = separator_tokens if chosen else 0
+        limit = min(item_budget, remaining - cost)
+
+        decision = {
+            'title': item.get('title'),
+            'press': item.get('source') or item.get('company_name'),
+            'rank': item.get('rank'),
+            'tokens': tokens,
+        }
+        if max_items is not None and len(chosen) >= max_items:
+            decision['action'] = 'dropped'
+            decisions.append(decision)
+            continue
+        if tokens <= limit:
+            decision['action'] = 'included'
+        elif limit >= MIN_ITEM_TOKENS:
+            text = truncate_to_tokens(text, limit, model)
+            decision['action'] = 'truncated'
+            decision['kept_tokens'] = tokens = count_tokens(text, model)
+        else:
+            decision['action'] = 'dropped'
+            decisions.append(decision)
+            continue
+
+        decisions.append(decision)
+        chosen.append((position[id(item)], item, text))
+        remaining -= tokens + cost
+
+    chosen.sort(key=lambda entry: entry[0])
+    packed = PackedPrompt(
+        text=separator.join(text for _, _, text in chosen),
+        tokens=budget - remaining,
+        budget=budget,
+        included=[item for _, item, _ in chosen],
+        decisions=decisions,
+    )
+    if packed.truncated_count or packed.dropped_count:
+        logger.info(
+            f"[{label}] 프롬프트 예산 적용: {packed.tokens}/{budget} 토큰, "
+            f"포함 {len(packed.included)}건 (잘림 {packed.truncated_count}건), 제외 {packed.dropped_count}건"
+        )
+    return packed
+
+
+def pack_lines(lines, budget, model='gpt-3.5-turbo', label='prompt'):
+    """이미 우선순위대로 정렬된 줄 목록을 예산까지만 포함"""
+    kept = []
+    used = 0
+    for line in lines:
+        tokens = count_tokens(line, model) + 1  # 줄바꿈
+        if used + tokens > budget:
+            logger.info(f"[{label}] 프롬프트 예산 적용: {len(lines) - len(kept)}줄 제외 ({used}/{budget} 토큰)")
+            break
+        kept.append(line)
+        used += tokens
+    return '\n'.join(kept)
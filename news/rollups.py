@@ -0,0 +1,140 @@
+"""
+news/rollups.py - 키워드 시계열 집계
+
+크롤링마다 키워드 순위의 각 키워드에 대해
+- KeywordSnapshot: (크롤링 시각, 키워드, 기사 수, 언론사별 기사 수) 1행
+- KeywordRollup: 시간/일 구간별 누적값을 증분 갱신
+을 일괄 저장한다. 과거 추이는 extract_keywords를 다시 돌리지 않고
+KeywordRollup의 (keyword, period, bucket) 인덱스 한 번의 조회로 얻는다.
+"""
+
+import logging
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import KeywordRollup, KeywordSnapshot
+
+logger = logging.getLogger('news')
+
+PERIODS = {
+    KeywordRollup.PERIOD_HOUR: timedelta(hours=1),
+    KeywordRollup.PERIOD_DAY: timedelta(days=1),
+}
+
+
+def bucket_start(crawled_time, period):
+    """크롤링 시각이 속한 구간의 시작 시각 (TIME_ZONE 기준)"""
+    local = timezone.localtime(crawled_time)
+    if period == KeywordRollup.PERIOD_DAY:
+        return local.replace(hour=0, minute=0, second=0, microsecond=0)
+    return local.replace(minute=0, second=0, microsecond=0)
+
+
+def count_keywords(news_items, keyword_rankings):
+    """키워드별 {기사 수, 언론사별 기사 수} - 키워드 페이지와 같은 '제목 포함' 기준"""
+    counts = {}
+    for keyword, _, _ in keyword_rankings:
+        press_counts = Counter(
+            item.get('company_name') or '' for item in news_items
+            if keyword in item['title']
+        )
+        if press_counts:
+            counts[keyword] = (sum(press_counts.values()), dict(press_counts))
+    return counts
+
+
+def record_keyword_snapshot(crawled_time, news_items, keyword_rankings):
+    """
+    크롤링 1회의 키워드 스냅샷 저장 및 시간/일 집계 증분 갱신
+
+    같은 crawled_time이 이미 기록되어 있으면 중복 집계하지 않는다.
+
+    Returns:
+        int: 저장한 키워드 수
+    """
+    counts = count_keywords(news_items, keyword_rankings)
+    if not counts or crawled_time is None:
+        return 0
+
+    with transaction.atomic():
+        if KeywordSnapshot.objects.filter(crawled_time=crawled_time).exists():
+            logger.info("이미 집계된 크롤링 - 키워드 집계 건너뜀")
+            return 0
+
+        KeywordSnapshot.objects.bulk_create([
+            KeywordSnapshot(
+                crawled_time=crawled_time,
+                keyword=keyword,
+                article_count=article_count,
+                press_counts=press_counts,
+            )
+            for keyword, (article_count, press_counts) in counts.items()
+        ])
+
+        for period in PERIODS:
+            _update_rollups(period, bucket_start(crawled_time, period), counts)
+
+    logger.info(f"키워드 집계 저장 완료: {len(counts)}개 키워드")
+    return len(counts)
+
+
+def _update_rollups(period, bucket, counts):
+    """구간의 기존 집계를 한 번에 읽어 더한 뒤 업서트"""
+    existing = {
+        rollup.keyword: rollup
+        for rollup in KeywordRollup.objects.filter(
+            period=period, bucket=bucket, keyword__in=list(counts)
+        )
+    }
+
+    rollups = []
+    for keyword, (article_count, _) in counts.items():
+        rollup = existing.get(keyword) or KeywordRollup(period=period, bucket=bucket, keyword=keyword)
+        rollup.article_count += article_count
+        rollup.crawl_count += 1
+        rollup.peak_count = max(rollup.peak_count, article_count)
+        rollups.append(rollup)
+
+    KeywordRollup.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=['keyword', 'period', 'bucket'],
+        update_fields=['article_count', 'crawl_count', 'peak_count'],
+    )
+
+
+def keyword_trend(keyword, period=KeywordRollup.PERIOD_DAY, count=7, now=None):
+    """
+    최근 count개 구간의 키워드 추이 (인덱스 1회 조회, 빈 구간은 0으로 채움)
+
+    Returns:
+        list[dict]: [{'bucket', 'article_count', 'crawl_count', 'peak_count', 'average'}, ...]
+    """
+    step = PERIODS[period]
+    end = bucket_start(now or timezone.now(), period)
+    start = end - step * (count - 1)
+
+    rows = {
+        row['bucket']: row
+        for row in KeywordRollup.objects.filter(
+            keyword=keyword, period=period, bucket__gte=start
+        ).order_by('bucket').values('bucket', 'article_count', 'crawl_count', 'peak_count')
+    }
+
+    series = []
+    for i in range(count):
+        bucket = start + step * i
+        row = rows.get(bucket) or {'article_count': 0, 'crawl_count': 0, 'peak_count': 0}
+        crawl_count = row['crawl_count']
+        series.append({
+            'bucket': bucket,
+            'article_count': row['article_count'],
+            'crawl_count': crawl_count,
+            'peak_count': row['peak_count'],
+            # 크롤링 횟수가 구간마다 다르므로 비교에는 평균 사용
+            'average': round(row['article_count'] / crawl_count, 2) if crawl_count else 0,
+        })
+    return series
@@ -0,0 +1,102 @@
+"""
+news/sample_data.py - 벤치마크/검사용 가짜 크롤링 데이터
+
+benchmark_pipeline, check_keyword_ranker 명령과 테스트(news/tests.py)가 함께 쓴다.
+
+- synthetic_items: 언론사별 순위가 있고 주제가 겹치는 가짜 크롤링 결과
+- load_fixture: 크롤링 백업(JSON)을 오프라인 측정용 NewsItem으로
+- title_pool / mutate_titles: 증분 키워드 랭킹 검사용 제목 풀과 무작위 추가·삭제·순서 변경
+- whitespace_keywords: Okt(JVM) 없이 쓰는 공백 단위 키워드 추출
+"""
+
+import re
+
+import orjson
+
+from crawling.records import NewsItem
+
+PRESSES = [
+    ('023', '조선일보'), ('025', '중앙일보'), ('020', '동아일보'), ('028', '한겨레'),
+    ('032', '경향신문'), ('469', '한국일보'), ('001', '연합뉴스'), ('055', 'SBS'),
+    ('056', 'KBS'), ('214', 'MBC'),
+]
+TOPICS = [
+    ('정부', '부동산 대책 발표', ['시장 반응 엇갈려', '실효성 논란', '후속 조치 예고']),
+    ('국회', '예산안 처리 합의', ['여야 막판 협상', '쟁점 예산 삭감', '본회의 통과']),
+    ('대통령', '외교 순방 마무리', ['정상회담 성과', '경제 협력 확대', '귀국 일정']),
+    ('한국은행', '기준금리 동결', ['물가 우려', '가계부채 부담', '하반기 인하 전망']),
+    ('검찰', '압수수색 착수', ['수사 확대', '야당 강력 반발', '관련자 소환']),
+]
+
+_WORD = re.compile(r'[가-힣A-Za-z]{2,}')
+
+
+def synthetic_items(count, article_base_url):
+    """언론사별 순위가 있는, 주제가 겹치는 가짜 크롤링 결과"""
+    items = []
+    per_press = max(1, count // len(PRESSES))
+    for p, (code, name) in enumerate(PRESSES):
+        for rank in range(1, per_press + 1):
+            subject, event, angles = TOPICS[(p + rank) % len(TOPICS)]
+            angle = angles[(p * 7 + rank) % len(angles)]
+            items.append(NewsItem(
+                company_code=code,
+                company_name=name,
+                title=f"{subject}, {event}… {angle}",
+                url=f"{article_base_url}/{code}/{rank:010d}",
+                rank=rank,
+            ))
+    return items[:count]
+
+
+def load_fixture(path, article_base_url):
+    """크롤링 백업(JSON) 또는 기사 목록을 NewsItem으로 (URL은 가짜 서버 기사 페이지로 교체)"""
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    raw_items = data.get('news_items', []) if isinstance(data, dict) else data
+    items = []
+    for i, raw in enumerate(raw_items):
+        item = NewsItem.from_dict(raw)
+        item.url = f"{article_base_url}/{item.company_code or 'x'}/{i:010d}"
+        item.cluster_id = item.story_id = None
+        item.image_url = item.thumbnail = None  # 썸네일 다운로드 없이 오프라인으로 측정
+        items.append(item)
+    return items
+
+
+def whitespace_keywords(title, keywords_per_title=4):
+    """Okt 없이 쓰는 단순 키워드 추출 (2글자 이상 단어, stop_words 제외, 순서 유지)"""
+    from news.utils import stop_words
+
+    words = [word for word in dict.fromkeys(_WORD.findall(title)) if word not in stop_words]
+    return words[:keywords_per_title]
+
+
+def title_pool(size, rng, fixture=None):
+    """검사용 제목 풀 - 픽스처/가짜 크롤링 제목 + 주제 조합으로 만든 변형 제목"""
+    items = load_fixture(fixture, '') if fixture else synthetic_items(size, '')
+    pool = [item.title for item in items]
+    subjects = [subject for subject, _, _ in TOPICS]
+    phrases = [phrase for _, event, angles in TOPICS for phrase in (event, *angles)]
+    while len(pool) < size * 2:
+        pool.append(f"{rng.choice(subjects)} {rng.choice(phrases)}… {rng.choice(phrases)}")
+    return pool
+
+
+def mutate_titles(titles, pool, rng, churn=0.2):
+    """제목 목록의 무작위 변경 - 전체 삭제, 순서만 섞기, 또는 churn 비율까지 빼고 넣기 (중복 제목 포함)"""
+    titles = list(titles)
+    action = rng.random()
+    if action < 0.05:
+        return []  # 빈 목록에서 다시 채우는 경우
+    if action < 0.15:
+        rng.shuffle(titles)  # 순서만 바뀐 경우 (동점 순서)
+        return titles
+    count = rng.randint(0, max(1, int(len(titles) * churn)))
+    for _ in range(min(count, len(titles))):
+        titles.pop(rng.randrange(len(titles)))
+    for _ in range(count):
+        titles.insert(rng.randint(0, len(titles)), rng.choice(pool))
+    if not titles:
+        titles = rng.choices(pool, k=len(pool) // 2)
+    return titles
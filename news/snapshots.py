@@ -0,0 +1,174 @@
+"""
+news/snapshots.py - 크롤링 단위 페이지 스냅샷
+
+크롤링 1회마다 주요 페이지(news_list, top_articles, keyword_articles)의 HTML을
+한 번만 렌더링하고 gzip/brotli로 미리 압축해 캐시에 보관한다.
+요청 시에는 압축된 바이트를 그대로 내려주고, crawled_time에서 만든
+ETag/Last-Modified로 조건부 요청(If-None-Match, If-Modified-Since)에 304를 응답한다.
+"""
+
+import gzip
+import hashlib
+import logging
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.urls import resolve
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+try:
+    import brotli  # 선택 의존성 - 없으면 gzip만 사용
+except ImportError:
+    brotli = None
+
+from .instrumentation import stage
+
+logger = logging.getLogger('news')
+
+SNAPSHOT_TEMPLATE = 'news/news_list.html'
+SNAPSHOT_CACHE_PREFIX = 'page_snapshot'
+GZIP_LEVEL = 9          # 크롤링당 한 번만 압축하므로 최고 압축률 사용
+BROTLI_QUALITY = 11
+
+
+def snapshot_version(crawled_time):
+    """crawled_time을 스냅샷 버전 문자열(epoch 초)로 변환"""
+    if not crawled_time:
+        return None
+    if isinstance(crawled_time, str):
+        try:
+            crawled_time = timezone.datetime.fromisoformat(crawled_time.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return str(int(crawled_time.timestamp()))
+
+
+def make_etag(page_key, version):
+    """페이지 키와 버전으로 약한(weak) ETag 생성 - 인코딩별 바이트가 달라 W/ 사용"""
+    digest = hashlib.md5(page_key.encode('utf-8')).hexdigest()[:8]
+    return f'W/"{version}-{digest}"'
+
+
+def _cache_key(page_key, version):
+    digest = hashlib.md5(page_key.encode('utf-8')).hexdigest()
+    return f"{SNAPSHOT_CACHE_PREFIX}:{digest}:{version}"
+
+
+def _snapshot_request(path):
+    """크롤링 시점 렌더링용 요청 객체 (템플릿의 resolver_match 분기 유지)"""
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    request.META = {'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'REQUEST_METHOD': 'GET'}
+    request.resolver_match = resolve(path)
+    return request
+
+
+def build_snapshot(page_key, version, context, request, last_modified):
+    """HTML을 렌더링해 gzip/brotli로 압축한 뒤 캐시에 저장"""
+    with stage('render'):
+        html = render_to_string(SNAPSHOT_TEMPLATE, context, request=request).encode('utf-8')
+    snapshot = {
+        'version': version,
+        'etag': make_etag(page_key, version),
+        'last_modified': last_modified,
+        'gzip': gzip.compress(html, compresslevel=GZIP_LEVEL),
+        'br': brotli.compress(html, quality=BROTLI_QUALITY) if brotli else None,
+    }
+    cache.set(_cache_key(page_key, version), snapshot)
+    logger.info(
+        f"스냅샷 생성: {page_key} v{version} "
+        f"(원본 {len(html)}B, gzip {len(snapshot['gzip'])}B"
+        f"{', br ' + str(len(snapshot['br'])) + 'B' if snapshot['br'] else ''})"
+    )
+    return snapshot
+
+
+def prerender_snapshots(crawled_time, pages):
+    """
+    크롤링 직후 주요 페이지 스냅샷을 미리 생성
+
+    Args:
+        crawled_time: 크롤링 시각 (버전 기준)
+        pages (list): (page_key, path, context_builder) 튜플의 리스트
+    """
+    version = snapshot_version(crawled_time)
+    if version is None:
+        return
+    last_modified = int(version)
+    for page_key, path, build_context in pages:
+        try:
+            build_snapshot(page_key, version, build_context(), _snapshot_request(path), last_modified)
+        except Exception as e:
+            logger.error(f"스냅샷 사전 생성 실패 ({page_key}): {str(e)}")
+
+
+def _opaque_tag(tag):
+    """약한 ETag 표시(W/)를 뗀 값"""
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def _is_not_modified(request, etag, last_modified):
+    """조건부 요청 판정 - If-None-Match 우선, 없으면 If-Modified-Since"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        # GET 요청은 약한 비교(W/ 무시)로 충분
+        candidates = parse_etags(if_none_match)
+        return '*' in candidates or _opaque_tag(etag) in {_opaque_tag(tag) for tag in candidates}
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return if_modified_since is not None and last_modified <= if_modified_since
+
+
+def _apply_validators(response, snapshot_etag, last_modified):
+    response['ETag'] = snapshot_etag
+    response['Last-Modified'] = http_date(last_modified)
+    # 브라우저가 항상 재검증하도록 (304는 거의 비용이 없음)
+    response['Cache-Control'] = 'no-cache'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def serve_snapshot(request, page_key, crawled_time, build_context):
+    """
+    스냅샷 응답 반환
+
+    캐시에 스냅샷이 없을 때만 build_context()를 호출해 렌더링한다. 스냅샷은 모든 방문자가
+    공유하므로 방문자의 요청(CSRF 토큰, 세션)이 아닌 합성 요청으로 렌더링한다.
+    crawled_time이 없으면(버전을 알 수 없으면) 일반 렌더링으로 처리한다.
+    """
+    version = snapshot_version(crawled_time)
+    if version is None:
+        get_token(request)
+        context = build_context()
+        with stage('render'):
+            html = render_to_string(SNAPSHOT_TEMPLATE, context, request=request)
+        return HttpResponse(html)
+
+    etag = make_etag(page_key, version)
+    last_modified = int(version)
+    if _is_not_modified(request, etag, last_modified):
+        return _apply_validators(HttpResponseNotModified(), etag, last_modified)
+
+    # 미리 렌더링된 페이지의 CSRF 토큰은 사용자별이 아니므로 본문을 보낼 때 쿠키를 보장
+    # (304 재검증에는 쿠키/Vary: Cookie를 붙이지 않음)
+    get_token(request)
+    with stage('cache'):
+        snapshot = cache.get(_cache_key(page_key, version))
+    if snapshot is None:
+        snapshot = build_snapshot(page_key, version, build_context(), _snapshot_request(request.path), last_modified)
+
+    accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    if snapshot['br'] and 'br' in accept_encoding:
+        response = HttpResponse(snapshot['br'])
+        response['Content-Encoding'] = 'br'
+    elif 'gzip' in accept_encoding:
+        response = HttpResponse(snapshot['gzip'])
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(gzip.decompress(snapshot['gzip']))
+    response['Content-Length'] = str(len(response.content))
+    return _apply_validators(response, etag, last_modified)
@@ -0,0 +1,322 @@
+"""
+news/stories.py - 언론사 간 같은 사건(스토리) 묶기
+
+키워드 부분 문자열 일치로는 같은 사건을 다르게 표현한 제목(조선일보 vs 한겨레)을
+묶지 못한다. 제목(+1위 기사 본문 앞부분)을 로컬에서 벡터화해 faiss 인덱스에
+누적하고, 크롤링마다 최근접 이웃으로 스토리 클러스터를 만든다.
+
+- 벡터: 문자 2/3-gram을 mmh3로 DIM 차원에 해싱한 TF-IDF (외부 API 없음)
+- 인덱스: IndexIDMap2(IndexFlatIP), id = URL 해시 → 같은 기사는 교체(upsert)
+- IDF: 해시 버킷별 문서 빈도를 크롤링마다 증분 갱신 (교체/만료된 기사의 버킷은 다시 뺌)
+- 보관: STORY_RETENTION_HOURS 지난 기사는 인덱스에서 제거
+- 저장: CACHE_BACKUP_DIR/stories.faiss, stories.meta (임시 파일 → os.replace)
+- 본문: 기사 본문 저장소(crawling/article_store.py)에서 가져옴
+
+faiss/numpy는 인덱스를 처음 쓸 때 불러온다 (API만 import하는 워커의 기동 비용 절감).
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import mmh3
+import orjson
+from django.conf import settings
+from django.db import connection
+
+from .dedupe import normalize_title
+from .instrumentation import in_current_context, stage
+
+logger = logging.getLogger('news')
+
+DIM = 2048
+NGRAM_SIZES = (2, 3)
+BODY_CHARS = 600          # 본문은 앞부분만 사용 (리드 문단)
+BODY_WEIGHT = 0.5         # 제목 대비 본문 n-gram 가중치
+NEIGHBORS = 10
+DEFAULT_THRESHOLD = 0.3   # 같은 스토리로 볼 최소 코사인 유사도 (무관한 제목은 대개 0.1 미만)
+
+_index_lock = threading.Lock()
+_story_index = None
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def article_id(url):
+    """URL → faiss id (부호 있는 64bit 양수)"""
+    return mmh3.hash64(url, signed=True)[0] & 0x7FFFFFFFFFFFFFFF
+
+
+def _features(title, body=''):
+    """해시 버킷별 n-gram 빈도 (Counter[버킷])"""
+    counts = Counter()
+    for text, weight in ((normalize_title(title), 1.0), (normalize_title(body[:BODY_CHARS]), BODY_WEIGHT)):
+        if not text:
+            continue
+        for size in NGRAM_SIZES:
+            for i in range(len(text) - size + 1):
+                counts[mmh3.hash(text[i:i + size], signed=False) % DIM] += weight
+    return counts
+
+
+def fetch_lead_bodies(news_items):
+    """
+    1위 기사 본문 앞부분 (기사 본문 저장소, 저장소에 없는 기사만 병렬 요청)
+
+    방금 크롤링한 기사는 크롤러가 저장해 두었으므로 재검증하지 않는다.
+    """
+    from crawling.article_store import get_article_store
+
+    store = get_article_store()
+    urls = [item['url'] for item in news_items if item.get('rank') == 1 and item.get('url')]
+    bodies = {}
+    missing = []
+    for url in urls:
+        article = store.get(url, fetch=False)
+        if article is None:
+            missing.append(url)
+        bodies[url] = article.flat(BODY_CHARS) if article else ''
+
+    def fetch(url):
+        try:
+            with stage('body_fetch', url=url):
+                article = store.get(url, revalidate=False)
+            return url, article.flat(BODY_CHARS) if article else ''
+        finally:
+            connection.close()  # 풀 스레드의 DB 연결 정리
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            for url, body in executor.map(in_current_context(fetch), missing):
+                bodies[url] = body
+    return bodies
+
+
+class StoryIndex:
+    def __init__(self, directory):
+        import faiss
+        import numpy as np
+
+        self.directory = Path(directory)
+        self.index_file = self.directory / 'stories.faiss'
+        self.meta_file = self.directory / 'stories.meta'
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(DIM))
+        self.doc_freq = np.zeros(DIM, dtype=np.float64)
+        self.doc_count = 0
+        self.articles = {}  # id → {'url', 'title', 'company_name', 'indexed_at'}
+        self._load()
+
+    # ----- 저장/복원 -----
+    def _load(self):
+        import faiss
+        import numpy as np
+
+        if not (self.index_file.exists() and self.meta_file.exists()):
+            return
+        try:
+            meta = orjson.loads(self.meta_file.read_bytes())
+            index = faiss.read_index(str(self.index_file))
+            if index.d != DIM:
+                logger.warning("스토리 인덱스 차원이 달라 새로 만듭니다.")
+                return
+            self.index = index
+            self.doc_freq = np.asarray(meta['doc_freq'], dtype=np.float64)
+            self.doc_count = meta['doc_count']
+            self.articles = {int(k): v for k, v in meta['articles'].items()}
+        except Exception as e:
+            logger.error(f"스토리 인덱스 복원 실패 - 새로 시작: {str(e)}")
+
+    def save(self):
+        import faiss
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_index = self.index_file.with_suffix('.faiss.tmp')
+        tmp_meta = self.meta_file.with_suffix('.meta.tmp')
+        faiss.write_index(self.index, str(tmp_index))
+        tmp_meta.write_bytes(orjson.dumps({
+            'doc_freq': self.doc_freq.tolist(),
+            'doc_count': self.doc_count,
+            'articles': {str(k): v for k, v in self.articles.items()},
+        }))
+        os.replace(tmp_index, self.index_file)
+        os.replace(tmp_meta, self.meta_file)
+
+    # ----- 벡터화 -----
+    def _vectorize(self, feature_counts):
+        import faiss
+        import numpy as np
+
+        idf = np.log((1 + self.doc_count) / (1 + self.doc_freq)) + 1
+        vectors = np.zeros((len(feature_counts), DIM), dtype=np.float32)
+        for row, counts in enumerate(feature_counts):
+            for bucket, tf in counts.items():
+                vectors[row, bucket] = (1 + math.log(tf)) * idf[bucket] if tf >= 1 else tf * idf[bucket]
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _forget(self, aid):
+        """인덱스에 있는 기사의 n-gram 버킷을 문서 빈도에서 뺌 (저장된 벡터의 0이 아닌 차원)"""
+        import numpy as np
+
+        try:
+            buckets = np.flatnonzero(self.index.reconstruct(int(aid)))
+        except RuntimeError:  # 인덱스와 메타데이터가 어긋난 경우
+            return
+        self.doc_freq[buckets] = np.maximum(self.doc_freq[buckets] - 1, 0)
+
+    def _expire(self, now):
+        import numpy as np
+
+        cutoff = now - _setting('STORY_RETENTION_HOURS', 48) * 3600
+        expired = [aid for aid, meta in self.articles.items() if meta['indexed_at'] < cutoff]
+        if expired:
+            for aid in expired:
+                self._forget(aid)
+                del self.articles[aid]
+            self.doc_count = max(self.doc_count - len(expired), 0)
+            self.index.remove_ids(np.asarray(expired, dtype=np.int64))
+
+    # ----- 공개 API -----
+    def update(self, news_items, bodies=None):
+        """
+        크롤링 결과를 인덱스에 반영하고 이번 크롤링 기사의 벡터를 반환
+
+        이미 인덱스에 있는 URL은 벡터를 교체하며, 문서 빈도도 이전 벡터의 버킷을 빼고
+        새 버킷을 더해 인덱스에 있는 기사와 맞춘다.
+        """
+        import numpy as np
+
+        bodies = bodies or {}
+        now = time.time()
+        ids = np.asarray([article_id(item['url']) for item in news_items], dtype=np.int64)
+        feature_counts = [_features(item['title'], bodies.get(item['url'], '')) for item in news_items]
+
+        for aid, counts in zip(ids.tolist(), feature_counts):
+            if aid in self.articles:
+                self._forget(aid)
+            else:
+                self.doc_count += 1
+            self.doc_freq[list(counts)] += 1
+
+        vectors = self._vectorize(feature_counts)
+        self.index.remove_ids(ids)
+        self.index.add_with_ids(vectors, ids)
+        for aid, item in zip(ids.tolist(), news_items):
+            self.articles[aid] = {
+                'url': item['url'],
+                'title': item['title'],
+                'company_name': item.get('company_name', ''),
+                'indexed_at': now,
+            }
+        self._expire(now)
+        return ids, vectors
+
+    @staticmethod
+    def pairs_above(vectors, threshold):
+        """
+        vectors끼리 코사인 유사도 >= threshold인 (i, j, score) 쌍 (i != j)
+
+        이번 크롤링 기사끼리만 비교한다 - 보관 기간 전체 인덱스에서 k개 이웃을 찾으면
+        이전 크롤링 기사가 이웃 자리를 차지해 같은 크롤링의 쌍이 빠진다.
+        """
+        import faiss
+
+        current = faiss.IndexFlatIP(DIM)
+        current.add(vectors)
+        # range_search는 score > radius를 돌려주므로 경계값을 살짝 낮춤
+        limits, scores, neighbors = current.range_search(vectors, threshold - 1e-6)
+        return [
+            (i, int(neighbors[n]), float(scores[n]))
+            for i in range(len(vectors))
+            for n in range(limits[i], limits[i + 1])
+            if neighbors[n] != i
+        ]
+
+    def search(self, vectors, k=NEIGHBORS):
+        import numpy as np
+
+        k = min(k, self.index.ntotal)
+        if k == 0:
+            return np.empty((len(vectors), 0)), np.empty((len(vectors), 0), dtype=np.int64)
+        return self.index.search(vectors, k)
+
+    def similar(self, url, k=NEIGHBORS, threshold=DEFAULT_THRESHOLD):
+        """기사와 같은 스토리로 보이는 (다른 언론사 포함) 기사 목록"""
+        aid = article_id(url)
+        if aid not in self.articles:
+            return []
+        vector = self.index.reconstruct(aid).reshape(1, -1)
+        scores, neighbor_ids = self.search(vector, k + 1)
+        return [
+            dict(self.articles[nid], similarity=round(float(score), 4))
+            for score, nid in zip(scores[0], neighbor_ids[0])
+            if nid != aid and nid in self.articles and score >= threshold
+        ]
+
+
+def get_story_index():
+    global _story_index
+    with _index_lock:
+        if _story_index is None:
+            _story_index = StoryIndex(settings.CACHE_BACKUP_DIR)
+        return _story_index
+
+
+def assign_stories(news_items, threshold=DEFAULT_THRESHOLD, fetch_bodies=None):
+    """
+    크롤링 기사에 story_id를 붙이고 인덱스를 증분 갱신
+
+    이번 크롤링 기사끼리 유사도 >= threshold인 모든 쌍을 연결하며,
+    story_id는 스토리 대표 기사(가장 높은 순위)의 news_items 내 위치다.
+    """
+    if not news_items:
+        return news_items
+    if fetch_bodies is None:
+        fetch_bodies = _setting('STORY_FETCH_BODIES', True)
+    bodies = fetch_lead_bodies(news_items) if fetch_bodies else {}
+
+    story_index = get_story_index()
+    with _index_lock:
+        _, vectors = story_index.update(news_items, bodies)
+        story_index.save()
+    pairs = story_index.pairs_above(vectors, threshold)
+
+    parent = list(range(len(news_items)))
+
+    def order_key(i):
+        return (news_items[i].get('rank') or 999, i)
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in pairs:
+        root_a, root_b = find(i), find(j)
+        if root_a != root_b:
+            # 순위가 높은 기사가 스토리 대표가 되도록
+            if order_key(root_a) <= order_key(root_b):
+                parent[root_b] = root_a
+            else:
+                parent[root_a] = root_b
+
+    for i, item in enumerate(news_items):
+        if isinstance(item, dict):
+            item['story_id'] = find(i)
+        else:
+            item.story_id = find(i)
+    return news_items
+
+
+def similar_articles(url, k=NEIGHBORS, threshold=DEFAULT_THRESHOLD):
+    story_index = get_story_index()
+    with _index_lock:
+        return story_index.similar(url, k, threshold)
@@ -2,20 +2,15 @@ from django import template
 import re
 import json
 from django.core.serializers.json import DjangoJSONEncoder
+from news.dedupe import unique_by_cluster
+from news.thumbnails import thumbnail_url, thumbnail_widths
 
 register = template.Library()
 
-@register.simple_tag
-def is_duplicate(title, shown_titles):
-    """단순 중복 체크"""
-    if not shown_titles:  # 첫 번째 항목이면 중복 아님
-        return False
-        
-    # 현재 제목과 이전에 표시된 제목들을 비교
-    titles_list = shown_titles.split('|||')
-    
-    # 완전 일치만 검사
-    return title in titles_list 
+@register.filter
+def unique_clusters(items):
+    """유사 제목 클러스터별 첫 기사만 남김 (prepare_news_context의 cluster_id 사용)"""
+    return unique_by_cluster(items or [])
 
 @register.filter
 def json_encode(value):
@@ -23,4 +18,17 @@ def json_encode(value):
     return json.dumps(
         [{'title': a.title, 'content': a.content, 'press': a.press} for a in value],
         cls=DjangoJSONEncoder
-    ) 
+    )
+
+@register.filter
+def thumbnail_src(digest, ext='jpg'):
+    """썸네일 원본 해시 → 1x 이미지 URL"""
+    return thumbnail_url(digest, thumbnail_widths()[0], ext)
+
+@register.filter
+def thumbnail_srcset(digest, ext='webp'):
+    """썸네일 원본 해시 → '<url> 1x, <url> 2x' (THUMBNAIL_WIDTHS 비율 기준)"""
+    widths = thumbnail_widths()
+    return ', '.join(
+        f"{thumbnail_url(digest, width, ext)} {width / widths[0]:g}x" for width in widths
+    )
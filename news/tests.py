@@ -0,0 +1,58 @@
+import random
+
+from django.test import SimpleTestCase
+
+from news.keyword_ranker import IncrementalKeywordRanker
+from news.sample_data import mutate_titles, title_pool, whitespace_keywords
+from news.utils import rank_keywords
+
+
+class IncrementalKeywordRankerTests(SimpleTestCase):
+    """증분 키워드 랭킹 = 전체 재계산 (무작위 제목 추가/삭제/순서 변경, 공백 토크나이저)"""
+
+    ROUNDS = 150
+    TITLES = 60
+    LIMIT = 10
+
+    def assert_matches_full(self, ranker, titles, result, label):
+        expected = rank_keywords(titles, [whitespace_keywords(title) for title in titles], self.LIMIT)
+        self.assertEqual(result, expected, f"{label} (제목 {len(titles)}건)")
+
+    def test_update_matches_full_recompute(self):
+        for seed in range(3):
+            rng = random.Random(seed)
+            pool = title_pool(self.TITLES, rng)
+            ranker = IncrementalKeywordRanker(limit=self.LIMIT, extractor=whitespace_keywords)
+            titles = rng.choices(pool, k=self.TITLES)
+            for round_no in range(self.ROUNDS):
+                if round_no:
+                    titles = mutate_titles(titles, pool, rng)
+                self.assert_matches_full(ranker, titles, ranker.update(titles), f"seed {seed} 라운드 {round_no}")
+
+    def test_add_remove_matches_full_recompute(self):
+        rng = random.Random(7)
+        pool = title_pool(self.TITLES, rng)
+        ranker = IncrementalKeywordRanker(limit=self.LIMIT, extractor=whitespace_keywords)
+        titles = rng.choices(pool, k=self.TITLES)
+        ranker.update(titles)
+        for round_no in range(self.ROUNDS):
+            title = rng.choice(pool)
+            if titles and rng.random() < 0.5:
+                # remove는 처음 나온 같은 제목을 뺌
+                title = rng.choice(titles)
+                ranker.remove(title)
+                titles.remove(title)
+            else:
+                ranker.add(title)
+                titles.append(title)
+            self.assert_matches_full(ranker, titles, ranker.ranking(), f"라운드 {round_no}")
+
+    def test_extracts_each_title_once(self):
+        rng = random.Random(1)
+        pool = title_pool(self.TITLES, rng)
+        ranker = IncrementalKeywordRanker(limit=self.LIMIT, extractor=whitespace_keywords)
+        titles = rng.choices(pool, k=self.TITLES)
+        for _ in range(20):
+            ranker.update(titles)
+            titles = mutate_titles(titles, pool, rng)
+        self.assertLessEqual(ranker.extractions, len(set(pool)))
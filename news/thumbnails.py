@@ -0,0 +1,171 @@
+"""
+news/thumbnails.py - 기사 이미지 썸네일 캐시
+
+크롤링한 기사 이미지(image_url)를 크롤링당 한 번만 내려받아 화면에 표시하는 크기
+(THUMBNAIL_WIDTHS, 1x/2x)의 WebP/JPEG 썸네일로 만들고, 원본 바이트 해시를 이름으로
+디스크에 저장한다. 템플릿은 네이버 원본 대신 serve_thumbnail 뷰의 URL을 쓴다.
+
+THUMBNAIL_DIR/
+    ab/ab12...ef-336.webp     # <원본 해시>-<가로>.<확장자>
+    ab/ab12...ef-336.jpg
+    urls/<URL sha1>           # 원본 URL → 원본 해시 (다음 크롤링에서 같은 URL은 다시 받지 않음)
+
+파일 이름이 내용에서 나오므로 한 번 만든 파일은 바뀌지 않는다. 그래서 응답에
+1년짜리 immutable 캐시 헤더를 붙인다. WhiteNoise는 시작 시점에 있던 정적 파일만
+서빙하므로 크롤링 중에 생기는 썸네일은 전용 뷰로 서빙한다.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.urls import reverse
+
+from .instrumentation import annotate, in_current_context, timed
+
+logger = logging.getLogger('news')
+
+# 템플릿의 카드 이미지 영역 (md:w-[336px] h-[224px], object-cover)
+DEFAULT_SIZE = (336, 224)
+DEFAULT_WIDTHS = (336, 672)  # 1x, 2x
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+CONTENT_TYPES = {'webp': 'image/webp', 'jpg': 'image/jpeg'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_NAME = re.compile(r'^([0-9a-f]{32})-(\d+)\.(webp|jpg)$')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def thumbnail_dir():
+    return Path(_setting('THUMBNAIL_DIR', Path(settings.BASE_DIR) / 'cache_backup' / 'thumbnails'))
+
+
+def thumbnail_widths():
+    return tuple(_setting('THUMBNAIL_WIDTHS', DEFAULT_WIDTHS))
+
+
+def thumbnail_path(digest, width, ext):
+    return thumbnail_dir() / digest[:2] / f"{digest}-{width}.{ext}"
+
+
+def thumbnail_url(digest, width, ext):
+    return reverse('news:thumbnail', args=[f"{digest}-{width}.{ext}"])
+
+
+def _url_pointer(url):
+    return thumbnail_dir() / 'urls' / hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path, data):
+    """같은 이미지를 여러 워커가 동시에 만들어도 반쯤 쓴 파일이 보이지 않게 교체"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def render_thumbnails(data, digest):
+    """원본 바이트 → 크기/형식별 썸네일 파일 (이미 있으면 건너뜀)"""
+    from PIL import Image, ImageOps  # 썸네일을 만들 때만 로드
+
+    width, height = _setting('THUMBNAIL_SIZE', DEFAULT_SIZE)
+    targets = [
+        (w, ext) for w in thumbnail_widths() for ext in FORMATS
+        if not thumbnail_path(digest, w, ext).exists()
+    ]
+    if not targets:
+        return
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source).convert('RGB')
+    for w, ext in targets:
+        h = round(w * height / width)
+        # 원본보다 크게 늘리지 않음 (object-cover가 남은 부분을 채움)
+        scale = min(1.0, image.width / w, image.height / h)
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        resized = ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image_format, options = FORMATS[ext]
+        resized.save(buffer, image_format, **options)
+        _write_atomic(thumbnail_path(digest, w, ext), buffer.getvalue())
+
+
+def cache_image(url, session):
+    """이미지 URL → 원본 해시 (실패하면 None, 템플릿은 원본 URL로 대체)"""
+    pointer = _url_pointer(url)
+    try:
+        digest = pointer.read_text().strip()
+        if all(thumbnail_path(digest, w, ext).exists() for w in thumbnail_widths() for ext in FORMATS):
+            return digest
+    except OSError:
+        pass
+
+    try:
+        response = session.get(url, timeout=_setting('THUMBNAIL_FETCH_TIMEOUT', 5))
+        response.raise_for_status()
+        data = response.content
+        if len(data) > _setting('THUMBNAIL_MAX_BYTES', 10 * 1024 * 1024):
+            logger.warning(f"썸네일 원본이 너무 큼 ({len(data)} bytes): {url}")
+            return None
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        render_thumbnails(data, digest)
+        _write_atomic(pointer, digest.encode('ascii'))
+        return digest
+    except Exception as e:
+        logger.warning(f"썸네일 생성 실패: {url} - {str(e)}")
+        return None
+
+
+@timed('thumbnails')
+def attach_thumbnails(news_items):
+    """
+    기사 목록의 image_url을 썸네일로 만들고 item.thumbnail에 원본 해시를 기록
+
+    같은 URL은 크롤링 안에서 한 번만 받고, 이전 크롤링에서 만든 썸네일이 있으면 받지 않는다.
+    """
+    import requests  # 썸네일을 만들 때만 로드
+
+    urls = list(dict.fromkeys(item.image_url for item in news_items if item.image_url))
+    if not urls:
+        return news_items
+
+    with requests.Session() as session:
+        session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; newsdocs-thumbnailer)'
+        with ThreadPoolExecutor(max_workers=_setting('THUMBNAIL_WORKERS', 8)) as executor:
+            digests = dict(zip(urls, executor.map(in_current_context(lambda url: cache_image(url, session)), urls)))
+
+    for item in news_items:
+        item.thumbnail = digests.get(item.image_url) if item.image_url else None
+    annotate(images=len(urls), cached=sum(1 for digest in digests.values() if digest))
+    return news_items
+
+
+def serve_thumbnail(request, name):
+    """content-addressed 썸네일 - 파일 이름이 바뀌지 않으므로 immutable 캐시"""
+    match = _NAME.match(name)
+    if not match:
+        raise Http404
+    digest, width, ext = match.groups()
+    etag = f'"{name}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        try:
+            response = FileResponse(open(thumbnail_path(digest, width, ext), 'rb'), content_type=CONTENT_TYPES[ext])
+        except FileNotFoundError:
+            raise Http404
+    response['ETag'] = etag
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
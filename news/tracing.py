@@ -0,0 +1,99 @@
+"""
+news/tracing.py - OpenTelemetry 트레이스 내보내기 설정
+
+news/instrumentation.py의 stage()가 만드는 스팬을 어디로 보낼지 정한다.
+앱 시작 시(NewsConfig.ready) settings.TRACING을 읽어 한 번만 설정한다.
+
+TRACING = {
+    'exporter': 'file',            # None | 'file' | 'otlp' | 'console'
+    'file_path': 'logs/traces.jsonl',
+    'otlp_endpoint': 'http://localhost:4318/v1/traces',
+    'service_name': 'newsdocs',
+    'sample_ratio': 1.0,
+}
+
+file 내보내기는 스팬을 한 줄에 하나씩 JSON으로 기록한다 (수집기 없이 로컬 분석용).
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+logger = logging.getLogger('news')
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+class FileSpanExporter(SpanExporter):
+    """완료된 스팬을 JSON Lines 파일에 추가"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        try:
+            lines = ''.join(span.to_json(indent=None) + '\n' for span in spans)
+            with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            return SpanExportResult.SUCCESS
+        except OSError as e:
+            logger.error(f"트레이스 파일 기록 실패: {str(e)}")
+            return SpanExportResult.FAILURE
+
+    def shutdown(self):
+        pass
+
+
+def _exporter(config):
+    kind = config.get('exporter')
+    if kind == 'file':
+        return FileSpanExporter(config.get('file_path') or Path(settings.BASE_DIR) / 'logs' / 'traces.jsonl')
+    if kind == 'otlp':
+        # 선택 의존성 - 수집기로 보낼 때만 필요
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=config.get('otlp_endpoint'))
+    if kind == 'console':
+        return ConsoleSpanExporter()
+    raise ValueError(f"알 수 없는 트레이스 내보내기: {kind}")
+
+
+def configure_tracing():
+    """settings.TRACING에 따라 TracerProvider 설정 (내보내기가 없으면 아무것도 하지 않음)"""
+    global _configured
+    config = getattr(settings, 'TRACING', None) or {}
+    if not config.get('exporter'):
+        return False
+
+    with _configure_lock:
+        if _configured:
+            return True
+        try:
+            exporter = _exporter(config)
+        except (ImportError, ValueError) as e:
+            logger.error(f"트레이스 내보내기 설정 실패 - 트레이싱 비활성화: {str(e)}")
+            return False
+
+        provider = TracerProvider(
+            resource=Resource.create({'service.name': config.get('service_name', 'newsdocs')}),
+            sampler=ParentBased(TraceIdRatioBased(config.get('sample_ratio', 1.0))),
+        )
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+        trace.set_tracer_provider(provider)
+        _configured = True
+        logger.info(f"OpenTelemetry 트레이싱 활성화: {config['exporter']}")
+        return True
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import views, api, thumbnails
 
 app_name = 'news'
 
@@ -16,4 +16,16 @@ urlpatterns = [
     # path('api/analyze-filtered/', views.analyze_filtered_news, name='analyze_filtered_news'),
     path('summary/keyword/', views.article_summary, name='article_summary'),  # 키워드별 뉴스 요약
     path('summaries/', views.view_saved_summaries, name='saved_summaries'),
+    path('events/', views.version_events, name='version_events'),  # 현재 크롤링 버전 (ETag/304 폴링)
+    path('rankings/delta/', views.ranking_changes, name='ranking_delta'),  # 바뀐 랭킹만 조회
+    path('thumbs/<str:name>', thumbnails.serve_thumbnail, name='thumbnail'),  # 기사 이미지 썸네일 (immutable)
+    # 읽기 전용 JSON API (v1)
+    path('api/v1/rankings/', api.rankings, name='api_rankings'),
+    path('api/v1/keywords/', api.keyword_rankings, name='api_keyword_rankings'),
+    path('api/v1/keywords/windows/', api.keyword_windows, name='api_keyword_windows'),
+    path('api/v1/keywords/<str:keyword>/articles/', api.keyword_articles, name='api_keyword_articles'),
+    path('api/v1/keywords/<str:keyword>/trend/', api.keyword_trend, name='api_keyword_trend'),
+    path('api/v1/articles/similar/', api.similar_articles, name='api_similar_articles'),
+    path('api/v1/summaries/', api.summaries, name='api_summaries'),
+    path('api/v1/crawl/schedule/', api.crawl_schedule, name='api_crawl_schedule'),
 ] 
\ No newline at end of file
@@ -46,18 +46,30 @@ news/utils.py - 뉴스 키워드 추출 유틸리티
 """
 
 import logging
-from konlpy.tag import Okt
+from functools import lru_cache
 from collections import Counter
 import re
 from asgiref.sync import sync_to_async
 import asyncio
-from openai import AsyncOpenAI
 import json
-from datetime import datetime
-import inspect
-
-# 로거 설정
+import time
+from .prompting import pack_articles, pack_lines, get_budget
+from .llm import achat, INTERACTIVE
+from .instrumentation import annotate, record_stage, start_stage, timed
+from .log_pipeline import caller_name
+from crawling.press_registry import registry as press_registry
+
+# 로거 설정 - 핫패스는 하위 로거로 분리해 settings.LOGGING에서 레벨/샘플링 조절
 logger = logging.getLogger('news')
+keyword_logger = logging.getLogger('news.keywords')  # 제목별 추출 과정 (기본 DEBUG로만 기록)
+press_logger = logging.getLogger('news.press')
+llm_logger = logging.getLogger('news.llm')
+
+@lru_cache(maxsize=1)
+def get_okt():
+    """Okt 형태소 분석기 (konlpy/JVM은 처음 키워드를 추출할 때 로드하고 재사용)"""
+    from konlpy.tag import Okt
+    return Okt()
 
 def is_contains_hanja(text):
     """한자 포함 여부 체크"""
@@ -376,6 +388,7 @@ stop_words = {
     '빈소', '살해', '살인', 
 }
 
+@timed('keywords')
 def extract_keywords(titles, limit=10, keywords_per_title=4):
     """
     뉴스 제목들에서 주요 키워드를 추출하는 함수
@@ -422,142 +435,202 @@ def extract_keywords(titles, limit=10, keywords_per_title=4):
     Returns:
         list: (키워드, 빈도수, 연관키워드 집합) 튜플의 리스트
     """
-    okt = Okt()
-    all_nouns = []
+    okt_started = time.perf_counter()
+    okt = get_okt()
+    okt_seconds = time.perf_counter() - okt_started
 
-    logger.info(f"Stop words count: {len(stop_words)}")
-    
-    
+    # 제목마다 여러 줄씩 남기므로 DEBUG가 꺼져 있으면 인자 계산도 건너뜀
+    debug = keyword_logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        keyword_logger.debug("Stop words count: %d", len(stop_words))
+
+    keywords_by_title = []
     for title in titles:
-        title_nouns = []
-        working_title = title
-        
-        logger.info(f"\n원본 제목: {title}")
-        
-        # 1. 대괄호 제거 및 공백 처리 후
-        working_title = re.sub(r'\[[^]]*\]', ' ', working_title)
-
-        # 2. 한자 제거 후
-        working_title = ' '.join(
-            remove_hanja_word(word) for word in working_title.split()
-        ).strip()
-
-        # 3. 모든 숫자 제거 (숫자로 시작하는 단어 포함)
-        working_title = re.sub(r'\d+\s*\w*', '', working_title)
-
-        # 4. OKT phrases 추출
-        phrases = okt.phrases(working_title)
-        logger.info(f"구문 추출: {phrases}")
-
-        # 5. 5글자 이하이면서 띄어쓰기가 없는 키워드 필터링
-        temp_nouns = []
-        for phrase in phrases:
-            if len(phrase) <= 5 and ' ' not in phrase and phrase not in temp_nouns:
-                temp_nouns.append(phrase)
-                
-        logger.info(f"5글자 이하 단일 키워드 필터링 후: {temp_nouns}")
+        nouns, seconds = _extract_title_keywords(okt, title, keywords_per_title, debug)
+        okt_seconds += seconds
+        keywords_by_title.append(nouns)
+
+    # 형태소 분석 시간은 제목별로 누적해 한 번만 기록
+    record_stage('okt', okt_seconds)
+    annotate(titles=len(titles), okt_ms=round(okt_seconds * 1000, 1), nouns=sum(map(len, keywords_by_title)))
+    ranking = start_stage('keyword_ranking')
+    result = rank_keywords(titles, keywords_by_title, limit)
+    ranking.set(keywords=len(result))
+    ranking.end()
+    return result
+
+def _extract_title_keywords(okt, title, keywords_per_title, debug):
+    """제목 하나에 대한 extract_keywords 1~4단계 → (키워드 목록, Okt 소요 시간)"""
+    title_nouns = []
+    working_title = title
+
+    if debug:
+        keyword_logger.debug("원본 제목: %s", title)
+
+    # 1. 대괄호 제거 및 공백 처리 후
+    working_title = re.sub(r'\[[^]]*\]', ' ', working_title)
+
+    # 2. 한자 제거 후
+    working_title = ' '.join(
+        remove_hanja_word(word) for word in working_title.split()
+    ).strip()
+
+    # 3. 모든 숫자 제거 (숫자로 시작하는 단어 포함)
+    working_title = re.sub(r'\d+\s*\w*', '', working_title)
+
+    # 4. OKT phrases 추출
+    okt_started = time.perf_counter()
+    phrases = okt.phrases(working_title)
+    okt_seconds = time.perf_counter() - okt_started
+    if debug:
+        keyword_logger.debug("구문 추출: %s", phrases)
+
+    # 5. 5글자 이하이면서 띄어쓰기가 없는 키워드 필터링
+    temp_nouns = []
+    for phrase in phrases:
+        if len(phrase) <= 5 and ' ' not in phrase and phrase not in temp_nouns:
+            temp_nouns.append(phrase)
+
+    if debug:
+        keyword_logger.debug("5글자 이하 단일 키워드 필터링 후: %s", list(temp_nouns))
+
+    # 6. stop_words 필터링 (첫 번째 필터링 - 유지)
+    temp_nouns = [phrases for phrases in temp_nouns if len(phrases) >= 2 and phrases not in stop_words]
+    if debug:
+        keyword_logger.debug("stop_words 필터링 후: %s", temp_nouns)
+
+    # 5. 추출된 명사들을 우선순위별로 분류
+    compound_nouns = []  # 복합어 # 예: "경호처", "체포영장"
+    party_nouns = []     # 정당명 # 예: "민주당", "국민의당"
+    name_nouns = []      # 인명 # 예: "이재명", "윤건영"
+    other_nouns = []     # 기타 일반명사 # 예: "산불", "내란"
+
+    # 필터링된 명사들에 대해서만 패턴 매칭 수행
+    for noun in temp_nouns:
+        # 1순위: 복합어 패턴 체크
+        is_compound = any(re.match(pattern, noun) for pattern in COMPOUND_WORD_PATTERNS)
+        if is_compound:
+            compound_nouns.append(noun)
+            continue
 
-        # 6. stop_words 필터링 (첫 번째 필터링 - 유지)
-        temp_nouns = [phrases for phrases in temp_nouns if len(phrases) >= 2 and phrases not in stop_words]
-        logger.info(f"stop_words 필터링 후: {temp_nouns}")
-        
-        # 5. 추출된 명사들을 우선순위별로 분류
-        compound_nouns = []  # 복합어 # 예: "경호처", "체포영장"
-        party_nouns = []     # 정당명 # 예: "민주당", "국민의당"
-        name_nouns = []      # 인명 # 예: "이재명", "윤건영"
-        other_nouns = []     # 기타 일반명사 # 예: "산불", "내란"
-        
-        # 필터링된 명사들에 대해서만 패턴 매칭 수행
-        for noun in temp_nouns:
-            # 1순위: 복합어 패턴 체크
-            is_compound = any(re.match(pattern, noun) for pattern in COMPOUND_WORD_PATTERNS)
-            if is_compound:
-                compound_nouns.append(noun)
-                continue
-                
-            # 2순위: 정당 이름 체크
-            if noun in PARTY_NAMES:
-                party_nouns.append(noun)
-                continue
-                
-            # 3순위: 인명 패턴 체크
-            is_name = any(
-                any(re.match(pattern, noun) for pattern in patterns)
-                for patterns in NAME_PATTERNS.values()
-            )
-            if is_name:
-                name_nouns.append(noun)
-                continue
-                
-            # 4순위: 기타 일반명사 (stop_words 체크 제거)
-            other_nouns.append(noun)  # 여기 수정
-        
-        # 5. 우선순위 순서대로 title_nouns에 추가 (5개 이상일 때만)
-        # 각 카테고리별로 5개 이상 출현 시 독립적으로 처리하고,
-        # 그렇지 않은 경우 일반명사로 통합하여 처리
-        if len(compound_nouns) >= 5:
-            title_nouns.extend(compound_nouns) # 독립적으로 추가
-        else:
-            other_nouns.extend(compound_nouns) # 일반명사로 통합
-            
-        if len(party_nouns) >= 5:
-            title_nouns.extend(party_nouns)
-        else:
-            other_nouns.extend(party_nouns)
-            
-        if len(name_nouns) >= 5:
-            title_nouns.extend(name_nouns)
-        else:
-            other_nouns.extend(name_nouns)
-            
-        title_nouns.extend(other_nouns)  # 나머지 일반명사 추가
+        # 2순위: 정당 이름 체크
+        if noun in PARTY_NAMES:
+            party_nouns.append(noun)
+            continue
 
-        # 중복 제거 (순서 유지)
-        title_nouns = list(dict.fromkeys(title_nouns)) # 모든 일반명사와 통합된 키워드 추가
-        
-        # 마스킹된 단어 필터링
-        title_nouns = [re.sub(r'[\'\"…]+', '', noun) for noun in title_nouns]
-        title_nouns = [noun for noun in title_nouns 
-                      if not re.search(r'^[\'\"]*[■]+[.…]*[\'\"]?$', noun) and
-                      not re.search(r'^[■]+[^가-힣a-zA-Z]+$', noun) and
-                      not re.search(r'^[\'\"]?[■]+', noun) and
-                      not re.search(r'[■]+[\'\"]?$', noun) and
-                      not re.search(r'[^가-힣a-zA-Z]+[■]+[^가-힣a-zA-Z]+', noun) and
-                      not re.search(r'.*[■]+.*', noun) and
-                      not re.search(r'^[^가-힣a-zA-Z0-9]+$', noun) and
-                      len(re.sub(r'[^가-힣a-zA-Z]', '', noun)) >= 2]
-        
-        # 마스킹 필터링 후 stop_words 체크 (두 번째 필터링 - 안전장치로 유지)
-        title_nouns = [noun for noun in title_nouns if noun not in stop_words]
+        # 3순위: 인명 패턴 체크
+        is_name = any(
+            any(re.match(pattern, noun) for pattern in patterns)
+            for patterns in NAME_PATTERNS.values()
+        )
+        if is_name:
+            name_nouns.append(noun)
+            continue
 
-        # 제목당 키워드 제한
-        title_nouns = title_nouns[:keywords_per_title]
-        all_nouns.extend(title_nouns)
-        
-        logger.info(f"최종 추출된 키워드: {title_nouns}")
+        # 4순위: 기타 일반명사 (stop_words 체크 제거)
+        other_nouns.append(noun)  # 여기 수정
+
+    # 5. 우선순위 순서대로 title_nouns에 추가 (5개 이상일 때만)
+    # 각 카테고리별로 5개 이상 출현 시 독립적으로 처리하고,
+    # 그렇지 않은 경우 일반명사로 통합하여 처리
+    if len(compound_nouns) >= 5:
+        title_nouns.extend(compound_nouns) # 독립적으로 추가
+    else:
+        other_nouns.extend(compound_nouns) # 일반명사로 통합
+
+    if len(party_nouns) >= 5:
+        title_nouns.extend(party_nouns)
+    else:
+        other_nouns.extend(party_nouns)
+
+    if len(name_nouns) >= 5:
+        title_nouns.extend(name_nouns)
+    else:
+        other_nouns.extend(name_nouns)
+
+    title_nouns.extend(other_nouns)  # 나머지 일반명사 추가
+
+    # 중복 제거 (순서 유지)
+    title_nouns = list(dict.fromkeys(title_nouns)) # 모든 일반명사와 통합된 키워드 추가
+
+    # 마스킹된 단어 필터링
+    title_nouns = [re.sub(r'[\'\"…]+', '', noun) for noun in title_nouns]
+    title_nouns = [noun for noun in title_nouns 
+                  if not re.search(r'^[\'\"]*[■]+[.…]*[\'\"]?$', noun) and
+                  not re.search(r'^[■]+[^가-힣a-zA-Z]+$', noun) and
+                  not re.search(r'^[\'\"]?[■]+', noun) and
+                  not re.search(r'[■]+[\'\"]?$', noun) and
+                  not re.search(r'[^가-힣a-zA-Z]+[■]+[^가-힣a-zA-Z]+', noun) and
+                  not re.search(r'.*[■]+.*', noun) and
+                  not re.search(r'^[^가-힣a-zA-Z0-9]+$', noun) and
+                  len(re.sub(r'[^가-힣a-zA-Z]', '', noun)) >= 2]
+
+    # 마스킹 필터링 후 stop_words 체크 (두 번째 필터링 - 안전장치로 유지)
+    title_nouns = [noun for noun in title_nouns if noun not in stop_words]
+
+    # 제목당 키워드 제한
+    title_nouns = title_nouns[:keywords_per_title]
+
+    if debug:
+        keyword_logger.debug("최종 추출된 키워드: %s", title_nouns)
+    return title_nouns, okt_seconds
+
+def title_keywords(title, keywords_per_title=4):
+    """제목 하나의 키워드 목록 (extract_keywords와 같은 규칙, news/keyword_ranker.py가 제목별로 캐시)"""
+    debug = keyword_logger.isEnabledFor(logging.DEBUG)
+    return _extract_title_keywords(get_okt(), title, keywords_per_title, debug)[0]
+
+def rank_keywords(titles, keywords_by_title, limit=10):
+    """
+    extract_keywords 5~6단계 - 제목별 키워드 목록으로 빈도/동시 출현/포함 관계를 계산해 순위 산출
 
-    # 빈도수 계산
-    keyword_count = Counter(all_nouns)
-    # 포함 관계 처리를 위한 변수 초기화
-    final_keywords = []  # 최종 키워드 목록
-    counts = {}         # 키워드별 빈도수 저장
-    keyword_groups = {} # 연관 키워드 그룹 저장
+    Args:
+        titles (list): 뉴스 제목 리스트
+        keywords_by_title (list): titles와 같은 순서의 제목별 키워드 리스트
+        limit (int): 반환할 최대 키워드 수
+    """
+    # 빈도수 계산 (같은 빈도는 처음 나온 순서 유지)
+    keyword_count = Counter(keyword for nouns in keywords_by_title for keyword in nouns)
     
-    # 포함 관계 처리를 위한 변수 초기화 전에 동시 출현 빈도 계산 추가
+    # 동시 출현 빈도 계산
     cooccurrence = {}
     for title in titles:
-        title_keywords = set()
+        title_keywords_set = set()
         for keyword, _ in keyword_count.most_common():
             # stop_words 체크 추가
             if keyword in title and keyword not in stop_words:
-                title_keywords.add(keyword)
+                title_keywords_set.add(keyword)
         
-        for k1 in title_keywords:
+        for k1 in title_keywords_set:
             if k1 not in cooccurrence:
                 cooccurrence[k1] = {}
-            for k2 in title_keywords:
+            for k2 in title_keywords_set:
                 if k1 != k2:
                     cooccurrence[k1][k2] = cooccurrence[k1].get(k2, 0) + 1
+
+    # 해당 키워드가 직접 포함된 기사 수
+    def article_count(keyword):
+        return sum(1 for title in titles if keyword in title)
+
+    return merge_keywords(keyword_count, cooccurrence, article_count, limit)
+
+def merge_keywords(keyword_count, cooccurrence, article_count, limit=10):
+    """
+    포함 관계/동시 출현으로 키워드를 묶고 기사 건수 기준으로 정렬
+
+    Args:
+        keyword_count (Counter): 키워드별 빈도 (삽입 순서 = 처음 나온 순서, most_common 동점 처리에 사용)
+        cooccurrence (dict): {키워드: {함께 나온 키워드: 제목 수}}
+        article_count (callable): 키워드 → 키워드가 포함된 제목 수
+        limit (int): 반환할 최대 키워드 수
+
+    Returns:
+        list: (키워드, 기사 건수, 연관키워드 집합) 튜플의 리스트
+    """
+    # 포함 관계 처리를 위한 변수 초기화
+    final_keywords = []  # 최종 키워드 목록
+    counts = {}         # 키워드별 빈도수 저장
+    keyword_groups = {} # 연관 키워드 그룹 저장
     
     # 빈도수 높은 순으로 키워드 처리
     for keyword, count in keyword_count.most_common():
@@ -596,18 +669,14 @@ def extract_keywords(titles, limit=10, keywords_per_title=4):
     keywords_with_groups = [(k, counts[k], keyword_groups[k]) for k in sorted_keywords[:limit]]
     
     # 실제 기사 건수로 재정렬
-    article_counts = {}
-    for keyword, _, _ in keywords_with_groups:
-        # 해당 키워드가 직접 포함된 기사 수 카운트
-        article_count = sum(1 for title in titles if keyword in title)
-        article_counts[keyword] = article_count
+    article_counts = {keyword: article_count(keyword) for keyword, _, _ in keywords_with_groups}
     
     # 기사 건수 기준으로 재정렬 (동일 건수는 키워드 사전순)
     final_sorted = sorted(
         keywords_with_groups,
         key=lambda x: (-article_counts[x[0]], x[0])
     )
-    
+
     # 기사 건수로 업데이트하여 반환
     return [(k, article_counts[k], group) for k, _, group in final_sorted]
 
@@ -663,56 +732,12 @@ def process_keywords(keywords_list):
 
 def extract_press_name(title, company_code=None):
     """
-    기사 제목과 회사 코드에서 언론사 이름을 추출하고 정규화
+    기사 제목과 회사 코드에서 언론사 이름을 추출하고 정규화 (crawling/press_registry.py 매처 사용)
     """
-    # 디버깅 로그 추가
-    logger.info(f"Extracting press name from: {title}")
-    
-    # 네이버 뉴스 언론사 코드-이름 매핑
-    news_companies = {
-        '032': '경향신문',  # 경향
-        '005': '국민일보',  # 국민
-        '020': '동아일보',  # 동아
-        '021': '문화일보',  # 문화
-        '081': '서울신문',  # 서울
-        '022': '세계일보',  # 세계
-        '023': '조선일보',  # 조선
-        '025': '중앙일보',  # 중앙
-        '028': '한겨레',    # 한겨레
-        '469': '한국일보'   # 한국
-    }
-    
-    try:
-        # 1. company_code가 있는 경우 (크롤링 시점)
-        if company_code and company_code in news_companies:
-            return news_companies[company_code]
-        
-        # 2. [언론사] 형식 체크
-        match = re.search(r'\[(.*?)\]', title)
-        if match:
-            press_name = match.group(1).strip()
-            # 정규화된 이름으로 매칭
-            for company_name in news_companies.values():
-                if press_name in company_name or company_name in press_name:
-                    return company_name
-        
-        # 3. 제목에서 언론사 직접 검색
-        for press_name in news_companies.values():
-            if press_name in title:
-                return press_name
-            
-            # 3-1. 축약형 처리 (예: "경향신문" -> "경향")
-            short_name = press_name.replace('신문', '').replace('일보', '')
-            if short_name and short_name in title:
-                return press_name
-        
-        # 4. 실패 시 로깅
-        logger.debug(f"언론사 매칭 실패: {title}")
-        return None
-            
-    except Exception as e:
-        logger.warning(f"언론사 이름 추출 실패: {title} - {str(e)}")
-        return None
+    press_name = press_registry.match_title(title, company_code)
+    if press_name is None:
+        press_logger.debug("언론사 매칭 실패: %s", title)
+    return press_name
 
 def format_news_item(rank, title, press_name):
     """
@@ -724,7 +749,7 @@ def format_news_item(rank, title, press_name):
 extract_keywords_async = sync_to_async(extract_keywords)
 process_keywords_async = sync_to_async(process_keywords)
 
-async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300):
+async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300, priority=INTERACTIVE):
     """
     articles_data: {
         'title': str,          # 기사 제목
@@ -734,8 +759,18 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
     }의 리스트
     """
     try:
-        # 1. 분석할 주요 뉴스 제목 10개
-        formatted_titles = '\n'.join([f"- {t}" for t in titles[:10]])
+        # 제목 문자열 목록 (크롤링 레코드/딕셔너리/문자열 모두 지원)
+        title_texts = [t if isinstance(t, str) else t['title'] for t in titles]
+        
+        # 1. 분석할 주요 뉴스 제목 10개 (순위·언론사 다양성 우선, 토큰 예산 안에서)
+        formatted_titles = pack_articles(
+            [{'title': t} if isinstance(t, str) else t for t in titles],
+            lambda record: f"- {record['title']}",
+            budget=get_budget('keyword_titles'),
+            separator='\n',
+            max_items=10,
+            label='keyword_titles',
+        ).text
         
         # 2. 키워드 관계 분석을 위한 변수 초기화
         cooccurrence = {}  # 키워드 간 동시 출현 빈도 저장
@@ -745,7 +780,7 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
         long_keywords = []  # 3음절 이상의 복합 키워드 (주로 중요한 이슈나 사건명)
         
         # 3. 각 뉴스 제목별로 키워드 관계 분석
-        for title in titles:
+        for title in title_texts:
             title_keywords = set()  # 한 제목에 등장하는 모든 키워드
             
             # 3-1. 제목에서 키워드 추출 및 긴 키워드 수집
@@ -769,8 +804,8 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
                         # 강한 연관성 체크 (전체 등장 횟수의 80% 이상이 함께 등장)
                         # - 이를 통해 실제로 밀접하게 연관된 이슈 파악 가능
                         if count >= min(
-                            sum(1 for t in titles if k1 in t),
-                            sum(1 for t in titles if k2 in t)
+                            sum(1 for t in title_texts if k1 in t),
+                            sum(1 for t in title_texts if k2 in t)
                         ) * 0.8:
                             strong_relations.append((k1, k2))
                         
@@ -810,8 +845,8 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
         # 언론사별 통계 준비 
         press_stats = {}
         for title_data in titles:
-            if isinstance(title_data, dict):
-                # 딕셔너리인 경우 (크롤링된 데이터)
+            if not isinstance(title_data, str):
+                # 크롤링 레코드/딕셔너리인 경우
                 press_name = title_data.get('company_name')
                 title_text = title_data.get('title')
             else:
@@ -834,12 +869,12 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
                     if keyword in title_text:
                         press_stats[press_name]['keywords'][keyword] += 1
 
-        # 언론사별 통계 포맷팅
-        press_stats_fmt = '\n'.join([
+        # 언론사별 통계 포맷팅 (기사 수 많은 언론사부터 토큰 예산까지)
+        press_stats_fmt = pack_lines([
             f"- {press}: 총 {stats['count']}건\n" + 
             f"  주요키워드: {', '.join(f'{k}({v}건)' for k, v in stats['keywords'].most_common(3))}"
             for press, stats in sorted(press_stats.items(), key=lambda x: x[1]['count'], reverse=True)
-        ])
+        ], budget=get_budget('keyword_press_stats'), label='keyword_press_stats')
 
         # 전체 키워드 랭킹 포맷팅 추가
         total_keyword_ranking = '\n'.join([
@@ -850,6 +885,9 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
         # 키워드 연관성 상세 분석
         keyword_analysis = {}
         
+        # 제목별 언론사는 키워드마다 다시 찾지 않도록 한 번만 계산
+        press_by_title = {title: extract_press_name(title) for title in title_texts}
+
         # 상위 5개 키워드에 대한 상세 분석 수행
         for main_keyword, main_count, main_group in keywords_with_counts[:5]:
             keyword_analysis[main_keyword] = {
@@ -868,9 +906,9 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
                     keyword_analysis[main_keyword]['related_keywords'][other_keyword] = other_count
             
             # 언론사별 분석
-            for title in titles:
+            for title in title_texts:
                 if main_keyword in title:
-                    press_name = extract_press_name(title)
+                    press_name = press_by_title[title]
                     keyword_analysis[main_keyword]['press_mentions'][press_name] += 1
                     keyword_analysis[main_keyword]['context_titles'].append(title)
 
@@ -929,20 +967,21 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
         '''
 
         # 3. 디버깅 로그 추가
-        logger.info(f"Analysis prompt prepared with:")
-        logger.info(f"- Press count: {len(press_stats)}")
-        logger.info(f"- Article count: {len(titles)}")
-        logger.info(f"- Keyword count: {len(keywords_with_counts)}")
+        llm_logger.info(
+            "Analysis prompt prepared with: press=%d, articles=%d, keywords=%d",
+            len(press_stats), len(titles), len(keywords_with_counts)
+        )
         # GPT 응답을 비동기로 처리
         response = await _get_gpt_response(
             analysis_prompt, 
             temperature=0.3, 
             max_tokens=max_tokens,
-            split_sections=True
+            split_sections=True,
+            priority=priority
         )
         
         # 디버깅을 위해 원본 응답 출력
-        logger.info(f"=== GPT 원본 응답 ===\n{response}\n===================")
+        llm_logger.debug("=== GPT 원본 응답 ===\n%s\n===================", response)
         
         # 응답 구조 단순화
         if isinstance(response, dict):
@@ -971,63 +1010,51 @@ async def analyze_keywords_with_llm(keywords_with_counts, titles, max_tokens=300
             'insights': '분석 중 오류가 발생했습니다.'
         }
 
-async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_sections=False):
+async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_sections=False, priority=INTERACTIVE):
     """
     GPT API를 비동기로 호출하는 내부 유틸리티 함수
     """
     try:
-        logger.info("\n=== GPT API 호출 시작 ===")
-        logger.info(f"호출 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
-        logger.info(f"호출 함수: {inspect.stack()[1].function}")  # 어느 함수에서 호출됐는지
-        logger.info(f"프롬프트 길이: {len(prompt)}")
-        logger.info(f"프롬프트 내용: {prompt[:200]}...")  # 프롬프트 앞부분 로깅
-        logger.info(f"요청 파라미터: temperature={temperature}, max_tokens={max_tokens}")
+        caller = caller_name()  # 어느 함수에서 호출됐는지 (inspect.stack()은 호출마다 소스 파일을 읽음)
+        llm_logger.info(
+            "GPT API 호출 시작 - 호출 함수: %s, 프롬프트 길이: %d, temperature=%s, max_tokens=%s",
+            caller, len(prompt), temperature, max_tokens
+        )
+        llm_logger.debug("프롬프트 내용: %.200s...", prompt)  # 프롬프트 앞부분 로깅
         
-        client = AsyncOpenAI()
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": """
+        # 스케줄러 경유 호출 (속도 제한·재시도·우선순위, 길이 초과 시 max_tokens 늘려 1회 재요청)
+        response = await achat(
+            prompt,
+            system="""
                 당신은 뉴스 분석 전문가입니다. 다음 규칙을 따라 분석해주세요:
                 1. 언론사별 보도 경향과 차이점에 집중
                 2. 구체적인 수치와 예시 인용
                 3. 객관적이고 중립적인 톤 유지
                 4. 각 섹션별 명확한 구분
-                """},
-                {"role": "user", "content": prompt}
-            ],
+                """,
+            model="gpt-3.5-turbo",
             temperature=temperature,
             max_tokens=1000,  # 토큰 제한 증가
+            priority=priority,
             presence_penalty=0.0,
             frequency_penalty=0.0,
-            stop=None,
             top_p=1.0
         )
         
-        logger.info("\n=== GPT API 응답 ===")
-        logger.info(f"응답 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
-        logger.info(f"응답 상태: {response.choices[0].finish_reason}")
-        logger.info(f"입력 토큰 수: {response.usage.prompt_tokens}")
-        logger.info(f"출력 토큰 수: {response.usage.completion_tokens}")
-        logger.info(f"총 토큰 수: {response.usage.total_tokens}")
-        
-        # finish_reason 체크 및 재시도
-        finish_reason = response.choices[0].finish_reason
-        if finish_reason == "length":
-            # 토큰 제한에 걸린 경우 더 짧은 프롬프트로 재시도
-            shortened_prompt = prompt[:len(prompt)//2]  # 프롬프트 길이 절반으로 줄임
-            return await _get_gpt_response(shortened_prompt, temperature, max_tokens, split_sections)
+        llm_logger.info(
+            "GPT API 응답 - 상태: %s, 토큰: 입력 %d / 출력 %d / 총 %d, 대기/실행: %.0fms / %.0fms (시도 %d회)",
+            response.finish_reason, response.prompt_tokens, response.completion_tokens, response.total_tokens,
+            response.queued_ms, response.elapsed_ms, response.attempts
+        )
             
-        content = response.choices[0].message.content
+        content = response.content
         
-        # finish_reason 체크 추가
-        finish_reason = response.choices[0].finish_reason
-        if finish_reason != "stop":
-            logger.warning(f"GPT 응답이 비정상적으로 종료됨: {finish_reason}")
-            # 재시도 로직 추가 가능
+        # 재요청 후에도 정상 종료가 아니면 받은 내용까지만 사용
+        if response.finish_reason != "stop":
+            llm_logger.warning("GPT 응답이 비정상적으로 종료됨: %s", response.finish_reason)
         
         # 디버깅을 위해 원본 응답 출력
-        logger.info(f"=== GPT 원본 응답 ===\n{content}\n===================")
+        llm_logger.debug("=== GPT 원본 응답 ===\n%s\n===================", content)
         
         if split_sections:
             sections = {}
@@ -1071,7 +1098,7 @@ async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_secti
 
             # 빈 응답 체크
             if not any(sections.values()):
-                logger.warning("파싱된 내용이 없습니다. 원본 응답을 전체 텍스트로 처리합니다.")
+                llm_logger.warning("파싱된 내용이 없습니다. 원본 응답을 전체 텍스트로 처리합니다.")
                 return {
                     'success': True,
                     'analysis': {
@@ -1082,10 +1109,11 @@ async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_secti
                 }
 
             # 디버깅
-            logger.info("=== 파싱된 섹션 ===")
-            for section, text in sections.items():
-                logger.info(f"{section}: {text}")
-            logger.info("===================")
+            if llm_logger.isEnabledFor(logging.DEBUG):
+                llm_logger.debug(
+                    "=== 파싱된 섹션 ===\n%s",
+                    '\n'.join(f"{section}: {text}" for section, text in sections.items())
+                )
 
             return {
                 'success': True,
@@ -1102,11 +1130,10 @@ async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_secti
             }
             
     except Exception as e:
-        logger.error(f"\n=== GPT API 오류 발생 ===")
-        logger.error(f"오류 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
-        logger.error(f"오류 타입: {type(e).__name__}")
-        logger.error(f"오류 메시지: {str(e)}")
-        logger.error(f"오류 발생 함수: {inspect.stack()[1].function}")
+        llm_logger.error(
+            "GPT API 오류 발생 - 타입: %s, 메시지: %s, 호출 함수: %s",
+            type(e).__name__, e, caller_name()
+        )
 
         error_response = {
             'success': False,
@@ -1118,7 +1145,7 @@ async def _get_gpt_response(prompt, temperature=0.7, max_tokens=300, split_secti
         }
         return error_response
 
-def analyze_keywords_with_llm_sync(keywords_with_counts, titles, max_tokens=150):
+def analyze_keywords_with_llm_sync(keywords_with_counts, titles, max_tokens=150, priority=INTERACTIVE):
     """
     비동기 분석 함수를 동기 환경에서 호출하기 위한 래퍼
     Django view 등에서 사용
@@ -1126,5 +1153,6 @@ def analyze_keywords_with_llm_sync(keywords_with_counts, titles, max_tokens=150)
     return asyncio.run(analyze_keywords_with_llm(
         keywords_with_counts=keywords_with_counts,
         titles=titles,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        priority=priority
     ))
@@ -1,6 +1,6 @@
 from django.core.cache import cache
 from django.shortcuts import render, redirect
-from crawling.naver_news_crawler import NaverNewsCrawler
+from django.urls import reverse
 from .utils import extract_keywords, analyze_keywords_with_llm_sync
 from django.conf import settings
 from functools import wraps
@@ -8,12 +8,25 @@ import threading
 from .models import Article, NewsSummary
 from django.utils import timezone
 import logging
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 import json
 from .agents.crew import summarize_article
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
+from .snapshots import serve_snapshot, prerender_snapshots, snapshot_version
+from .live import current_version, publish_version, ranking_delta
+from .api import OrjsonResponse
+from .ingest import ingest_news_items
+from .rollups import record_keyword_snapshot
+from .dedupe import assign_clusters, unique_by_cluster
+from .stories import assign_stories
+from .thumbnails import attach_thumbnails
+from .keyword_ranker import get_keyword_ranker
+from .keyword_windows import get_keyword_windows
+from .crawl_schedule import refresh_due
+from .agents.comparison import compare_articles_sync
+from .llm import INTERACTIVE, BACKGROUND
+from .instrumentation import stage
+from crawling.press_registry import registry as press_registry
 from django.utils import timezone
 
 logger = logging.getLogger('news')  # Django 설정의 'news' 로거 사용
@@ -21,6 +34,11 @@ logger = logging.getLogger('news')  # Django 설정의 'news' 로거 사용
 # 크롤링 중복 방지를 위한 락
 crawling_lock = threading.Lock()
 
+def get_crawler():
+    """크롤러 생성 (Selenium/webdriver는 실제로 크롤링하는 요청에서만 로드)"""
+    from crawling.naver_news_crawler import NaverNewsCrawler
+    return NaverNewsCrawler()
+
 def atomic_cache(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -36,14 +54,17 @@ def news_list(request):
     
     try:
         # 1. 캐시 확인 및 유효성 검사
-        cached_data = cache.get('news_data')
+        with stage('cache'):
+            cached_data = cache.get('news_data')
         if cached_data:
             last_crawled = cached_data.get('crawled_time')
             if last_crawled:
                 # timezone-aware 비교를 위해 변환
                 if isinstance(last_crawled, str):
                     last_crawled = timezone.datetime.fromisoformat(last_crawled)
-                time_diff = (timezone.now() - last_crawled).total_seconds()
+                # 변경 없음으로 확인된 스냅샷은 확인 시각부터 다시 센다
+                last_checked = cached_data.get('checked_time') or last_crawled
+                time_diff = (timezone.now() - last_checked).total_seconds()
                 
                 # 캐시가 만료되었으면 임시 캐시에 복사 후 크롤링 시도
                 if time_diff >= CACHE_TIMEOUT:
@@ -52,26 +73,80 @@ def news_list(request):
                     cache.set('news_data_temp', cached_data, timeout=600)  # 10분 유효
                     cache.delete('news_data')
                     cached_data = None
+                elif refresh_due(last_checked):
+                    # 주기가 돌아온 언론사만 다시 크롤링하거나 새 분산 크롤링을 읽음 (캐시는 직전 기사로 사용)
+                    logger.info("크롤링 주기 도래 - 캐시 갱신 시도")
                 else:
                     logger.info("유효한 캐시 데이터 사용")
-                    return render(request, 'news/news_list.html', cached_data)
+                    return serve_snapshot(request, 'news_list', last_crawled, lambda: cached_data)
 
         # 2. 크롤링 시도
-        crawler = NaverNewsCrawler()
-        df = crawler.crawl_all_companies()
+        crawler = get_crawler()
+        result = crawler.crawl_all_companies()
         
-        if df is not None and not df.empty:
-            news_items = df.to_dict('records')
-            crawled_time = timezone.now()
+        # 모든 언론사 랭킹이 직전 스냅샷과 같으면 컨텍스트 재구성·키워드/시계열 집계·버전 공지를 건너뜀
+        previous_context = cached_data or cache.get('news_data_temp')
+        if result.source == 'crawl' and result.all_unchanged and previous_context and 'keyword_rankings' in previous_context:
+            logger.info("모든 언론사 랭킹 변경 없음 - 기존 스냅샷 유지")
+            previous_context['checked_time'] = timezone.now()
+            cache.set('news_data', previous_context, timeout=CACHE_TIMEOUT)
+            return serve_snapshot(request, 'news_list', previous_context['crawled_time'], lambda: previous_context)
+
+        # 캐시/백업 재사용(다른 크롤링 진행 중, 모든 언론사 실패 등)은 새 스냅샷이 아님 - 기존 스냅샷을 그대로 제공
+        fresh = result.source == 'crawl'
+        if (not fresh and previous_context and 'keyword_rankings' in previous_context
+                and snapshot_version(previous_context.get('crawled_time')) == snapshot_version(result.crawled_time)):
+            logger.info("새 크롤링 없음 - 기존 스냅샷 유지")
+            previous_context['checked_time'] = timezone.now()
+            cache.set('news_data', previous_context, timeout=CACHE_TIMEOUT)
+            return serve_snapshot(request, 'news_list', previous_context['crawled_time'], lambda: previous_context)
+
+        if result:
+            news_items = result.items
+            # 캐시/백업 재사용도 원래 크롤링 시각을 유지 (지금으로 바꾸면 새 버전으로 보임)
+            crawled_time = result.crawled_time or timezone.now()
             
             # 3. 새로운 데이터 처리 및 캐시 설정
             context = prepare_news_context(news_items, crawled_time)
+            context['unchanged_presses'] = result.unchanged_presses
+            
+            # 최근 1h/6h/24h 키워드 순위 (새 크롤링만 시간 창에 기록)
+            try:
+                windows = get_keyword_windows()
+                if fresh:
+                    windows.record(crawled_time, get_keyword_ranker().keyword_counts())
+                context['keyword_windows'] = windows.rankings()
+            except Exception as e:
+                logger.error(f"키워드 시간 창 집계 실패: {str(e)}")
             
             # 4. 캐시 업데이트
             cache.delete('news_data')  # 기존 캐시 명시적 삭제
             cache.set('news_data', context, timeout=CACHE_TIMEOUT)
             cache.set('last_update', timezone.now(), timeout=CACHE_TIMEOUT)
             
+            # 이하 후처리는 새 크롤링에만 (캐시/백업 재사용은 사전 렌더링·버전 공지·백업 없이 응답)
+            if not fresh:
+                return serve_snapshot(request, 'news_list', crawled_time, lambda: context)
+
+            # 키워드 시계열 집계 (버전 공지 전에 기록해 API 캐시와 어긋나지 않게 함)
+            try:
+                record_keyword_snapshot(crawled_time, news_items, context['keyword_rankings'])
+            except Exception as e:
+                logger.error(f"키워드 집계 저장 실패: {str(e)}")
+            
+            # 주요 페이지 스냅샷 사전 렌더링 (크롤링당 1회)
+            prerender_snapshots(crawled_time, snapshot_pages(context))
+            
+            # 열려 있는 탭에 새 버전 공지
+            publish_version(crawled_time, news_items)
+
+            # 새로 크롤링한 기사 DB에 일괄 업서트 (실패해도 페이지 응답은 유지)
+            try:
+                with stage('db_ingest'):
+                    ingest_news_items(news_items, crawled_time, context['keyword_rankings'])
+            except Exception as e:
+                logger.error(f"기사 DB 저장 실패: {str(e)}")
+
             # 5. 백업 저장
             if hasattr(crawler, 'backup_cache'):
                 backup_data = {
@@ -82,19 +157,20 @@ def news_list(request):
                 crawler.backup_cache(backup_data)
                 logger.info("새로운 데이터 백업 완료")
             
-            return render(request, 'news/news_list.html', context)
+            return serve_snapshot(request, 'news_list', crawled_time, lambda: context)
             
         # 크롤링 실패 시 임시 캐시 확인
         temp_data = cache.get('news_data_temp')
         if temp_data:
             logger.info("임시 캐시 데이터 사용")
-            return render(request, 'news/news_list.html', temp_data)
+            return serve_snapshot(request, 'news_list', temp_data.get('crawled_time'), lambda: temp_data)
             
         # 임시 캐시도 없으면 백업 데이터 사용
         backup_data = crawler.restore_from_backup()
         if backup_data and backup_data.get('context'):
             logger.info("백업 데이터 사용")
-            return render(request, 'news/news_list.html', backup_data['context'])
+            backup_context = backup_data['context']
+            return serve_snapshot(request, 'news_list', backup_context.get('crawled_time'), lambda: backup_context)
             
         return render(request, 'news/error.html', {'message': '뉴스를 불러올 수 없습니다.'})
         
@@ -104,9 +180,26 @@ def news_list(request):
 
 def prepare_news_context(news_items, crawled_time):
     """뉴스 컨텍스트 준비 함수"""
-    # 키워드 추출
+    # 언론사 간 유사 제목 클러스터링 (템플릿/분석에서 cluster_id로 중복 제거)
+    with stage('dedupe'):
+        assign_clusters(news_items)
+    
+    # 같은 사건 스토리 묶기 (faiss 인덱스 증분 갱신, 실패해도 컨텍스트는 구성)
+    try:
+        with stage('stories'):
+            assign_stories(news_items)
+    except Exception as e:
+        logger.error(f"스토리 클러스터링 실패: {str(e)}")
+    
+    # 기사 이미지 썸네일 (이전 크롤링에서 만든 것은 다시 받지 않음, 실패하면 원본 URL 사용)
+    try:
+        attach_thumbnails(news_items)
+    except Exception as e:
+        logger.error(f"썸네일 생성 실패: {str(e)}")
+    
+    # 키워드 추출 (이전 크롤링과 달라진 제목만 다시 분석, 결과는 extract_keywords와 동일)
     all_titles = [item['title'] for item in news_items]
-    keyword_rankings = extract_keywords(all_titles)
+    keyword_rankings = get_keyword_ranker().update(all_titles)
     
     # 일간 주요 뉴스 준비
     daily_rankings = [item for item in news_items if item.get('rank') == 1]
@@ -126,9 +219,47 @@ def prepare_news_context(news_items, crawled_time):
         'keyword_rankings': keyword_rankings,
         'news_by_company': news_by_company,
         'crawled_time': crawled_time,
-        'refresh_interval': settings.CACHES['default']['TIMEOUT']
+        'snapshot_version': snapshot_version(crawled_time),
+        'refresh_interval': settings.CACHES['default']['TIMEOUT'],
+        'live_poll_seconds': getattr(settings, 'LIVE_POLL_SECONDS', 30)
     }
 
+def snapshot_pages(context):
+    """크롤링 직후 미리 렌더링할 페이지 목록 (page_key, path, context_builder)"""
+    pages = [
+        ('news_list', reverse('news:news_list'), lambda: context),
+        ('top_articles', reverse('news:top_articles'), lambda: build_top_articles_context(context)),
+    ]
+    for keyword, _, _ in context.get('keyword_rankings', []):
+        pages.append((
+            f'keyword:{keyword}',
+            reverse('news:keyword_articles', kwargs={'keyword': keyword}),
+            lambda keyword=keyword: build_keyword_articles_context(context, keyword),
+        ))
+    return pages
+
+@require_http_methods(["GET"])
+def version_events(request):
+    """현재 크롤링 버전 (If-None-Match가 같으면 304) - 브라우저 버전 확인용 짧은 요청"""
+    version = current_version()
+    etag = f'"{version}"'
+    if version and request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = HttpResponse(status=304)
+    else:
+        response = OrjsonResponse({'version': version})
+    if version:
+        response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+@require_http_methods(["GET"])
+def ranking_changes(request):
+    """since 버전 이후 바뀐 랭킹 항목만 반환 (변경 없으면 204)"""
+    delta = ranking_delta(request.GET.get('since'))
+    if delta is None:
+        return HttpResponse(status=204)
+    return OrjsonResponse(delta)
+
 def keyword_analysis(request, keyword=None):
     if keyword:
         # 캐시에서 전체 뉴스 데이터 가져오기
@@ -157,6 +288,16 @@ def keyword_analysis(request, keyword=None):
 def keyword_articles(request, keyword):
     # 캐시에서 전체 뉴스 데이터 가져오기
     cached_data = cache.get('news_data', {})
+    # 스냅샷은 미리 렌더링하는 상위 키워드만 (URL의 임의 키워드로 스냅샷 캐시가 밀려나지 않도록)
+    if keyword not in {ranked for ranked, _, _ in cached_data.get('keyword_rankings', [])}:
+        return render(request, 'news/news_list.html', build_keyword_articles_context(cached_data, keyword))
+    return serve_snapshot(
+        request, f'keyword:{keyword}', cached_data.get('crawled_time'),
+        lambda: build_keyword_articles_context(cached_data, keyword)
+    )
+
+def build_keyword_articles_context(cached_data, keyword):
+    """키워드별 기사 페이지 컨텍스트 구성"""
     news_items = cached_data.get('news_items', [])
     
     # 키워드가 포함된 기사 필터링
@@ -176,7 +317,7 @@ def keyword_articles(request, keyword):
     # keyword_rankings 형식 유지
     keyword_rankings = [(keyword, len(filtered_articles), filtered_articles)]
     
-    context = {
+    return {
         'keyword': keyword,
         'articles': filtered_articles,
         'article_count': len(filtered_articles),
@@ -186,19 +327,20 @@ def keyword_articles(request, keyword):
         'news_by_company': news_by_company,
         'keyword_rankings': keyword_rankings
     }
-    
-    return render(request, 'news/news_list.html', context)
 
 def top_articles(request):
     cached_data = cache.get('news_data', {})
+    return serve_snapshot(
+        request, 'top_articles', cached_data.get('crawled_time'),
+        lambda: build_top_articles_context(cached_data)
+    )
+
+def build_top_articles_context(cached_data):
+    """주요 기사 페이지 컨텍스트 구성"""
     news_items = cached_data.get('news_items', [])
     keyword_rankings = cached_data.get('keyword_rankings', [])
     daily_rankings = cached_data.get('daily_rankings', [])
     
-    # 디버깅을 위한 출력 추가
-    print("news_items count:", len(news_items))
-    print("keyword_rankings:", keyword_rankings)
-    
     # TOP 10 키워드 관련 기사만 필터링
     top_keywords = [keyword for keyword, _, _ in keyword_rankings]
     top_articles = [
@@ -206,9 +348,6 @@ def top_articles(request):
         if any(keyword in item['title'] for keyword in top_keywords)
     ]
     
-    # 디버깅을 위한 출력 추가
-    print("filtered articles count:", len(top_articles))
-    
     # 언론사별로 기사 그룹화
     news_by_company = {}
     for item in top_articles:
@@ -234,7 +373,7 @@ def top_articles(request):
     # 전체 기사 수 계산
     total_articles = sum(len(articles) for articles in keyword_articles.values())
     
-    context = {
+    return {
         'keyword': "주요 기사 모아보기",
         'news_by_company': news_by_company,
         'articles': top_articles,
@@ -246,8 +385,6 @@ def top_articles(request):
         'total_keyword_articles': total_articles,
         'crawled_time': cached_data.get('crawled_time')
     }
-    
-    return render(request, 'news/news_list.html', context)
 
 def news_summary(request):
     articles = Article.objects.filter(
@@ -261,9 +398,18 @@ def news_summary(request):
         'rank': article.rank
     } for article in articles]
     
-    # 키워드 추출 (titles 리스트 사용)
+    # 키워드 추출 - 24시간 창이 있으면 다시 형태소 분석하지 않고 창 순위의 키워드를 사용
     titles = [article.title for article in articles]
-    keyword_rankings = extract_keywords(titles, limit=10)
+    windows = get_keyword_windows()
+    if windows.crawls('24h'):
+        # 건수는 extract_keywords와 같이 키워드가 포함된 기사 수 (동일 건수는 키워드 사전순)
+        keyword_rankings = sorted(
+            ((keyword, sum(1 for title in titles if keyword in title), group)
+             for keyword, _, group in windows.ranking('24h', limit=10)),
+            key=lambda x: (-x[1], x[0])
+        )
+    else:
+        keyword_rankings = extract_keywords(titles, limit=10)
     
     # LLM 분석 시 전체 기사 데이터 전달
     llm_analysis = analyze_keywords_with_llm_sync(
@@ -286,7 +432,10 @@ def analyze_trends(request):
     try:
         # POST 데이터 파싱
         data = json.loads(request.body)
-        selected_companies = data.get('companies', [])
+        # 축약형/코드로 와도 크롤링 레코드의 company_name과 같은 정규화 이름으로 비교
+        selected_companies = sorted({
+            press_registry.canonical(name) or name for name in data.get('companies', [])
+        })
         selected_keywords = data.get('keywords', [])
         analysis_type = data.get('analysis_type', 'basic')  # 기본값은 'basic'
 
@@ -295,9 +444,10 @@ def analyze_trends(request):
         news_items = cached_data.get('news_items', [])
         
         # 선택된 언론사/키워드로 필터링
+        selected_set = set(selected_companies)
         filtered_items = [
             item for item in news_items
-            if (not selected_companies or item['company_name'] in selected_companies) and
+            if (not selected_set or item['company_name'] in selected_set) and
                (not selected_keywords or any(k in item['title'] for k in selected_keywords))
         ]
 
@@ -307,8 +457,9 @@ def analyze_trends(request):
             company = item['company_name']
             press_distribution[company] = press_distribution.get(company, 0) + 1
 
-        # 필터링된 기사의 제목만 추출
-        titles = [item['title'] for item in filtered_items]
+        # 유사 제목(통신사 기사 등)은 대표 기사 하나만 분석에 사용
+        unique_items = unique_by_cluster(filtered_items)
+        titles = [item['title'] for item in unique_items]
         
         # 키워드 추출 및 분석
         keyword_rankings = [
@@ -319,7 +470,7 @@ def analyze_trends(request):
         # 기본 LLM 분석
         llm_analysis = analyze_keywords_with_llm_sync(
             keywords_with_counts=keyword_rankings,
-            titles=filtered_items
+            titles=unique_items
         )
         
         # 기본 분석 결과 구성
@@ -327,6 +478,7 @@ def analyze_trends(request):
             'llm_analysis': llm_analysis,
             'press_distribution': press_distribution,
             'filtered_count': len(filtered_items),
+            'unique_count': len(unique_items),
             'keyword_rankings': keyword_rankings
         }
         
@@ -334,15 +486,15 @@ def analyze_trends(request):
         cache_key = f"analysis_{analysis_type}_{'-'.join(selected_companies)}_{'-'.join(selected_keywords)}"
         cache.set(cache_key, basic_analysis, timeout=3600)
         
-        return JsonResponse({
+        return OrjsonResponse({
             'success': True,
             'analysis': basic_analysis,
             'cache_key': cache_key
-        }, json_dumps_params={'ensure_ascii': False})
+        })
         
     except Exception as e:
         logger.error(f"트렌드 분석 중 오류 발생: {str(e)}")
-        return JsonResponse({
+        return OrjsonResponse({
             'success': False,
             'error': '분석 중 오류가 발생했습니다.'
         }, status=500)
@@ -362,6 +514,9 @@ def article_summary(request=None):
         print("캐시된 뉴스가 없습니다!")
         return None if request is None else redirect('news:news_list')  # request가 없는 경우 None 반환
     
+    # 사용자가 기다리는 요청이면 대화형, 크론잡이면 백그라운드 우선순위로 LLM 호출
+    priority = INTERACTIVE if request is not None else BACKGROUND
+    
     # 2. 이미 랭킹된 키워드 사용
     print(f"2. 추출된 키워드 수: {len(keyword_rankings)}")
     top_keywords = keyword_rankings[:1] if keyword_rankings else []
@@ -393,15 +548,21 @@ def article_summary(request=None):
         
         # 저장된 데이터가 없는 경우에만 새로운 분석 진행
         related_articles = []
-        for item in news_items:
-            if keyword in item['title']:
+        # 키워드가 없어도 같은 스토리(다르게 표현한 제목)의 기사는 비교 대상에 포함
+        keyword_stories = {
+            item.get('story_id') for item in news_items
+            if keyword in item['title'] and item.get('story_id') is not None
+        }
+        # 유사 제목 기사는 대표 기사만 요약 (요약/LLM 호출 절감)
+        for item in unique_by_cluster(news_items):
+            if keyword in item['title'] or item.get('story_id') in keyword_stories:
                 # 캐시에서 요약 확인
                 cache_key = f"summary_{item['url']}"
                 summary = cache.get(cache_key)
                 
                 if not summary:
                     try:
-                        summary = summarize_article(item['url'])
+                        summary = summarize_article(item['url'], priority=priority)
                         cache.set(cache_key, summary, 3600)
                     except Exception as e:
                         logger.error(f"요약 생성 실패: {str(e)}")
@@ -422,57 +583,8 @@ def article_summary(request=None):
             
             # CrewAI 분석 실행 - 중복 분석 제거
             try:
-                # CrewAI 대신 GPT로 종합 분석
-                summaries_text = "\n\n".join([
-                    f"제목: {article['title']}\n"
-                    f"언론사: {article['source']}\n"
-                    f"요약: {article['summary']}"
-                    for article in related_articles
-                ])
-                
-                llm = ChatOpenAI(
-                    model_name="gpt-3.5-turbo-16k",
-                    temperature=0.3,
-                    max_tokens=4000
-                )
-                
-                system_prompt = """
-                다음 세 단계로 분석해주세요:
-
-                1. 보도 관점 분석
-                각 언론사의 보도 프레임을 분석하세요:
-                - 어떤 사실을 전면에 내세우는가?
-                - 어떤 맥락을 강조하는가?
-                - 어떤 표현과 어조를 사용하는가?
-
-                2. 주요 쟁점 분석
-                핵심 쟁점별로 언론사들의 대립되는 시각을 분석하세요:
-                - 쟁점 1: [언론사A]는 [프레임A]로, [언론사B]는 [프레임B]로 해석
-                - 쟁점 2: [언론사C]는 [관점C]를, [언론사D]는 [관점D]를 강조
-
-                3. 종합 분석
-                전체 보도의 지형도를 그려주세요:
-                - 주요 진영과 프레임은 어떻게 형성되어 있는가?
-                - 각 진영의 핵심 주장과 근거는 무엇인가?
-                - 이 보도들이 여론 형성에 미치는 영향은?
-
-                ※ 구체적 사례와 표현을 인용하며 분석할 것
-                """
-                
-                messages = [
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=summaries_text)
-                ]
-                
-                response = llm.generate([messages])
-                result = response.generations[0][0].text
-                parts = result.split('\n\n', 2)
-                
-                analysis_results = {
-                    'classification': parts[0] if len(parts) > 0 else '분류 결과 없음',
-                    'comparison': parts[1] if len(parts) > 1 else '비교 분석 결과 없음',
-                    'summary': parts[2] if len(parts) > 2 else '요약 결과 없음'
-                }
+                # 기사가 많으면 언론사별 map-reduce, 적으면 한 번의 호출로 종합 분석
+                analysis_results = compare_articles_sync(related_articles, keyword, priority)
                 
                 # press_stats에서 직접 가져오는 대신 results에서 가져오기
                 keyword_articles[keyword] = {
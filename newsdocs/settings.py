@@ -63,6 +63,7 @@ TEMPLATES = [
 ]
 
 MIDDLEWARE = [
+    'news.instrumentation.ServerTimingMiddleware',  # 단계별 시간 → Server-Timing 헤더, /metrics
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -101,15 +102,22 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'filters': {
+        # 핫패스 로거는 DEBUG를 켜도 일부만 기록 (WARNING 이상은 항상 기록)
+        'sample_hot_path': {
+            '()': 'news.log_pipeline.SampleFilter',
+            'rate': float(os.getenv('LOG_SAMPLE_RATE', '0.01')),
+        },
+    },
     'handlers': {
         'file': {
-            'level': 'INFO',
+            'level': 'DEBUG',  # 레벨은 로거에서 결정 (단계별 DEBUG 허용)
             'class': 'logging.FileHandler',
             'filename': os.path.join(BASE_DIR, 'logs', 'django.log'),
             'encoding': 'utf-8',
         },
         'console': {
-            'level': 'INFO',
+            'level': 'DEBUG',
             'class': 'logging.StreamHandler',
         },
     },
@@ -134,9 +142,24 @@ LOGGING = {
             'level': 'INFO',
             'propagate': True,
         },
+        # 단계별 레벨 - 'news' 핸들러로 전달됨 (DEBUG로 내리면 제목별 추출 과정 기록)
+        'news.keywords': {
+            'level': os.getenv('LOG_LEVEL_KEYWORDS', 'INFO'),
+            'filters': ['sample_hot_path'],
+        },
+        'news.press': {
+            'level': os.getenv('LOG_LEVEL_PRESS', 'INFO'),
+            'filters': ['sample_hot_path'],
+        },
+        'news.llm': {
+            'level': os.getenv('LOG_LEVEL_LLM', 'INFO'),
+        },
     },
 }
 
+# 로그 핸들러를 QueueListener 스레드로 옮겨 요청 스레드에서 파일 I/O 제거 (news/log_pipeline.py)
+LOG_QUEUE_ENABLED = True
+
 # logs 디렉토리 생성
 if not os.path.exists(os.path.join(BASE_DIR, 'logs')):
     os.makedirs(os.path.join(BASE_DIR, 'logs'))
@@ -170,6 +193,15 @@ CACHES = {
 CACHE_BACKUP_DIR = os.path.join(BASE_DIR, 'cache_backup')
 if not os.path.exists(CACHE_BACKUP_DIR):
     os.makedirs(CACHE_BACKUP_DIR)
+SNAPSHOT_ARCHIVE_KEEP = 288  # 보관할 크롤링 스냅샷 수 (crawling/snapshot_archive.py, 10분 주기로 약 2일)
+
+# 기사 이미지 썸네일 (news/thumbnails.py) - 원본 해시 이름으로 저장, /news/thumbs/에서 immutable 캐시로 서빙
+THUMBNAIL_DIR = os.path.join(CACHE_BACKUP_DIR, 'thumbnails')
+THUMBNAIL_SIZE = (336, 224)  # 카드 이미지 영역 (가로, 세로)
+THUMBNAIL_WIDTHS = (336, 672)  # 1x, 2x
+THUMBNAIL_WORKERS = 8  # 이미지 동시 다운로드 수
+THUMBNAIL_FETCH_TIMEOUT = 5  # 이미지 다운로드 타임아웃 (초)
+THUMBNAIL_MAX_BYTES = 10 * 1024 * 1024  # 이보다 큰 원본은 썸네일을 만들지 않음
 
 # 연결 재시도 설정
 MAX_RETRIES = 3
@@ -178,3 +210,83 @@ RETRY_BACKOFF = 1  # 초 단위
 # 시간 설정
 TIME_ZONE = 'Asia/Seoul'
 USE_TZ = True
+
+# 새 크롤링 버전 확인 설정 (news/live.py)
+LIVE_POLL_SECONDS = 30  # 브라우저가 버전을 조건부 요청으로 확인하는 주기 (초)
+
+# 스토리 클러스터링(faiss) 설정
+STORY_RETENTION_HOURS = 48  # 인덱스 보관 기간
+STORY_FETCH_BODIES = True  # 1위 기사 본문 앞부분을 벡터에 포함
+
+# LLM 프롬프트 토큰 예산 (news/prompting.py DEFAULT_BUDGETS 덮어쓰기)
+LLM_PROMPT_BUDGETS = {
+    'comparison': 9000,
+    'comparison_map': 2500,
+    'keyword_titles': 400,
+    'keyword_press_stats': 500,
+}
+
+# 언론사 비교 분석 map-reduce 설정
+COMPARISON_MAPREDUCE_MIN_ARTICLES = 8  # 이 이상이면 언론사별 map → reduce
+COMPARISON_MAP_CONCURRENCY = 4  # 동시에 실행할 map 호출 수
+
+# LLM 요청 스케줄러 설정 (news/llm.py)
+LLM_MAX_CONCURRENCY = 4  # 동시에 실행할 LLM 요청 수
+LLM_BACKGROUND_MAX_CONCURRENCY = 2  # 그중 백그라운드(크론) 요청이 쓸 수 있는 최대 자리
+LLM_TIMEOUT = 60  # 요청별 타임아웃 (초)
+LLM_MAX_ATTEMPTS = 4  # 레이트 리밋/타임아웃/5xx 재시도 포함 최대 시도 횟수
+LLM_RETRY_MAX_WAIT = 20  # 지수 백오프 최대 대기 (초)
+LLM_LENGTH_RETRY_MAX_TOKENS = 2000  # finish_reason == 'length'일 때 재요청 max_tokens
+LLM_RATE_LIMITS = {
+    'gpt-3.5-turbo': {'rpm': 500, 'tpm': 160000},
+    'gpt-3.5-turbo-16k': {'rpm': 500, 'tpm': 160000},
+}
+LLM_BASE_URL = os.getenv('LLM_BASE_URL') or None  # 로컬 가짜 서버 등 OpenAI 호환 엔드포인트 (python manage.py fake_openai)
+
+# Prometheus 지표 (/metrics, news/instrumentation.py) - 켠 경우에만 URL 등록
+# 허용 IP에서 오거나 Authorization: Bearer <METRICS_TOKEN> 헤더가 맞아야 응답 (아니면 404)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+METRICS_TOKEN = os.getenv('METRICS_TOKEN') or None
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1'] + [ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+
+# OpenTelemetry 트레이싱 (news/tracing.py) - exporter가 None이면 스팬을 내보내지 않음
+TRACING = {
+    'exporter': os.getenv('TRACING_EXPORTER') or None,  # 'file' | 'otlp' | 'console'
+    'file_path': os.path.join(BASE_DIR, 'logs', 'traces.jsonl'),
+    'otlp_endpoint': os.getenv('OTEL_EXPORTER_OTLP_TRACES_ENDPOINT', 'http://localhost:4318/v1/traces'),
+    'service_name': 'newsdocs',
+    'sample_ratio': 1.0,
+}
+
+# 최근 시간 창 키워드 순위 (news/keyword_windows.py) - 창 이름: 길이(초)
+KEYWORD_WINDOWS = {'1h': 60 * 60, '6h': 6 * 60 * 60, '24h': 24 * 60 * 60}
+KEYWORD_WINDOW_BUCKET_SECONDS = 10 * 60  # 시간 버킷 크기 (창 만료 단위)
+
+# 분산 크롤링 (news/crawl_shards.py) - 켜면 웹 프로세스는 코디네이터가 공개한 스냅샷만 읽음
+CRAWL_SHARDING = os.getenv('CRAWL_SHARDING', '').lower() in ('1', 'true', 'yes')
+CRAWL_LEASE_SECONDS = 180  # 워커의 언론사 작업 임대 시간 (넘기면 다른 워커가 가져감)
+CRAWL_DEADLINE_SECONDS = 600  # 이 시간이 지나면 완료된 언론사만으로 공개
+CRAWL_MAX_ATTEMPTS = 3  # 언론사 작업 최대 시도 횟수
+CRAWL_RUN_KEEP = 48  # 보관할 공개 크롤링 수
+# 언론사별 적응형 크롤링 주기 (news/crawl_schedule.py) - 랭킹 변동이 잦은 언론사를 더 자주 크롤링
+CRAWL_ADAPTIVE = True
+CRAWL_MIN_INTERVAL_SECONDS = 10 * 60
+CRAWL_MAX_INTERVAL_SECONDS = 60 * 60  # 기존 고정 주기 (CACHE_TIMEOUT)
+CRAWL_INITIAL_INTERVAL_SECONDS = 10 * 60  # 변동률을 모르는 첫 크롤링 뒤 주기
+CRAWL_TARGET_CHANGES = 3  # 크롤링 사이에 바뀔 것으로 기대하는 순위 수 (10위 중)
+CRAWL_CHURN_SMOOTHING = 0.5  # 변동률 지수 평균 가중치 (최근 관측)
+CRAWL_DUE_SLACK_SECONDS = 60  # 이 안에 돌아올 언론사는 함께 크롤링
+# 조건부 요청(ETag/Last-Modified) + 랭킹 목록 해시로 바뀌지 않은 언론사는 파싱 생략 (crawling/page_fetcher.py)
+CRAWL_CONDITIONAL_FETCH = True
+CRAWL_FETCH_TIMEOUT = 5  # requests로 받는 랭킹/기사 페이지 타임아웃 (초, 실패하면 Selenium)
+CRAWL_HTTP_POOL_SIZE = 16  # 공용 requests 세션의 호스트별 연결 수 (crawling/page_fetcher.py)
+# 기사 본문 저장소 (crawling/article_store.py) - 압축 크기 합계 한도와 재검증 주기
+ARTICLE_STORE_MAX_BYTES = int(os.getenv('ARTICLE_STORE_MAX_BYTES', 64 * 1024 * 1024))
+ARTICLE_STORE_REVALIDATE_SECONDS = 3600
+# 크롤링 언론사 코드 (None이면 기본 10곳, crawling/press_registry.py의 EXTRA_PRESSES에서 추가 가능)
+NEWS_PRESS_CODES = os.getenv('NEWS_PRESS_CODES', '').split(',') if os.getenv('NEWS_PRESS_CODES') else None
+
+# import 시간 예산 (python manage.py profile_imports) - django.setup() 이후 대상 모듈 import ms
+IMPORT_TIME_BUDGETS_MS = {
+    'news.urls': 300,
+}
@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.urls import path, include
 from django.shortcuts import redirect
+from news.instrumentation import metrics
 
 def redirect_to_news(request):
     return redirect('news:news_list')
@@ -7,4 +9,7 @@ def redirect_to_news(request):
 urlpatterns = [
     path('', redirect_to_news, name='home'),  # 루트 URL을 news로 리다이렉트
     path('news/', include('news.urls')),
-] 
\ No newline at end of file
+]
+
+if getattr(settings, 'METRICS_ENABLED', False):
+    urlpatterns.append(path('metrics', metrics, name='metrics'))  # Prometheus 지표 (허용 IP/토큰만) 
\ No newline at end of file
@@ -1,16 +1,60 @@
+// 새 크롤링 버전이 나왔는지 짧은 조건부 요청(ETag/304)으로 주기적으로 확인하고,
+// 바뀌었을 때만 페이지를 다시 불러온다 (새 언론사/이미지/키워드 영역까지 반영).
+// fetch를 지원하지 않는 브라우저에서만 기존 카운트다운 새로고침을 사용한다.
+function startLiveUpdates(options) {
+    options = options || {};
+    var versionUrl = options.versionUrl || '/news/events/';
+    var pollSeconds = options.pollSeconds || 30;
+    var currentVersion = options.version || null;
+    var etag = currentVersion ? '"' + currentVersion + '"' : null;
+    var isReloading = false;
+
+    if (!window.fetch) {
+        startCountdown();
+        return;
+    }
+
+    function checkVersion() {
+        if (isReloading || document.hidden) return;
+        var headers = etag ? {'If-None-Match': etag} : {};
+        fetch(versionUrl, {headers: headers, cache: 'no-store'})
+            .then(function(response) {
+                // 304: 바뀐 내용 없음
+                return response.status === 304 ? null : response.json();
+            })
+            .then(function(data) {
+                if (!data || !data.version) return;
+                if (!currentVersion) {
+                    currentVersion = data.version;
+                    etag = '"' + data.version + '"';
+                } else if (data.version !== currentVersion) {
+                    isReloading = true;
+                    location.reload();
+                }
+            })
+            .catch(function(error) {
+                console.error('버전 확인 실패:', error);
+            });
+    }
+
+    setInterval(checkVersion, pollSeconds * 1000);
+    document.addEventListener('visibilitychange', checkVersion);
+}
+
 function startCountdown() {
     var timeLeft = 900;
     var isReloading = false;
-    
+
     function updateTimer() {
         var min = Math.floor(timeLeft / 60);
         var sec = timeLeft % 60;
-        
+
         if (min < 10) min = "0" + min;
         if (sec < 10) sec = "0" + sec;
-        
-        document.getElementById("countdown").textContent = min + ":" + sec;
-        
+
+        var countdown = document.getElementById("countdown");
+        if (countdown) countdown.textContent = min + ":" + sec;
+
         if (timeLeft <= 0 && !isReloading) {
             isReloading = true;
             setTimeout(function() {
@@ -20,7 +64,7 @@ function startCountdown() {
             timeLeft--;
         }
     }
-    
+
     updateTimer();
     setInterval(updateTimer, 1000);
-} 
\ No newline at end of file
+}